@@ -0,0 +1,453 @@
+"""Batch scanner for artifact definitions."""
+
+import concurrent.futures
+import concurrent.futures.process
+import json
+import logging
+import os
+import sqlite3
+
+from dfvfs.lib import errors as dfvfs_errors
+
+from artifactsrc import definitions_history
+from artifactsrc import definitions_planner
+from artifactsrc import resource_metadata_cache
+from artifactsrc import volume_scanner
+
+# Per worker process state, which is initialized once per worker so that the
+# artifact definitions registry, data type fabric, checks definitions and
+# find specifications are shared by all images processed by the worker.
+_WORKER_STATE = {}
+
+
+def _InitializeWorker(
+    artifacts_registry,
+    definition_names,
+    volume_scanner_options,
+    resource_metadata_cache_path=None,
+    sidecar_cache_path=None,
+    history_path=None,
+    triage=False,
+    cross_check_version=False,
+):
+    """Initializes a batch worker.
+
+    Args:
+      artifacts_registry (artifacts.ArtifactDefinitionsRegistry): artifact
+          definitions registry.
+      definition_names (list[str]): names of the artifact definitions to check,
+          in the order they should be checked.
+      volume_scanner_options (dfvfs.VolumeScannerOptions): volume scanner options.
+      resource_metadata_cache_path (Optional[str]): path of the database file of
+          the persistent resource file metadata cache.
+      sidecar_cache_path (Optional[str]): path of the directory of the per
+          storage media image sidecar cache.
+      history_path (Optional[str]): path of the database file of the history of
+          check results, which is opened read-only by the worker.
+      triage (Optional[bool]): True if artifact definitions that never matched
+          before, on the same operating system version, should be skipped.
+      cross_check_version (Optional[bool]): True if the Windows version read
+          from the Windows Registry should be checked against the version of
+          the kernel executable file.
+    """
+    history = None
+    if history_path:
+        history = definitions_history.ArtifactDefinitionsHistory()
+        history.Open(history_path, read_only=True)
+
+    resource_metadata_cache_object = None
+    if resource_metadata_cache_path:
+        resource_metadata_cache_object = resource_metadata_cache.ResourceMetadataCache()
+        resource_metadata_cache_object.Open(resource_metadata_cache_path)
+
+    _WORKER_STATE["artifacts_registry"] = artifacts_registry
+    _WORKER_STATE["cross_check_version"] = cross_check_version
+    _WORKER_STATE["definition_names"] = definition_names
+    _WORKER_STATE["history"] = history
+    _WORKER_STATE["resource_metadata_cache"] = resource_metadata_cache_object
+    _WORKER_STATE["scanner"] = volume_scanner.ArtifactDefinitionsVolumeScanner(
+        artifacts_registry,
+        resource_metadata_cache_object=resource_metadata_cache_object,
+        sidecar_cache_path=sidecar_cache_path,
+    )
+    _WORKER_STATE["triage"] = triage
+    _WORKER_STATE["volume_scanner_options"] = volume_scanner_options
+
+
+def _GetDefinitionNames(operating_system_version):
+    """Retrieves the names of the artifact definitions to check on an image.
+
+    Args:
+      operating_system_version (str): operating system version of the image.
+
+    Returns:
+      list[str]: names of the artifact definitions to check, in the order they
+          should be checked.
+    """
+    definition_names = _WORKER_STATE["definition_names"]
+    history = _WORKER_STATE["history"]
+    if not history or not operating_system_version:
+        return definition_names
+
+    artifacts_registry = _WORKER_STATE["artifacts_registry"]
+    planned_definitions = [
+        definitions_planner.PlannedDefinition(
+            artifacts_registry.GetDefinitionByName(name)
+        )
+        for name in definition_names
+    ]
+
+    try:
+        planned_definitions = history.PrioritizeDefinitions(
+            planned_definitions,
+            operating_system_version,
+            skip_unmatched=_WORKER_STATE["triage"],
+        )
+    except sqlite3.Error as exception:
+        logging.warning(
+            f"Unable to read history, artifact definitions are not prioritized "
+            f"with error: {exception!s}"
+        )
+        return definition_names
+
+    return [
+        planned_definition.artifact_definition.name
+        for planned_definition in planned_definitions
+    ]
+
+
+def _ScanImage(source_path):
+    """Checks artifact definitions on a storage media image.
+
+    Args:
+      source_path (str): path of the storage media image.
+
+    Returns:
+      dict[str, object]: check results of the storage media image.
+    """
+    artifacts_registry = _WORKER_STATE["artifacts_registry"]
+    scanner = _WORKER_STATE["scanner"]
+
+    image_results = {
+        "artifact_definitions": {},
+        "checked_definitions": {},
+        "error": None,
+        "operating_system_version": None,
+        "source": source_path,
+        "windows_product_name": None,
+    }
+
+    try:
+        if not scanner.ScanForOperatingSystemVolumes(
+            source_path, options=_WORKER_STATE["volume_scanner_options"]
+        ):
+            image_results["error"] = (
+                f"Unable to retrieve an operating system volume from: "
+                f"{source_path:s}."
+            )
+            return image_results
+
+        operating_system_version = scanner.GetWindowsVersion(
+            cross_check=_WORKER_STATE["cross_check_version"]
+        )
+        image_results["operating_system_version"] = operating_system_version
+        image_results["windows_product_name"] = scanner.GetWindowsProductName()
+
+        for name in _GetDefinitionNames(operating_system_version):
+            artifact_definition = artifacts_registry.GetDefinitionByName(name)
+            check_result = scanner.CheckArtifactDefinition(artifact_definition)
+            image_results["checked_definitions"][artifact_definition.name] = (
+                check_result.number_of_file_entries
+                + check_result.number_of_registry_keys
+            )
+            if (
+                check_result.number_of_file_entries
+                or check_result.number_of_registry_keys
+            ):
+                image_results["artifact_definitions"][artifact_definition.name] = {
+                    "data_formats": sorted(check_result.data_formats),
+                    "number_of_file_entries": check_result.number_of_file_entries,
+                    "number_of_file_entries_per_volume": (
+                        check_result.number_of_file_entries_per_volume
+                    ),
+                    "number_of_registry_keys": check_result.number_of_registry_keys,
+                    "number_of_registry_values": (
+                        check_result.number_of_registry_values
+                    ),
+                }
+
+    except (IOError, RuntimeError, dfvfs_errors.Error) as exception:
+        image_results["error"] = f"{exception!s}"
+
+    # An unexpected error on a single image should not stop the worker from
+    # checking the remaining images.
+    except Exception as exception:  # pylint: disable=broad-exception-caught
+        logging.exception(f"Unable to check: {source_path:s}")
+        image_results["error"] = (
+            f"Unexpected error: {type(exception).__name__:s}: {exception!s}"
+        )
+
+    # Release the file systems, Windows Registry files and threads of the image,
+    # since the scanner is reused for the next image processed by the worker.
+    scanner.Close()
+
+    # The worker processes are not notified when they are stopped, hence the
+    # cached resource file metadata is written after every image.
+    if _WORKER_STATE["resource_metadata_cache"]:
+        try:
+            _WORKER_STATE["resource_metadata_cache"].Flush()
+        except (IOError, sqlite3.Error) as exception:
+            logging.warning(
+                f"Unable to write resource file metadata cache with error: "
+                f"{exception!s}"
+            )
+
+    return image_results
+
+
+class BatchScanner:
+    """Batch scanner for artifact definitions.
+
+    The batch scanner checks artifact definitions on multiple storage media
+    images using a pool of worker processes. Every worker loads the shared
+    state only once and processes multiple images.
+    """
+
+    _SUMMARY_FILENAME = "summary.json"
+
+    def __init__(
+        self,
+        artifacts_registry,
+        definition_names,
+        volume_scanner_options,
+        resource_metadata_cache_path=None,
+        sidecar_cache_path=None,
+        history_path=None,
+        triage=False,
+        cross_check_version=False,
+    ):
+        """Initializes a batch scanner.
+
+        Args:
+          artifacts_registry (artifacts.ArtifactDefinitionsRegistry): artifact
+              definitions registry.
+          definition_names (list[str]): names of the artifact definitions to
+              check, in the order they should be checked.
+          volume_scanner_options (dfvfs.VolumeScannerOptions): volume scanner
+              options. Since storage media images are processed without user
+              interaction the options should select the partitions, snapshots
+              and volumes to process.
+          resource_metadata_cache_path (Optional[str]): path of the database file
+              of the persistent resource file metadata cache, which is shared by
+              the worker processes, where None represents no cache.
+          sidecar_cache_path (Optional[str]): path of the directory of the per
+              storage media image sidecar cache, where None represents no
+              sidecar cache.
+          history_path (Optional[str]): path of the database file of the history
+              of check results, where None represents no history. The worker
+              processes read the history to prioritize the artifact definitions
+              and the check results are added by the batch scanner as the
+              results of the images are returned.
+          triage (Optional[bool]): True if artifact definitions that never
+              matched before, on the same operating system version, should be
+              skipped. Requires a history.
+          cross_check_version (Optional[bool]): True if the Windows version read
+              from the Windows Registry should be checked against the version
+              of the kernel executable file.
+        """
+        super().__init__()
+        self._artifacts_registry = artifacts_registry
+        self._cross_check_version = cross_check_version
+        self._definition_names = definition_names
+        self._history_path = history_path
+        self._resource_metadata_cache_path = resource_metadata_cache_path
+        self._sidecar_cache_path = sidecar_cache_path
+        self._triage = triage
+        self._volume_scanner_options = volume_scanner_options
+
+    def _AddImageResults(self, summary, output_path, index, image_results):
+        """Writes the results file of a storage media image and adds it to the summary.
+
+        Args:
+          summary (dict[str, object]): summary of the check results.
+          output_path (str): path of the output directory.
+          index (int): index of the storage media image in the manifest.
+          image_results (dict[str, object]): check results of the storage media
+              image.
+        """
+        source_path = image_results["source"]
+        results_filename = self._GetResultsFilename(index, source_path)
+
+        self._WriteJSONFile(os.path.join(output_path, results_filename), image_results)
+
+        if image_results["error"]:
+            logging.warning(
+                f"Unable to check: {source_path:s} with error: "
+                f"{image_results['error']:s}"
+            )
+            summary["number_of_failed_images"] += 1
+
+        for name in image_results["artifact_definitions"]:
+            summary["artifact_definitions"].setdefault(name, 0)
+            summary["artifact_definitions"][name] += 1
+
+        summary["images"].append(
+            {
+                "error": image_results["error"],
+                "number_of_artifact_definitions": len(
+                    image_results["artifact_definitions"]
+                ),
+                "operating_system_version": image_results["operating_system_version"],
+                "results_file": results_filename,
+                "source": source_path,
+                "windows_product_name": image_results["windows_product_name"],
+            }
+        )
+
+    def _GetResultsFilename(self, index, source_path):
+        """Retrieves the name of the results file of a storage media image.
+
+        Args:
+          index (int): index of the storage media image in the manifest.
+          source_path (str): path of the storage media image.
+
+        Returns:
+          str: name of the results file.
+        """
+        basename = os.path.basename(source_path) or "image"
+        return f"{index:04d}_{basename:s}.json"
+
+    def _WriteJSONFile(self, path, values):
+        """Writes values to a JSON file.
+
+        Args:
+          path (str): path of the JSON file.
+          values (dict[str, object]): values to write.
+        """
+        with open(path, "w", encoding="utf-8") as file_object:
+            json.dump(values, file_object, indent=2, sort_keys=True)
+            file_object.write("\n")
+
+    def ReadManifestFile(self, path):
+        """Reads a manifest file.
+
+        The manifest file contains the path of a storage media image per line.
+        Empty lines and lines starting with "#" are ignored.
+
+        Args:
+          path (str): path of the manifest file.
+
+        Returns:
+          list[str]: paths of the storage media images.
+        """
+        source_paths = []
+        with open(path, "r", encoding="utf-8") as file_object:
+            for line in file_object:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    source_paths.append(line)
+
+        return source_paths
+
+    def ScanImages(self, source_paths, output_path, number_of_workers=None):
+        """Checks artifact definitions on storage media images.
+
+        Writes a results file per storage media image and a summary file to the
+        output directory. If the pool of worker processes breaks, for example
+        because a worker process was killed, the images of which no results were
+        returned are marked as failed and the summary file is still written.
+
+        Args:
+          source_paths (list[str]): paths of the storage media images.
+          output_path (str): path of the output directory.
+          number_of_workers (Optional[int]): number of worker processes, where
+              None represents the number of CPUs and 1 represents processing in
+              the current process.
+
+        Returns:
+          dict[str, object]: summary of the check results.
+
+        Raises:
+          BrokenProcessPool: if the pool of worker processes is broken.
+        """
+        os.makedirs(output_path, exist_ok=True)
+
+        initialize_arguments = (
+            self._artifacts_registry,
+            self._definition_names,
+            self._volume_scanner_options,
+            self._resource_metadata_cache_path,
+            self._sidecar_cache_path,
+            self._history_path,
+            self._triage,
+            self._cross_check_version,
+        )
+
+        # The history is opened, and created if needed, before the worker
+        # processes open it read-only.
+        history = None
+        if self._history_path:
+            history = definitions_history.ArtifactDefinitionsHistory()
+            history.Open(self._history_path)
+
+        if number_of_workers == 1:
+            _InitializeWorker(*initialize_arguments)
+            results_generator = map(_ScanImage, source_paths)
+            executor = None
+        else:
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=number_of_workers,
+                initializer=_InitializeWorker,
+                initargs=initialize_arguments,
+            )
+            results_generator = executor.map(_ScanImage, source_paths)
+
+        summary = {
+            "artifact_definitions": {},
+            "images": [],
+            "number_of_failed_images": 0,
+            "number_of_images": len(source_paths),
+        }
+
+        try:
+            for index, image_results in enumerate(results_generator):
+                self._AddImageResults(summary, output_path, index, image_results)
+
+                if (
+                    history
+                    and image_results["operating_system_version"]
+                    and not image_results["error"]
+                ):
+                    history.AddResults(
+                        image_results["operating_system_version"],
+                        image_results["checked_definitions"],
+                    )
+
+        except concurrent.futures.process.BrokenProcessPool as exception:
+            # The results of the images that were not returned by the worker
+            # processes are lost, hence these images are marked as failed.
+            for index in range(len(summary["images"]), len(source_paths)):
+                image_results = {
+                    "artifact_definitions": {},
+                    "checked_definitions": {},
+                    "error": f"Worker process pool is broken: {exception!s}",
+                    "operating_system_version": None,
+                    "source": source_paths[index],
+                    "windows_product_name": None,
+                }
+                self._AddImageResults(summary, output_path, index, image_results)
+
+            raise
+
+        finally:
+            if executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+            if history:
+                history.Close()
+
+            self._WriteJSONFile(
+                os.path.join(output_path, self._SUMMARY_FILENAME), summary
+            )
+
+        return summary
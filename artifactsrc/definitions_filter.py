@@ -0,0 +1,145 @@
+"""Artifact definitions filter."""
+
+import fnmatch
+import logging
+
+from artifacts import definitions as artifacts_definitions
+
+
+class ArtifactDefinitionsFilter:
+    """Artifact definitions filter.
+
+    The filter selects artifact definitions by name glob. Artifact definitions
+    that are referenced by a selected artifact group are selected as well,
+    recursively, so that the selection of a group results in the full set of
+    its member definitions.
+    """
+
+    def __init__(self, artifacts_registry, definitions=None, exclude_definitions=None):
+        """Initializes an artifact definitions filter.
+
+        Args:
+          artifacts_registry (artifacts.ArtifactDefinitionsRegistry): artifact
+              definitions registry.
+          definitions (Optional[list[str]]): name globs of the artifact
+              definitions to include, where None represents all artifact
+              definitions.
+          exclude_definitions (Optional[list[str]]): name globs of the artifact
+              definitions to exclude.
+        """
+        super().__init__()
+        self._artifacts_registry = artifacts_registry
+        self._exclude_patterns = [
+            pattern.lower() for pattern in exclude_definitions or []
+        ]
+        self._include_patterns = [pattern.lower() for pattern in definitions or []]
+
+    def _GetDefinitionByName(self, name):
+        """Retrieves an artifact definition by name or alias.
+
+        Args:
+          name (str): name or alias of the artifact definition.
+
+        Returns:
+          artifacts.ArtifactDefinition: artifact definition or None if not
+              available.
+        """
+        artifact_definition = self._artifacts_registry.GetDefinitionByName(name)
+        if not artifact_definition:
+            artifact_definition = self._artifacts_registry.GetDefinitionByAlias(name)
+
+        return artifact_definition
+
+    def _GetSelectedNames(self):
+        """Retrieves the names of the selected artifact definitions.
+
+        Returns:
+          set[str]: lower case names of the selected artifact definitions.
+        """
+        selected_names = set()
+
+        pending_definitions = [
+            artifact_definition
+            for artifact_definition in self._artifacts_registry.GetDefinitions()
+            if self._MatchesPatterns(artifact_definition.name, self._include_patterns)
+        ]
+        while pending_definitions:
+            artifact_definition = pending_definitions.pop()
+
+            lookup_name = artifact_definition.name.lower()
+            if lookup_name in selected_names or self._MatchesPatterns(
+                lookup_name, self._exclude_patterns
+            ):
+                continue
+
+            selected_names.add(lookup_name)
+
+            for source in artifact_definition.sources:
+                if source.type_indicator != (
+                    artifacts_definitions.TYPE_INDICATOR_ARTIFACT_GROUP
+                ):
+                    continue
+
+                for name in source.names:
+                    member_definition = self._GetDefinitionByName(name)
+                    if not member_definition:
+                        logging.warning(
+                            f"Undefined artifact definition: {name:s} referenced "
+                            f"by: {artifact_definition.name:s}"
+                        )
+                        continue
+
+                    pending_definitions.append(member_definition)
+
+        return selected_names
+
+    def _MatchesPatterns(self, name, patterns):
+        """Determines if a name matches one of the name globs.
+
+        Args:
+          name (str): name of the artifact definition.
+          patterns (list[str]): lower case name globs.
+
+        Returns:
+          bool: True if the name matches one of the name globs.
+        """
+        lookup_name = name.lower()
+        return any(fnmatch.fnmatchcase(lookup_name, pattern) for pattern in patterns)
+
+    def GetDefinitions(self):
+        """Retrieves the selected artifact definitions.
+
+        Yields:
+          artifacts.ArtifactDefinition: artifact definition, in the order defined
+              by the artifact definitions registry.
+        """
+        if not self._include_patterns:
+            for artifact_definition in self._artifacts_registry.GetDefinitions():
+                if not self._MatchesPatterns(
+                    artifact_definition.name, self._exclude_patterns
+                ):
+                    yield artifact_definition
+
+            return
+
+        selected_names = self._GetSelectedNames()
+        for artifact_definition in self._artifacts_registry.GetDefinitions():
+            if artifact_definition.name.lower() in selected_names:
+                yield artifact_definition
+
+    def IsGroupOnly(self, artifact_definition):
+        """Determines if an artifact definition only contains artifact groups.
+
+        Args:
+          artifact_definition (artifacts.ArtifactDefinition): artifact definition.
+
+        Returns:
+          bool: True if all sources of the artifact definition are artifact groups.
+        """
+        for source in artifact_definition.sources:
+            if source.type_indicator != (
+                artifacts_definitions.TYPE_INDICATOR_ARTIFACT_GROUP
+            ):
+                return False
+
+        return True
@@ -0,0 +1,204 @@
+"""History of artifact definition check results."""
+
+import os
+import pathlib
+import sqlite3
+
+
+class ArtifactDefinitionsHistory:
+    """History of artifact definition check results.
+
+    The history is stored in a SQLite database file and contains, per operating
+    system version, the number of times an artifact definition was checked and
+    the number of times it matched one or more file entries.
+
+    The operating system version is stored without its update build revision,
+    such as "10.0.19045" for "10.0.19045.3636", so that the results of images
+    with different monthly updates of the same build are combined.
+    """
+
+    _MAXIMUM_NUMBER_OF_VERSION_SEGMENTS = 3
+
+    _CREATE_TABLE_QUERY = (
+        "CREATE TABLE IF NOT EXISTS definition_results ("
+        "operating_system_version TEXT NOT NULL, "
+        "name TEXT NOT NULL, "
+        "number_of_checks INTEGER NOT NULL DEFAULT 0, "
+        "number_of_hits INTEGER NOT NULL DEFAULT 0, "
+        "PRIMARY KEY (operating_system_version, name))"
+    )
+
+    _INSERT_RESULT_QUERY = (
+        "INSERT INTO definition_results "
+        "(operating_system_version, name, number_of_checks, number_of_hits) "
+        "VALUES (?, ?, 1, ?) "
+        "ON CONFLICT (operating_system_version, name) DO UPDATE SET "
+        "number_of_checks = number_of_checks + 1, "
+        "number_of_hits = number_of_hits + excluded.number_of_hits"
+    )
+
+    _SELECT_RESULTS_QUERY = (
+        "SELECT name, number_of_checks, number_of_hits FROM definition_results "
+        "WHERE operating_system_version = ?"
+    )
+
+    def __init__(self):
+        """Initializes a history of artifact definition check results."""
+        super().__init__()
+        self._connection = None
+        self._read_only = False
+
+    def _GetVersionKey(self, operating_system_version):
+        """Retrieves the key of an operating system version in the history.
+
+        Args:
+          operating_system_version (str): operating system version, such as
+              "10.0.19045.3636".
+
+        Returns:
+          str: major and minor version and build number of the operating system
+              version, such as "10.0.19045".
+        """
+        version_segments = operating_system_version.split(".")
+        return ".".join(version_segments[: self._MAXIMUM_NUMBER_OF_VERSION_SEGMENTS])
+
+    def _GetResults(self, operating_system_version):
+        """Retrieves the check results of an operating system version.
+
+        Args:
+          operating_system_version (str): operating system version.
+
+        Returns:
+          dict[str, tuple[int, int]]: number of checks and number of hits per
+              lower case artifact definition name.
+        """
+        version_key = self._GetVersionKey(operating_system_version)
+        cursor = self._connection.execute(self._SELECT_RESULTS_QUERY, (version_key,))
+        return {
+            name: (number_of_checks, number_of_hits)
+            for name, number_of_checks, number_of_hits in cursor
+        }
+
+    def AddResults(self, operating_system_version, number_of_file_entries):
+        """Adds check results.
+
+        Args:
+          operating_system_version (str): operating system version.
+          number_of_file_entries (dict[str, int]): number of file entries found
+              per artifact definition name.
+
+        Raises:
+          IOError: if not open or opened read-only.
+          OSError: if not open or opened read-only.
+        """
+        if not self._connection:
+            raise IOError("Not opened.")
+
+        if self._read_only:
+            raise IOError("Opened read-only.")
+
+        version_key = self._GetVersionKey(operating_system_version)
+
+        with self._connection:
+            self._connection.executemany(
+                self._INSERT_RESULT_QUERY,
+                [
+                    (version_key, name.lower(), int(number_of_entries > 0))
+                    for name, number_of_entries in number_of_file_entries.items()
+                ],
+            )
+
+    def Close(self):
+        """Closes the history.
+
+        Raises:
+          IOError: if not open.
+          OSError: if not open.
+        """
+        if not self._connection:
+            raise IOError("Not opened.")
+
+        self._connection.close()
+        self._connection = None
+        self._read_only = False
+
+    def Open(self, path, read_only=False):
+        """Opens the history.
+
+        The history database file is created if it does not exist, unless the
+        history is opened read-only.
+
+        Args:
+          path (str): path of the history database file.
+          read_only (Optional[bool]): True if the history should be opened
+              read-only, such as by a batch worker process that only prioritizes
+              artifact definitions while the results are added by another
+              process.
+
+        Raises:
+          IOError: if already open or the history cannot be opened read-only.
+          OSError: if already open or the history cannot be opened read-only.
+        """
+        if self._connection:
+            raise IOError("Already open.")
+
+        if read_only:
+            if not os.path.isfile(path):
+                raise IOError(f"No such history database file: {path:s}")
+
+            self._connection = sqlite3.connect(
+                f"{pathlib.Path(os.path.abspath(path)).as_uri():s}?mode=ro", uri=True
+            )
+
+        else:
+            self._connection = sqlite3.connect(path)
+            with self._connection:
+                self._connection.execute(self._CREATE_TABLE_QUERY)
+
+        self._read_only = read_only
+
+    def PrioritizeDefinitions(
+        self, planned_definitions, operating_system_version, skip_unmatched=False
+    ):
+        """Prioritizes planned artifact definitions on their historical hit rate.
+
+        The hit rate is estimated as (number of hits + 1) / (number of checks + 2),
+        hence artifact definitions without history have a hit rate of 0.5.
+        Artifact definitions with the same hit rate retain their planned order.
+
+        Args:
+          planned_definitions (list[PlannedDefinition]): planned artifact
+              definitions.
+          operating_system_version (str): operating system version.
+          skip_unmatched (Optional[bool]): True if artifact definitions that were
+              checked before but never matched should be skipped.
+
+        Returns:
+          list[PlannedDefinition]: prioritized planned artifact definitions.
+
+        Raises:
+          IOError: if not open.
+          OSError: if not open.
+        """
+        if not self._connection:
+            raise IOError("Not opened.")
+
+        results = self._GetResults(operating_system_version)
+
+        hit_rates = {}
+        prioritized_definitions = []
+        for planned_definition in planned_definitions:
+            name = planned_definition.artifact_definition.name.lower()
+            number_of_checks, number_of_hits = results.get(name, (0, 0))
+            if skip_unmatched and number_of_checks and not number_of_hits:
+                continue
+
+            hit_rates[name] = (number_of_hits + 1) / (number_of_checks + 2)
+            prioritized_definitions.append(planned_definition)
+
+        return sorted(
+            prioritized_definitions,
+            key=lambda planned_definition: -hit_rates[
+                planned_definition.artifact_definition.name.lower()
+            ],
+        )
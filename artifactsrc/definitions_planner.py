@@ -0,0 +1,231 @@
+"""Artifact definitions planner."""
+
+from artifacts import definitions as artifacts_definitions
+
+
+class PlannedDefinition:
+    """Planned artifact definition.
+
+    Attributes:
+      artifact_definition (artifacts.ArtifactDefinition): artifact definition.
+      estimated_cost (int): estimated traversal cost, in number of file entries
+          visited.
+      locality_key (tuple[str, tuple[str]]): path segment separator and lower
+          case literal path prefix segments shared by the paths of the artifact
+          definition.
+      number_of_literal_segments (int): number of literal path segments.
+      number_of_segments (int): number of path segments.
+    """
+
+    def __init__(self, artifact_definition):
+        """Initializes a planned artifact definition.
+
+        Args:
+          artifact_definition (artifacts.ArtifactDefinition): artifact definition.
+        """
+        super().__init__()
+        self.artifact_definition = artifact_definition
+        self.estimated_cost = 0
+        self.locality_key = ("", ())
+        self.number_of_literal_segments = 0
+        self.number_of_segments = 0
+
+
+class ArtifactDefinitionsPlanner:
+    """Artifact definitions planner.
+
+    The planner orders artifact definitions so that definitions with paths that
+    share a literal path prefix are checked consecutively, which allows the
+    searches to reuse the warm dfVFS resolver and directory caches.
+    """
+
+    _FILE_SOURCE_TYPES = frozenset(
+        [
+            artifacts_definitions.TYPE_INDICATOR_DIRECTORY,
+            artifacts_definitions.TYPE_INDICATOR_FILE,
+            artifacts_definitions.TYPE_INDICATOR_PATH,
+        ]
+    )
+
+    # Default and maximum recursion depth of a globstar "**", which corresponds
+    # with the globstar expansion of the artifact definition filters generator.
+    _GLOBSTAR_RECURSION_LIMIT = 10
+
+    # Estimated number of file entries matched by a wildcard path segment.
+    _WILDCARD_FAN_OUT = 8
+
+    # Estimated number of user home directories matched by a users variable.
+    _USERS_FAN_OUT = 4
+
+    def _GetGlobStarRecursionDepth(self, path_segment):
+        """Retrieves the recursion depth of a globstar path segment.
+
+        Args:
+          path_segment (str): path segment.
+
+        Returns:
+          int: recursion depth or 0 if the path segment is not a globstar.
+        """
+        if not path_segment.startswith("**"):
+            return 0
+
+        recursion_depth = self._GLOBSTAR_RECURSION_LIMIT
+        if len(path_segment) > 2:
+            try:
+                recursion_depth = int(path_segment[2:], 10)
+            except ValueError:
+                pass
+
+        if recursion_depth <= 1 or recursion_depth > self._GLOBSTAR_RECURSION_LIMIT:
+            recursion_depth = self._GLOBSTAR_RECURSION_LIMIT
+
+        return recursion_depth
+
+    def _GetPathSegments(self, path, path_separator):
+        """Retrieves the path segments of a path.
+
+        Args:
+          path (str): path defined by a source.
+          path_separator (str): path segment separator.
+
+        Returns:
+          list[str]: lower case path segments without empty segments.
+        """
+        return [
+            path_segment
+            for path_segment in path.lower().split(path_separator)
+            if path_segment
+        ]
+
+    def _IsLiteralPathSegment(self, path_segment):
+        """Determines if a path segment is literal.
+
+        Environment variables, such as %%environ_systemroot%%, are considered
+        literal since they expand to a single value.
+
+        Args:
+          path_segment (str): lower case path segment.
+
+        Returns:
+          bool: True if the path segment matches at most a single file entry.
+        """
+        if path_segment.startswith("%%users."):
+            return False
+
+        return not any(character in path_segment for character in "*?[")
+
+    def _PlanPath(self, path, path_separator):
+        """Estimates the traversal cost of a path.
+
+        Args:
+          path (str): path defined by a source.
+          path_separator (str): path segment separator.
+
+        Returns:
+          tuple[int, list[str], int]: estimated traversal cost, lower case literal
+              path prefix segments and number of literal path segments.
+        """
+        literal_prefix = []
+        number_of_literal_segments = 0
+        number_of_candidates = 1
+        estimated_cost = 0
+
+        for path_segment in self._GetPathSegments(path, path_separator):
+            if self._IsLiteralPathSegment(path_segment):
+                number_of_literal_segments += 1
+                if number_of_candidates == 1:
+                    literal_prefix.append(path_segment)
+
+                estimated_cost += number_of_candidates
+                continue
+
+            recursion_depth = self._GetGlobStarRecursionDepth(path_segment)
+            if recursion_depth:
+                for _ in range(recursion_depth):
+                    number_of_candidates *= self._WILDCARD_FAN_OUT
+                    estimated_cost += number_of_candidates
+
+            else:
+                if path_segment.startswith("%%users."):
+                    number_of_candidates *= self._USERS_FAN_OUT
+                else:
+                    number_of_candidates *= self._WILDCARD_FAN_OUT
+
+                estimated_cost += number_of_candidates
+
+        return estimated_cost, literal_prefix, number_of_literal_segments
+
+    def PlanDefinition(self, artifact_definition):
+        """Plans an artifact definition.
+
+        Args:
+          artifact_definition (artifacts.ArtifactDefinition): artifact definition.
+
+        Returns:
+          PlannedDefinition: planned artifact definition.
+        """
+        planned_definition = PlannedDefinition(artifact_definition)
+
+        common_prefix = None
+        path_separator = ""
+        for source in artifact_definition.sources:
+            if source.type_indicator not in self._FILE_SOURCE_TYPES:
+                continue
+
+            path_separator = source.separator
+            for path in set(source.paths):
+                estimated_cost, literal_prefix, number_of_literal_segments = (
+                    self._PlanPath(path, source.separator)
+                )
+                planned_definition.estimated_cost += estimated_cost
+                planned_definition.number_of_literal_segments += (
+                    number_of_literal_segments
+                )
+                planned_definition.number_of_segments += len(
+                    self._GetPathSegments(path, source.separator)
+                )
+
+                if common_prefix is None:
+                    common_prefix = literal_prefix
+                else:
+                    common_length = 0
+                    for segment, other_segment in zip(common_prefix, literal_prefix):
+                        if segment != other_segment:
+                            break
+                        common_length += 1
+
+                    common_prefix = common_prefix[:common_length]
+
+        planned_definition.locality_key = (path_separator, tuple(common_prefix or []))
+
+        return planned_definition
+
+    def PlanDefinitions(self, artifact_definitions):
+        """Plans the order in which artifact definitions are checked.
+
+        Artifact definitions are grouped by path segment separator, which
+        separates definitions that apply to different types of operating system
+        volumes, and ordered by literal path prefix, so that definitions that
+        share a prefix are consecutive. Within a group the cheapest definitions
+        are checked first.
+
+        Args:
+          artifact_definitions (list[artifacts.ArtifactDefinition]): artifact
+              definitions.
+
+        Returns:
+          list[PlannedDefinition]: planned artifact definitions in the order they
+              should be checked.
+        """
+        planned_definitions = [
+            self.PlanDefinition(artifact_definition)
+            for artifact_definition in artifact_definitions
+        ]
+        return sorted(
+            planned_definitions,
+            key=lambda planned_definition: (
+                planned_definition.locality_key,
+                planned_definition.estimated_cost,
+                planned_definition.artifact_definition.name,
+            ),
+        )
@@ -0,0 +1,201 @@
+"""Windows EventLog providers."""
+
+import re
+
+
+class EventLogMessageFile:
+    """Windows EventLog message file.
+
+    Attributes:
+      metadata (ResourceMetadata): metadata of the message file or None if the
+          message file cannot be found or read.
+      mui_metadata (ResourceMetadata): metadata of the MUI resource file of the
+          message file or None if not available.
+      mui_windows_path (str): Windows path of the MUI resource file of the
+          message file or None if not available.
+      windows_path (str): Windows path of the message file, as defined by the
+          EventLog provider.
+    """
+
+    def __init__(self, windows_path, metadata=None):
+        """Initializes a Windows EventLog message file.
+
+        Args:
+          windows_path (str): Windows path of the message file, as defined by
+              the EventLog provider.
+          metadata (Optional[ResourceMetadata]): metadata of the message file.
+        """
+        super().__init__()
+        self.metadata = metadata
+        self.mui_metadata = None
+        self.mui_windows_path = None
+        self.windows_path = windows_path
+
+
+class EventLogProvider:
+    """Windows EventLog provider.
+
+    Attributes:
+      event_message_files (list[str]): Windows paths of the event message files.
+      log_types (list[str]): names of the Event Logs the provider is registered
+          with, such as "Application".
+      name (str): name of the provider, also referred to as log source.
+    """
+
+    def __init__(self, name):
+        """Initializes a Windows EventLog provider.
+
+        Args:
+          name (str): name of the provider.
+        """
+        super().__init__()
+        self.event_message_files = []
+        self.log_types = []
+        self.name = name
+
+
+class EventLogProvidersReader:
+    """Reader of the Windows EventLog providers from the Windows Registry."""
+
+    _CONTROL_SET_KEY_PATH = "HKEY_LOCAL_MACHINE\\System\\ControlSet{0:03d}"
+
+    _CURRENT_CONTROL_SET_KEY_PATH = "HKEY_LOCAL_MACHINE\\System\\CurrentControlSet"
+
+    _EVENTLOG_KEY_PATH = "Services\\EventLog"
+
+    _SELECT_KEY_PATH = "HKEY_LOCAL_MACHINE\\System\\Select"
+
+    _SYSTEM_ROOT_PREFIX_RE = re.compile(r"^\\?SystemRoot\\", re.IGNORECASE)
+
+    def __init__(self, win_registry):
+        """Initializes a Windows EventLog providers reader.
+
+        Args:
+          win_registry (dfwinreg.WinRegistry): Windows Registry.
+        """
+        super().__init__()
+        self._win_registry = win_registry
+
+    def _GetEventLogKey(self):
+        """Retrieves the EventLog key of the current control set.
+
+        Returns:
+          dfwinreg.WinRegistryKey: EventLog key or None if not available.
+        """
+        key_path = "\\".join(
+            [self._CURRENT_CONTROL_SET_KEY_PATH, self._EVENTLOG_KEY_PATH]
+        )
+        registry_key = self._GetKeyByPath(key_path)
+        if registry_key:
+            return registry_key
+
+        # Not every type of Windows Registry file provides the CurrentControlSet
+        # virtual key, hence the current control set is determined from the
+        # Select key.
+        select_key = self._GetKeyByPath(self._SELECT_KEY_PATH)
+        if not select_key:
+            return None
+
+        registry_value = select_key.GetValueByName("Current")
+        if not registry_value:
+            return None
+
+        control_set = registry_value.GetDataAsObject()
+        if not isinstance(control_set, int):
+            return None
+
+        key_path = "\\".join(
+            [self._CONTROL_SET_KEY_PATH.format(control_set), self._EVENTLOG_KEY_PATH]
+        )
+        return self._GetKeyByPath(key_path)
+
+    def _GetKeyByPath(self, key_path):
+        """Retrieves a Windows Registry key.
+
+        Args:
+          key_path (str): Windows Registry key path.
+
+        Returns:
+          dfwinreg.WinRegistryKey: Windows Registry key or None if not available.
+        """
+        try:
+            return self._win_registry.GetKeyByPath(key_path)
+        except RuntimeError:
+            return None
+
+    def _GetMessageFilePaths(self, registry_key, value_name):
+        """Retrieves the Windows paths of message files.
+
+        Args:
+          registry_key (dfwinreg.WinRegistryKey): EventLog provider key.
+          value_name (str): name of the value that contains the Windows paths,
+              such as "EventMessageFile".
+
+        Returns:
+          list[str]: Windows paths of the message files.
+        """
+        registry_value = registry_key.GetValueByName(value_name)
+        if not registry_value:
+            return []
+
+        value_data = registry_value.GetDataAsObject()
+        if not isinstance(value_data, str):
+            return []
+
+        # Multiple message files are separated by a semicolon.
+        return [
+            self._NormalizeMessageFilePath(path)
+            for path in value_data.split(";")
+            if path.strip()
+        ]
+
+    def _NormalizeMessageFilePath(self, path):
+        """Normalizes the Windows path of a message file.
+
+        Paths that start with "\\SystemRoot\\" or that are relative, such as
+        "System32\\IoLogMsg.dll", are relative to the Windows directory.
+
+        Args:
+          path (str): Windows path of a message file.
+
+        Returns:
+          str: normalized Windows path, which can contain environment variables
+              such as %SystemRoot%.
+        """
+        path = path.strip()
+
+        path = self._SYSTEM_ROOT_PREFIX_RE.sub("%SystemRoot%\\\\", path)
+
+        if not path.startswith("%") and not path.startswith("\\") and path[1:2] != ":":
+            path = "\\".join(["%SystemRoot%", path])
+
+        return path
+
+    def ReadProviders(self):
+        """Reads the EventLog providers.
+
+        A provider that is registered with multiple Event Logs is returned once.
+
+        Returns:
+          list[EventLogProvider]: EventLog providers, sorted by name.
+        """
+        eventlog_key = self._GetEventLogKey()
+        if not eventlog_key:
+            return []
+
+        providers = {}
+        for log_type_key in eventlog_key.GetSubkeys():
+            for provider_key in log_type_key.GetSubkeys():
+                lookup_key = provider_key.name.lower()
+                provider = providers.get(lookup_key, None)
+                if not provider:
+                    provider = EventLogProvider(provider_key.name)
+                    providers[lookup_key] = provider
+
+                provider.log_types.append(log_type_key.name)
+
+                for path in self._GetMessageFilePaths(provider_key, "EventMessageFile"):
+                    if path not in provider.event_message_files:
+                        provider.event_message_files.append(path)
+
+        return [provider for _, provider in sorted(providers.items())]
@@ -0,0 +1,111 @@
+"""Cache of file system find specifications of artifact definitions."""
+
+import collections
+import hashlib
+
+
+class FindSpecsCache:
+    """Cache of file system find specifications of artifact definitions.
+
+    The find specifications are cached by artifact definition name and by a
+    fingerprint of the environment variables and user accounts used to expand
+    the paths of the artifact definition. This allows images that share the
+    same environment, such as in a batch run, to reuse the find specifications.
+
+    A dfVFS find specification compiles the regular expressions of its location
+    segments on first use and retains them, hence reusing find specifications
+    also means every path regular expression is compiled only once.
+
+    The cache is kept in memory and is not persisted, hence the find
+    specifications are only reused within a single process. In a batch run
+    every worker process has its own cache, which is reused for the images
+    checked by that worker. Note that the cache is only valid for a single
+    artifact definitions registry.
+
+    Attributes:
+      number_of_cache_hits (int): number of find specifications lookups that
+          were served from the cache.
+      number_of_cache_misses (int): number of find specifications lookups that
+          required the find specifications to be built.
+    """
+
+    _MAXIMUM_NUMBER_OF_CACHED_ENTRIES = 16384
+
+    def __init__(self, maximum_number_of_cached_entries=None):
+        """Initializes a find specifications cache.
+
+        Args:
+          maximum_number_of_cached_entries (Optional[int]): maximum number of
+              cached entries, where an entry contains the find specifications
+              of an artifact definition for a specific fingerprint. The least
+              recently used entry is removed when the maximum is exceeded.
+        """
+        super().__init__()
+        self._find_specs = collections.OrderedDict()
+        self._maximum_number_of_cached_entries = (
+            maximum_number_of_cached_entries or self._MAXIMUM_NUMBER_OF_CACHED_ENTRIES
+        )
+        self.number_of_cache_hits = 0
+        self.number_of_cache_misses = 0
+
+    def GetFindSpecs(self, filter_generator, name, fingerprint):
+        """Retrieves the find specifications of an artifact definition.
+
+        Args:
+          filter_generator (dfimagetools.ArtifactDefinitionFiltersGenerator):
+              artifact definition filters generator, used to build the find
+              specifications if not cached.
+          name (str): name of the artifact definition.
+          fingerprint (str): fingerprint of the environment variables and user
+              accounts used by the filter generator.
+
+        Returns:
+          list[dfvfs.FindSpec]: find specifications.
+        """
+        lookup_key = (name.lower(), fingerprint)
+
+        find_specs = self._find_specs.get(lookup_key, None)
+        if find_specs is not None:
+            self._find_specs.move_to_end(lookup_key)
+            self.number_of_cache_hits += 1
+            return find_specs
+
+        self.number_of_cache_misses += 1
+
+        find_specs = list(filter_generator.GetFindSpecs([name]))
+
+        self._find_specs[lookup_key] = find_specs
+        if len(self._find_specs) > self._maximum_number_of_cached_entries:
+            self._find_specs.popitem(last=False)
+
+        return find_specs
+
+    def GetFingerprint(self, environment_variables, user_accounts):
+        """Determines the fingerprint of environment variables and user accounts.
+
+        Args:
+          environment_variables (list[dfimagetools.EnvironmentVariable]):
+              environment variables.
+          user_accounts (list[dfimagetools.UserAccount]): user accounts.
+
+        Returns:
+          str: fingerprint.
+        """
+        values = sorted(
+            f"environ:{environment_variable.name.lower():s}="
+            f"{environment_variable.value!s}"
+            for environment_variable in environment_variables or []
+        )
+        values.extend(
+            sorted(
+                f"user:{user_account.username!s}={user_account.user_directory!s}"
+                for user_account in user_accounts or []
+            )
+        )
+
+        hasher = hashlib.sha256()
+        for value in values:
+            hasher.update(value.encode("utf-8", errors="surrogatepass"))
+            hasher.update(b"\x00")
+
+        return hasher.hexdigest()
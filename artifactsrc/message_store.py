@@ -0,0 +1,264 @@
+"""Store of Windows message table strings."""
+
+import sqlite3
+import threading
+
+
+class MessageFile:
+    """Windows message file.
+
+    Attributes:
+      file_version (str): file version or None if not available.
+      messages (list[tuple[int, int, str]]): language identifier (LCID), message
+          identifier and message string of the messages.
+      name (str): lower case name of the message file, such as "kernel32.dll".
+      volume_identifier (str): identifier of the volume that contains the
+          message file.
+      windows_path (str): Windows path of the message file.
+    """
+
+    def __init__(self, volume_identifier, windows_path):
+        """Initializes a Windows message file.
+
+        Args:
+          volume_identifier (str): identifier of the volume that contains the
+              message file.
+          windows_path (str): Windows path of the message file.
+        """
+        _, _, name = windows_path.rpartition("\\")
+
+        super().__init__()
+        self.file_version = None
+        self.messages = []
+        self.name = name.lower()
+        self.volume_identifier = volume_identifier
+        self.windows_path = windows_path
+
+
+class MessageStore:
+    """Store of Windows message table strings.
+
+    The store is a SQLite database file with a normalized table of message
+    files and a table of the message strings of every language per message
+    file. Message files with the same name and file version, or the same name
+    and no file version, are stored only once, while the Windows paths where a
+    message file was found are retained per volume.
+    """
+
+    _CREATE_TABLE_QUERIES = [
+        (
+            "CREATE TABLE IF NOT EXISTS message_files ("
+            "message_file_key INTEGER PRIMARY KEY, "
+            "name TEXT NOT NULL, "
+            "file_version TEXT, "
+            "UNIQUE (name, file_version))"
+        ),
+        (
+            "CREATE TABLE IF NOT EXISTS message_file_paths ("
+            "message_file_key INTEGER NOT NULL, "
+            "volume_identifier TEXT NOT NULL, "
+            "windows_path TEXT NOT NULL, "
+            "PRIMARY KEY (volume_identifier, windows_path))"
+        ),
+        (
+            "CREATE TABLE IF NOT EXISTS messages ("
+            "message_file_key INTEGER NOT NULL, "
+            "language_identifier INTEGER NOT NULL, "
+            "message_identifier INTEGER NOT NULL, "
+            "string TEXT, "
+            "PRIMARY KEY (message_file_key, language_identifier, "
+            "message_identifier))"
+        ),
+    ]
+
+    _INSERT_MESSAGE_FILE_QUERY = (
+        "INSERT INTO message_files (name, file_version) VALUES (?, ?)"
+    )
+
+    _INSERT_MESSAGE_FILE_PATH_QUERY = (
+        "INSERT OR REPLACE INTO message_file_paths "
+        "(message_file_key, volume_identifier, windows_path) VALUES (?, ?, ?)"
+    )
+
+    _INSERT_MESSAGE_QUERY = (
+        "INSERT OR IGNORE INTO messages "
+        "(message_file_key, language_identifier, message_identifier, string) "
+        "VALUES (?, ?, ?, ?)"
+    )
+
+    _SELECT_MESSAGE_FILE_KEY_QUERY = (
+        "SELECT message_file_key FROM message_files "
+        "WHERE name = ? AND file_version IS ?"
+    )
+
+    _SELECT_NUMBER_OF_MESSAGES_QUERY = "SELECT COUNT(*) FROM messages"
+
+    def __init__(self):
+        """Initializes a store of Windows message table strings."""
+        super().__init__()
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def _GetMessageFileKey(self, name, file_version):
+        """Retrieves the key of a message file.
+
+        Note that the caller is expected to hold the lock.
+
+        Args:
+          name (str): lower case name of the message file.
+          file_version (str): file version of the message file or None if not
+              available.
+
+        Returns:
+          int: key of the message file or None if not stored.
+        """
+        # Note that "IS" is used to compare the file version, since "=" never
+        # matches NULL and the UNIQUE constraint does not apply to NULL values.
+        cursor = self._connection.execute(
+            self._SELECT_MESSAGE_FILE_KEY_QUERY, (name, file_version)
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        return row[0]
+
+    def AddMessageFiles(self, message_files):
+        """Adds message files.
+
+        The message files are added in a single transaction. The messages of a
+        message file with the same name and file version as a stored message
+        file are not added again, only its Windows path.
+
+        Args:
+          message_files (list[MessageFile]): message files.
+
+        Returns:
+          int: number of message files of which the messages were added.
+
+        Raises:
+          IOError: if not open.
+          OSError: if not open.
+        """
+        if not self._connection:
+            raise IOError("Not opened.")
+
+        number_of_message_files = 0
+
+        with self._lock, self._connection:
+            for message_file in message_files:
+                message_file_key = self._GetMessageFileKey(
+                    message_file.name, message_file.file_version
+                )
+                if message_file_key is None:
+                    cursor = self._connection.execute(
+                        self._INSERT_MESSAGE_FILE_QUERY,
+                        (message_file.name, message_file.file_version),
+                    )
+                    message_file_key = cursor.lastrowid
+
+                    self._connection.executemany(
+                        self._INSERT_MESSAGE_QUERY,
+                        [
+                            (
+                                message_file_key,
+                                language_identifier,
+                                message_identifier,
+                                string,
+                            )
+                            for language_identifier, message_identifier, string in (
+                                message_file.messages
+                            )
+                        ],
+                    )
+                    number_of_message_files += 1
+
+                self._connection.execute(
+                    self._INSERT_MESSAGE_FILE_PATH_QUERY,
+                    (
+                        message_file_key,
+                        message_file.volume_identifier,
+                        message_file.windows_path,
+                    ),
+                )
+
+        return number_of_message_files
+
+    def Close(self):
+        """Closes the store.
+
+        Raises:
+          IOError: if not open.
+          OSError: if not open.
+        """
+        if not self._connection:
+            raise IOError("Not opened.")
+
+        with self._lock:
+            self._connection.close()
+            self._connection = None
+
+    def GetNumberOfMessages(self):
+        """Retrieves the number of messages.
+
+        Returns:
+          int: number of messages.
+
+        Raises:
+          IOError: if not open.
+          OSError: if not open.
+        """
+        if not self._connection:
+            raise IOError("Not opened.")
+
+        with self._lock:
+            cursor = self._connection.execute(self._SELECT_NUMBER_OF_MESSAGES_QUERY)
+            number_of_messages, *_ = cursor.fetchone()
+
+        return number_of_messages
+
+    def HasMessageFile(self, name, file_version):
+        """Determines if the messages of a message file are stored.
+
+        Args:
+          name (str): lower case name of the message file.
+          file_version (str): file version of the message file or None if not
+              available, where message files without a file version are matched
+              on their name.
+
+        Returns:
+          bool: True if the messages of the message file are stored.
+
+        Raises:
+          IOError: if not open.
+          OSError: if not open.
+        """
+        if not self._connection:
+            raise IOError("Not opened.")
+
+        with self._lock:
+            message_file_key = self._GetMessageFileKey(name, file_version)
+
+        return message_file_key is not None
+
+    def Open(self, path):
+        """Opens the store.
+
+        The store database file is created if it does not exist.
+
+        Args:
+          path (str): path of the store database file.
+
+        Raises:
+          IOError: if already open.
+          OSError: if already open.
+        """
+        if self._connection:
+            raise IOError("Already open.")
+
+        # The store is queried by the threads that read message files, hence the
+        # connection is shared and access to it is serialized by the lock.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            for query in self._CREATE_TABLE_QUERIES:
+                self._connection.execute(query)
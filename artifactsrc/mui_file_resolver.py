@@ -0,0 +1,213 @@
+"""Resolver of Windows Multilingual User Interface (MUI) resource files."""
+
+import collections
+import re
+import threading
+
+
+class MUIFileResolver:
+    """Resolver of Windows Multilingual User Interface (MUI) resource files.
+
+    The language specific resources of a resource file, such as
+    "C:\\Windows\\System32\\wevtapi.dll", are stored in a MUI resource file in
+    a language subdirectory, such as "C:\\Windows\\System32\\en-US\\wevtapi.dll.mui".
+
+    The language subdirectories of a directory and the names of the files in a
+    language subdirectory are listed only once and retained, hence resolving
+    the MUI resource files of many resource files in the same directory does
+    not list the same directories repeatedly.
+
+    Attributes:
+      number_of_directory_listings (int): number of directories that were
+          listed.
+    """
+
+    _LANGUAGE_RE = re.compile(r"^[a-z]{2,3}(-[a-z0-9]{2,8})*$", re.IGNORECASE)
+
+    _MAXIMUM_NUMBER_OF_CACHED_DIRECTORIES = 1024
+
+    def __init__(
+        self,
+        file_system,
+        path_resolver,
+        preferred_language="en-US",
+        maximum_number_of_cached_directories=None,
+    ):
+        """Initializes a MUI resource file resolver.
+
+        Args:
+          file_system (dfvfs.FileSystem): file system that contains the resource
+              files.
+          path_resolver (dfvfs.WindowsPathResolver): Windows path resolver.
+          preferred_language (Optional[str]): preferred language, such as
+              "en-US".
+          maximum_number_of_cached_directories (Optional[int]): maximum number of
+              directories of which the listing is cached. The least recently used
+              listing is removed when the maximum is exceeded.
+        """
+        super().__init__()
+        self._directory_listings = collections.OrderedDict()
+        self._file_system = file_system
+        self._lock = threading.Lock()
+        self._maximum_number_of_cached_directories = (
+            maximum_number_of_cached_directories
+            or self._MAXIMUM_NUMBER_OF_CACHED_DIRECTORIES
+        )
+        self._path_resolver = path_resolver
+        self._preferred_language = preferred_language
+        self.number_of_directory_listings = 0
+
+    def _GetCachedListing(self, lookup_key, list_function, *arguments):
+        """Retrieves a cached directory listing.
+
+        Args:
+          lookup_key (tuple[str, str]): type of the listing and comparable of the
+              path specification of the directory.
+          list_function (function): function to list the directory if its listing
+              is not cached.
+          arguments (list[object]): arguments of the list function.
+
+        Returns:
+          dict[str, object]: directory listing.
+        """
+        with self._lock:
+            listing = self._directory_listings.get(lookup_key, None)
+            if listing is not None:
+                self._directory_listings.move_to_end(lookup_key)
+                return listing
+
+        listing = list_function(*arguments)
+
+        with self._lock:
+            self.number_of_directory_listings += 1
+
+            self._directory_listings[lookup_key] = listing
+            if (
+                len(self._directory_listings)
+                > self._maximum_number_of_cached_directories
+            ):
+                self._directory_listings.popitem(last=False)
+
+        return listing
+
+    def _GetLanguageFallbacks(self, languages, available_languages):
+        """Determines the languages to try in order of preference.
+
+        Args:
+          languages (list[str]): preferred languages in order of preference.
+          available_languages (list[str]): lower case languages of the language
+              subdirectories.
+
+        Returns:
+          list[str]: lower case languages in order of preference.
+        """
+        fallbacks = []
+        for language in languages:
+            language = language.lower()
+            if language not in fallbacks:
+                fallbacks.append(language)
+
+        # Fall back to a language with the same primary language, for example
+        # "en-GB" for "en-US", before any other available language.
+        primary_languages = [language.split("-")[0] for language in fallbacks]
+        for language in sorted(available_languages):
+            if language not in fallbacks and language.split("-")[0] in (
+                primary_languages
+            ):
+                fallbacks.append(language)
+
+        for language in sorted(available_languages):
+            if language not in fallbacks:
+                fallbacks.append(language)
+
+        return fallbacks
+
+    def _ListFiles(self, file_entry):
+        """Lists the files in a directory.
+
+        Args:
+          file_entry (dfvfs.FileEntry): file entry of the directory.
+
+        Returns:
+          dict[str, str]: names of the files as stored in the file system per lower
+              case name.
+        """
+        return {
+            sub_file_entry.name.lower(): sub_file_entry.name
+            for sub_file_entry in file_entry.sub_file_entries
+            if sub_file_entry.IsFile()
+        }
+
+    def _ListLanguageDirectories(self, path_spec):
+        """Lists the language subdirectories of a directory.
+
+        Args:
+          path_spec (dfvfs.PathSpec): path specification of the directory.
+
+        Returns:
+          dict[str, dfvfs.FileEntry]: file entries of the language subdirectories
+              per lower case language.
+        """
+        file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+        if not file_entry or not file_entry.IsDirectory():
+            return {}
+
+        return {
+            sub_file_entry.name.lower(): sub_file_entry
+            for sub_file_entry in file_entry.sub_file_entries
+            if sub_file_entry.IsDirectory()
+            and self._LANGUAGE_RE.match(sub_file_entry.name)
+        }
+
+    def GetMUIFilePath(self, windows_path, languages=None):
+        """Retrieves the Windows path of the MUI resource file of a resource file.
+
+        Args:
+          windows_path (str): Windows path of the resource file.
+          languages (Optional[list[str]]): languages in order of preference, where
+              None represents the preferred language of the resolver. If the MUI
+              resource file is not available in any of these languages a language
+              with the same primary language, or otherwise any other language, is
+              used.
+
+        Returns:
+          str: Windows path of the MUI resource file or None if not available.
+        """
+        directory_path, _, filename = windows_path.rpartition("\\")
+        if not directory_path or not filename:
+            return None
+
+        # The listings are cached by path specification, since the same
+        # directory can be referred to by different Windows paths, such as
+        # "C:\\Windows\\System32" and "%SystemRoot%\\system32".
+        path_spec = self._path_resolver.ResolvePath(directory_path)
+        if path_spec is None:
+            return None
+
+        language_directories = self._GetCachedListing(
+            ("languages", path_spec.comparable),
+            self._ListLanguageDirectories,
+            path_spec,
+        )
+        if not language_directories:
+            return None
+
+        mui_filename = f"{filename.lower():s}.mui"
+
+        for language in self._GetLanguageFallbacks(
+            languages or [self._preferred_language], language_directories.keys()
+        ):
+            file_entry = language_directories.get(language, None)
+            if not file_entry:
+                continue
+
+            filenames = self._GetCachedListing(
+                ("files", file_entry.path_spec.comparable),
+                self._ListFiles,
+                file_entry,
+            )
+            name = filenames.get(mui_filename, None)
+            if name:
+                return "\\".join([directory_path, file_entry.name, name])
+
+        return None
@@ -0,0 +1,259 @@
+"""Cache of Windows Registry files."""
+
+import collections
+import io
+import os
+import threading
+
+from dfimagetools import windows_registry as dfimagetools_windows_registry
+
+from dfwinreg import interface as dfwinreg_interface
+
+
+class RegistryFileCache:
+    """Cache of the data of Windows Registry files.
+
+    The data of a Windows Registry file is read once from the storage media
+    image, which for compressed storage media image formats also means it is
+    decompressed once, and is retained in memory. The total size of the cached
+    data is bounded; the least recently used Windows Registry file is removed
+    when the maximum is exceeded.
+
+    The cached data is identified by the storage media image, the volume and
+    the identity of the Windows Registry file, hence the cache is retained when
+    the same storage media image is scanned again, while a Windows Registry file
+    that was modified is read again.
+
+    Note that the bound only covers the data referenced by the cache itself.
+    Data that was removed from the cache remains in memory as long as a
+    Windows Registry file that was opened from it is in use.
+
+    Attributes:
+      number_of_cache_hits (int): number of Windows Registry files that were
+          opened from the cache.
+      number_of_cache_misses (int): number of Windows Registry files that were
+          read from the storage media image.
+    """
+
+    _MAXIMUM_CACHED_DATA_SIZE = 256 * 1024 * 1024
+
+    def __init__(self, maximum_cached_data_size=None):
+        """Initializes a Windows Registry file cache.
+
+        Args:
+          maximum_cached_data_size (Optional[int]): maximum total size, in bytes,
+              of the cached data. A Windows Registry file that is larger than
+              the maximum is not cached.
+        """
+        super().__init__()
+        self._cached_data = collections.OrderedDict()
+        self._cached_data_size = 0
+        self._lock = threading.Lock()
+        self._maximum_cached_data_size = (
+            maximum_cached_data_size or self._MAXIMUM_CACHED_DATA_SIZE
+        )
+        self.number_of_cache_hits = 0
+        self.number_of_cache_misses = 0
+
+    def CacheData(self, cache_identifier, path, data):
+        """Caches the data of a Windows Registry file.
+
+        Args:
+          cache_identifier (tuple[object, ...]): identifier of the storage media
+              image, volume and file entry of the Windows Registry file.
+          path (str): Windows path of the Windows Registry file.
+          data (bytes): data of the Windows Registry file.
+        """
+        data_size = len(data)
+        if not self.IsCacheable(data_size):
+            return
+
+        lookup_key = (cache_identifier, path.upper())
+
+        with self._lock:
+            cached_data = self._cached_data.pop(lookup_key, None)
+            if cached_data is not None:
+                self._cached_data_size -= len(cached_data)
+
+            self._cached_data[lookup_key] = data
+            self._cached_data_size += data_size
+
+            while self._cached_data_size > self._maximum_cached_data_size:
+                _, cached_data = self._cached_data.popitem(last=False)
+                self._cached_data_size -= len(cached_data)
+
+    def Empty(self):
+        """Empties the cache."""
+        with self._lock:
+            self._cached_data = collections.OrderedDict()
+            self._cached_data_size = 0
+
+    def GetData(self, cache_identifier, path):
+        """Retrieves the cached data of a Windows Registry file.
+
+        Args:
+          cache_identifier (tuple[object, ...]): identifier of the storage media
+              image, volume and file entry of the Windows Registry file.
+          path (str): Windows path of the Windows Registry file.
+
+        Returns:
+          bytes: data of the Windows Registry file or None if not cached.
+        """
+        lookup_key = (cache_identifier, path.upper())
+
+        with self._lock:
+            data = self._cached_data.get(lookup_key, None)
+            if data is None:
+                self.number_of_cache_misses += 1
+            else:
+                self._cached_data.move_to_end(lookup_key)
+                self.number_of_cache_hits += 1
+
+        return data
+
+    def IsCacheable(self, data_size):
+        """Determines if data of a specific size can be cached.
+
+        Args:
+          data_size (int): size of the data of a Windows Registry file.
+
+        Returns:
+          bool: True if data of the size can be cached.
+        """
+        return data_size <= self._maximum_cached_data_size
+
+
+class CachingWindowsRegistryFileReader(dfwinreg_interface.WinRegistryFileReader):
+    """Windows Registry file reader that caches the data of the files."""
+
+    def __init__(
+        self, file_system, path_resolver, registry_file_cache, cache_identifier=()
+    ):
+        """Initializes a caching Windows Registry file reader.
+
+        Args:
+          file_system (dfvfs.FileSystem): file system that contains the Windows
+              directory.
+          path_resolver (dfvfs.WindowsPathResolver): Windows path resolver.
+          registry_file_cache (RegistryFileCache): Windows Registry file cache.
+          cache_identifier (Optional[tuple[str, ...]]): identifier of the storage
+              media image and volume in the Windows Registry file cache, such as
+              the path of the storage media image and the volume identifier.
+        """
+        super().__init__()
+        self._cache_identifier = cache_identifier
+        self._file_system = file_system
+        self._path_resolver = path_resolver
+        self._registry_file_cache = registry_file_cache
+
+    def _GetFileEntry(self, path):
+        """Retrieves the file entry of a Windows Registry file.
+
+        Args:
+          path (str): Windows path of the Windows Registry file.
+
+        Returns:
+          dfvfs.FileEntry: file entry of the Windows Registry file or None if
+              not available.
+        """
+        path_spec = self._path_resolver.ResolvePath(path)
+        if path_spec is None:
+            return None
+
+        return self._file_system.GetFileEntryByPathSpec(path_spec)
+
+    def _GetFileEntryIdentity(self, file_entry):
+        """Retrieves the identity of the file entry of a Windows Registry file.
+
+        The identity consists of the inode number, the modification time and
+        the size, hence a Windows Registry file that was modified is read again.
+
+        Args:
+          file_entry (dfvfs.FileEntry): file entry of the Windows Registry file.
+
+        Returns:
+          tuple[int, str, int]: identity of the file entry.
+        """
+        stat_attribute = file_entry.GetStatAttribute()
+        inode_number = getattr(stat_attribute, "inode_number", None)
+
+        modification_time = file_entry.modification_time
+        if modification_time:
+            modification_time = modification_time.CopyToDateTimeString()
+
+        return inode_number, modification_time or "", file_entry.size
+
+    def Open(self, path, ascii_codepage="cp1252"):
+        """Opens the Windows Registry file specified by the path.
+
+        Windows Registry files that are larger than the maximum size of the
+        Windows Registry file cache are read directly from the storage media
+        image instead of being read into memory.
+
+        Args:
+          path (str): Windows path of the Windows Registry file, such as
+              C:\\Windows\\System32\\config\\SYSTEM.
+          ascii_codepage (Optional[str]): ASCII string codepage.
+
+        Returns:
+          dfwinreg.WinRegistryFile: Windows Registry file or None if the file
+              cannot be opened.
+        """
+        file_entry = self._GetFileEntry(path)
+        if file_entry is None:
+            return None
+
+        cache_identifier = (
+            *self._cache_identifier,
+            *self._GetFileEntryIdentity(file_entry),
+        )
+
+        data = self._registry_file_cache.GetData(cache_identifier, path)
+        if data is not None:
+            file_object = io.BytesIO(data)
+
+        else:
+            file_object = file_entry.GetFileObject()
+            if file_object is None:
+                return None
+
+        try:
+            if data is None and self._registry_file_cache.IsCacheable(
+                file_object.get_size()
+            ):
+                data = file_object.read()
+                file_object.close()
+
+                file_object = io.BytesIO(data)
+                if data:
+                    self._registry_file_cache.CacheData(cache_identifier, path, data)
+
+            signature = file_object.read(4)
+            file_object.seek(0, os.SEEK_SET)
+
+        except OSError:
+            file_object.close()
+            return None
+
+        if not signature:
+            file_object.close()
+            return None
+
+        if signature == b"regf":
+            registry_file = dfimagetools_windows_registry.REGFWindowsRegistryFile(
+                ascii_codepage=ascii_codepage
+            )
+        else:
+            registry_file = dfimagetools_windows_registry.CREGWindowsRegistryFile(
+                ascii_codepage=ascii_codepage
+            )
+
+        try:
+            # Note that registry_file takes over management of file_object.
+            registry_file.Open(file_object)
+
+        except OSError:
+            file_object.close()
+            return None
+
+        return registry_file
@@ -0,0 +1,230 @@
+"""Trie of Windows Registry key paths."""
+
+import fnmatch
+
+from dfwinreg import definitions as dfwinreg_definitions
+
+
+class RegistryKeyPathTrieNode:
+    """Node of a Windows Registry key paths trie.
+
+    Attributes:
+      is_literal (bool): True if the key path of the node contains no globs.
+      keys (list[dfwinreg.WinRegistryKey]): Windows Registry keys that match the
+          key path of the node.
+      sub_nodes (dict[str, RegistryKeyPathTrieNode]): sub nodes per lower case
+          key path segment.
+    """
+
+    def __init__(self, is_literal=True, keys=None):
+        """Initializes a Windows Registry key paths trie node.
+
+        Args:
+          is_literal (Optional[bool]): True if the key path of the node contains
+              no globs.
+          keys (Optional[list[dfwinreg.WinRegistryKey]]): Windows Registry keys
+              that match the key path of the node.
+        """
+        super().__init__()
+        self.is_literal = is_literal
+        self.keys = keys or []
+        self.sub_nodes = {}
+
+
+class RegistryKeyPathTrie:
+    """Trie of Windows Registry key paths.
+
+    Every node of the trie retains the Windows Registry keys that match its key
+    path, hence key paths that share a prefix, such as
+    "HKEY_LOCAL_MACHINE\\Software\\Microsoft", are resolved only once and the
+    sub keys of a key are enumerated at most once, for all key paths with a glob
+    in the corresponding key path segment. Since the first segments of a key path
+    identify the Windows Registry file, the lookups are grouped per file. Key
+    paths are resolved segment by segment, from the keys of the parent key path.
+
+    Attributes:
+      number_of_key_lookups (int): number of key path segments that were looked
+          up in the Windows Registry.
+    """
+
+    _GLOB_CHARACTERS = frozenset(["*", "?", "["])
+
+    _LOCAL_MACHINE_SUBKEY_NAMES = ("SAM", "Security", "Software", "System")
+
+    _ROOT_KEY_ALIASES = {
+        "HKCC": "HKEY_CURRENT_CONFIG",
+        "HKCR": "HKEY_CLASSES_ROOT",
+        "HKCU": "HKEY_CURRENT_USER",
+        "HKLM": "HKEY_LOCAL_MACHINE",
+        "HKU": "HKEY_USERS",
+    }
+
+    _USER_PROFILE_LIST_KEY_PATH = (
+        "HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Windows NT\\CurrentVersion\\"
+        "ProfileList"
+    )
+
+    def __init__(self, win_registry):
+        """Initializes a Windows Registry key paths trie.
+
+        Args:
+          win_registry (dfwinreg.WinRegistry): Windows Registry.
+        """
+        super().__init__()
+        self._root_node = RegistryKeyPathTrieNode()
+        self._win_registry = win_registry
+        self.number_of_key_lookups = 0
+
+    def _IsGlob(self, key_path_segment):
+        """Determines if a key path segment contains a glob.
+
+        Args:
+          key_path_segment (str): key path segment.
+
+        Returns:
+          bool: True if the key path segment contains a glob.
+        """
+        return bool(self._GLOB_CHARACTERS.intersection(key_path_segment))
+
+    def _GetRootKeySubkeyNames(self, root_key_name):
+        """Retrieves the names of the subkeys of a root key.
+
+        Args:
+          root_key_name (str): name of the root key, such as "HKEY_USERS".
+
+        Returns:
+          list[str]: names of the subkeys of the root key.
+        """
+        if root_key_name == "HKEY_LOCAL_MACHINE":
+            return list(self._LOCAL_MACHINE_SUBKEY_NAMES)
+
+        if root_key_name != "HKEY_USERS":
+            return []
+
+        # The subkeys of HKEY_USERS are the user profiles, which dfwinreg maps
+        # on the security identifiers (SIDs) in the profile list.
+        subkey_names = []
+        for profile_list_key in self.GetKeysByPath(self._USER_PROFILE_LIST_KEY_PATH):
+            for user_profile_key in profile_list_key.GetSubkeys():
+                subkey_names.append(user_profile_key.name)
+                subkey_names.append(f"{user_profile_key.name:s}_Classes")
+
+        return subkey_names
+
+    def _GetKeyByPath(self, key_path):
+        """Retrieves a Windows Registry key.
+
+        Args:
+          key_path (str): key path.
+
+        Returns:
+          dfwinreg.WinRegistryKey: Windows Registry key or None if not available.
+        """
+        try:
+            return self._win_registry.GetKeyByPath(key_path)
+        except RuntimeError:
+            return None
+
+    def _ResolveKeyPathSegment(self, parent_node, key_path_segments):
+        """Resolves the last segment of a key path.
+
+        The first 2 segments of a key path, such as "HKEY_LOCAL_MACHINE\\Software",
+        identify the Windows Registry file and are resolved by the Windows
+        Registry. Subsequent segments are resolved from the keys of the parent
+        node, hence every segment requires a single lookup.
+
+        Args:
+          parent_node (RegistryKeyPathTrieNode): trie node of the parent key path.
+          key_path_segments (list[str]): key path segments.
+
+        Returns:
+          RegistryKeyPathTrieNode: trie node of the key path.
+        """
+        key_path_segment = key_path_segments[-1]
+        is_glob = self._IsGlob(key_path_segment)
+        is_literal = parent_node.is_literal and not is_glob
+
+        # The root key is only resolved as part of a longer key path, since
+        # not every root key can be retrieved by itself. Note that globs in the
+        # root key are not supported.
+        if len(key_path_segments) == 1:
+            return RegistryKeyPathTrieNode(is_literal=is_literal)
+
+        self.number_of_key_lookups += 1
+
+        keys = []
+        if len(key_path_segments) == 2:
+            if is_literal:
+                key_path = dfwinreg_definitions.KEY_PATH_SEPARATOR.join(
+                    key_path_segments
+                )
+                registry_key = self._GetKeyByPath(key_path)
+                if registry_key:
+                    keys.append(registry_key)
+
+            elif parent_node.is_literal:
+                root_key_name = key_path_segments[0]
+                pattern = key_path_segment.lower()
+                for subkey_name in self._GetRootKeySubkeyNames(root_key_name):
+                    if fnmatch.fnmatchcase(subkey_name.lower(), pattern):
+                        key_path = dfwinreg_definitions.KEY_PATH_SEPARATOR.join(
+                            [root_key_name, subkey_name]
+                        )
+                        registry_key = self._GetKeyByPath(key_path)
+                        if registry_key:
+                            keys.append(registry_key)
+
+        elif is_glob:
+            pattern = key_path_segment.lower()
+            for registry_key in parent_node.keys:
+                for sub_key in registry_key.GetSubkeys():
+                    if fnmatch.fnmatchcase(sub_key.name.lower(), pattern):
+                        keys.append(sub_key)
+
+        else:
+            for registry_key in parent_node.keys:
+                sub_key = registry_key.GetSubkeyByName(key_path_segment)
+                if sub_key:
+                    keys.append(sub_key)
+
+        return RegistryKeyPathTrieNode(is_literal=is_literal, keys=keys)
+
+    def GetKeysByPath(self, key_path):
+        """Retrieves the Windows Registry keys that match a key path.
+
+        Args:
+          key_path (str): key path, where key path segments can contain globs,
+              such as "HKEY_LOCAL_MACHINE\\Software\\Microsoft\\*\\Run".
+
+        Returns:
+          list[dfwinreg.WinRegistryKey]: Windows Registry keys that match the key
+              path.
+        """
+        key_path_segments = [
+            key_path_segment
+            for key_path_segment in key_path.split(
+                dfwinreg_definitions.KEY_PATH_SEPARATOR
+            )
+            if key_path_segment
+        ]
+        if not key_path_segments:
+            return []
+
+        root_key_name = key_path_segments[0].upper()
+        key_path_segments[0] = self._ROOT_KEY_ALIASES.get(root_key_name, root_key_name)
+
+        node = self._root_node
+        for segment_index, key_path_segment in enumerate(key_path_segments):
+            lookup_key = key_path_segment.lower()
+            sub_node = node.sub_nodes.get(lookup_key, None)
+            if sub_node is None:
+                sub_node = self._ResolveKeyPathSegment(
+                    node, key_path_segments[: segment_index + 1]
+                )
+                node.sub_nodes[lookup_key] = sub_node
+
+            node = sub_node
+            if segment_index > 0 and not node.keys:
+                return []
+
+        return list(node.keys)
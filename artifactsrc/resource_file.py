@@ -1,6 +1,7 @@
 """Windows Message Resource file."""
 
 import logging
+import threading
 
 import pyexe
 import pywrc
@@ -14,6 +15,8 @@ class MessageResourceFile:
     """
 
     _MESSAGE_TABLE_RESOURCE_IDENTIFIER = 0x0B
+    _MUI_RESOURCE_NAME = "MUI"
+    _STRING_TABLE_RESOURCE_IDENTIFIER = 0x06
     _VERSION_INFORMATION_RESOURCE_IDENTIFIER = 0x10
 
     def __init__(
@@ -21,6 +24,7 @@ class MessageResourceFile:
         windows_path,
         ascii_codepage="cp1252",
         preferred_language_identifier=0x0409,
+        pool=None,
     ):
         """Initializes the Windows Message Resource file.
 
@@ -29,6 +33,8 @@ class MessageResourceFile:
           ascii_codepage (Optional[str]): ASCII string codepage.
           preferred_language_identifier (Optional[int]): preferred language
               identifier (LCID).
+          pool (Optional[MessageResourceFilePool]): pool the message resource
+              file is returned to when it is closed.
         """
         super().__init__()
         self._ascii_codepage = ascii_codepage
@@ -38,13 +44,26 @@ class MessageResourceFile:
         self._file_object = None
         self._file_version = None
         self._is_open = False
+        self._parsed_resources = {}
+        self._pool = pool
         self._preferred_language_identifier = preferred_language_identifier
         self._product_version = None
+        self._resource_languages = {}
+        self._resources = {}
         # TODO: wrc stream set codepage?
         self._wrc_stream = pywrc.stream()
 
         self.windows_path = windows_path
 
+    def __enter__(self):
+        """Make this work with the 'with' statement."""
+        return self
+
+    def __exit__(self, unused_type, unused_value, unused_traceback):
+        """Make this work with the 'with' statement."""
+        if self._is_open:
+            self.Close()
+
     def _GetVersionInformation(self):
         """Determines the file and product version."""
         version_information_resource = self._GetVersionInformationResource()
@@ -78,42 +97,125 @@ class MessageResourceFile:
                 f"{self.windows_path:s}."
             )
 
-    def _GetVersionInformationResource(self):
-        """Retrieves the version information resource.
+    def _GetParsedResource(self, resource_key, resource_class):
+        """Retrieves a parsed resource in the preferred language.
+
+        The parsed resource is retained, hence the resource data is read and
+        parsed only once.
+
+        Args:
+          resource_key (int|str): identifier or name of the resource.
+          resource_class (type): pywrc resource class used to parse the resource
+              data, such as pywrc.mui_resource.
 
         Returns:
-          pywrc.version_information_resource: version information resource or None
-              if not available.
+          object: parsed resource or None if not available.
         """
-        preferred_wrc_resource_sub_item = None
+        if resource_key in self._parsed_resources:
+            return self._parsed_resources[resource_key]
 
-        wrc_resource = self._wrc_stream.get_resource_by_identifier(
-            self._VERSION_INFORMATION_RESOURCE_IDENTIFIER
-        )
-        if wrc_resource:
-            first_wrc_resource_sub_item = None
-            for wrc_resource_item in wrc_resource.items:
-                for wrc_resource_sub_item in wrc_resource_item.sub_items:
-                    if not first_wrc_resource_sub_item:
-                        first_wrc_resource_sub_item = wrc_resource_sub_item
+        parsed_resource = None
 
-                    language_identifier = wrc_resource_sub_item.identifier
-                    if language_identifier == self._preferred_language_identifier:
-                        if not preferred_wrc_resource_sub_item:
-                            preferred_wrc_resource_sub_item = wrc_resource_sub_item
+        wrc_resource_sub_item = self._GetResourceSubItem(resource_key)
+        if wrc_resource_sub_item:
+            resource_data = wrc_resource_sub_item.read()
 
-            if not preferred_wrc_resource_sub_item:
-                preferred_wrc_resource_sub_item = first_wrc_resource_sub_item
+            parsed_resource = resource_class()
+            parsed_resource.copy_from_byte_stream(resource_data)
 
-        if not preferred_wrc_resource_sub_item:
-            return None
+        self._parsed_resources[resource_key] = parsed_resource
+
+        return parsed_resource
+
+    def _GetResource(self, resource_key):
+        """Retrieves a resource.
+
+        Args:
+          resource_key (int|str): identifier or name of the resource.
+
+        Returns:
+          pywrc.resource: resource or None if not available.
+        """
+        if resource_key in self._resources:
+            return self._resources[resource_key]
+
+        wrc_resource = None
+        if self._wrc_stream:
+            try:
+                if isinstance(resource_key, str):
+                    wrc_resource = self._wrc_stream.get_resource_by_name(resource_key)
+                else:
+                    wrc_resource = self._wrc_stream.get_resource_by_identifier(
+                        resource_key
+                    )
+            except IOError:
+                pass
+
+        self._resources[resource_key] = wrc_resource
+
+        return wrc_resource
+
+    def _GetResourceLanguages(self, resource_key):
+        """Retrieves the resource sub items of a resource per language.
+
+        The resource sub items are indexed once per resource, hence subsequent
+        lookups of the same resource do not iterate the resource items again.
+
+        Args:
+          resource_key (int|str): identifier or name of the resource.
+
+        Returns:
+          dict[int, pywrc.resource_item]: first resource sub item per language
+              identifier (LCID), in the order of the resource.
+        """
+        resource_languages = self._resource_languages.get(resource_key, None)
+        if resource_languages is None:
+            resource_languages = {}
+
+            wrc_resource = self._GetResource(resource_key)
+            if wrc_resource:
+                for wrc_resource_item in wrc_resource.items:
+                    for wrc_resource_sub_item in wrc_resource_item.sub_items:
+                        resource_languages.setdefault(
+                            wrc_resource_sub_item.identifier, wrc_resource_sub_item
+                        )
+
+            self._resource_languages[resource_key] = resource_languages
+
+        return resource_languages
+
+    def _GetResourceSubItem(self, resource_key):
+        """Retrieves the resource sub item of a resource in the preferred language.
+
+        Args:
+          resource_key (int|str): identifier or name of the resource.
+
+        Returns:
+          pywrc.resource_item: resource sub item in the preferred language, the
+              first resource sub item if the preferred language is not available
+              or None if the resource is not available.
+        """
+        resource_languages = self._GetResourceLanguages(resource_key)
+
+        wrc_resource_sub_item = resource_languages.get(
+            self._preferred_language_identifier, None
+        )
+        if not wrc_resource_sub_item:
+            wrc_resource_sub_item = next(iter(resource_languages.values()), None)
 
-        resource_data = preferred_wrc_resource_sub_item.read()
+        return wrc_resource_sub_item
 
-        version_information_resource = pywrc.version_information_resource()
-        version_information_resource.copy_from_byte_stream(resource_data)
+    def _GetVersionInformationResource(self):
+        """Retrieves the version information resource.
 
-        return version_information_resource
+        Returns:
+          pywrc.version_information_resource: version information resource or None
+              if not available.
+        """
+        return self._GetParsedResource(
+            self._VERSION_INFORMATION_RESOURCE_IDENTIFIER,
+            pywrc.version_information_resource,
+        )
 
     @property
     def file_version(self):
@@ -132,6 +234,10 @@ class MessageResourceFile:
     def Close(self):
         """Closes the Windows Message Resource file.
 
+        The file-like object the message resource file was opened with is not
+        closed. If the message resource file was obtained from a pool, it is
+        returned to the pool.
+
         Raises:
           IOError: if not open.
           OSError: if not open.
@@ -143,8 +249,35 @@ class MessageResourceFile:
             self._wrc_stream.close()
 
         self._exe_file.close()
+        self._exe_section = None
         self._file_object = None
+        self._file_version = None
         self._is_open = False
+        self._parsed_resources = {}
+        self._product_version = None
+        self._resource_languages = {}
+        self._resources = {}
+
+        if self._pool:
+            self._pool.ReleaseFile(self)
+
+    def GetLanguageIdentifiers(self):
+        """Retrieves the language identifiers of the resources.
+
+        Returns:
+          list[int]: sorted language identifiers (LCIDs) of the resources.
+        """
+        language_identifiers = set()
+        if self._wrc_stream:
+            try:
+                for wrc_resource in self._wrc_stream.resources:
+                    for wrc_resource_item in wrc_resource.items:
+                        for wrc_resource_sub_item in wrc_resource_item.sub_items:
+                            language_identifiers.add(wrc_resource_sub_item.identifier)
+            except IOError:
+                pass
+
+        return sorted(language_identifiers)
 
     def GetMessageTableResource(self):
         """Retrieves the message table resource.
@@ -153,9 +286,39 @@ class MessageResourceFile:
           pywrc.resource: resource containing the message table resource or None
               if not available.
         """
-        return self._wrc_stream.get_resource_by_identifier(
-            self._MESSAGE_TABLE_RESOURCE_IDENTIFIER
-        )
+        return self._GetResource(self._MESSAGE_TABLE_RESOURCE_IDENTIFIER)
+
+    def GetMessages(self):
+        """Retrieves the messages of the message table resource.
+
+        The messages of every language in the message table resource are
+        retrieved, not only those of the preferred language.
+
+        Yields:
+          tuple[int, int, str]: language identifier (LCID), message identifier
+              and message string.
+        """
+        wrc_resource = self._GetResource(self._MESSAGE_TABLE_RESOURCE_IDENTIFIER)
+        if wrc_resource:
+            for wrc_resource_item in wrc_resource.items:
+                for wrc_resource_sub_item in wrc_resource_item.sub_items:
+                    resource_data = wrc_resource_sub_item.read()
+
+                    message_table_resource = pywrc.message_table_resource()
+                    message_table_resource.copy_from_byte_stream(
+                        resource_data, codepage=self._ascii_codepage
+                    )
+
+                    for message_index in range(
+                        message_table_resource.get_number_of_messages()
+                    ):
+                        yield (
+                            wrc_resource_sub_item.identifier,
+                            message_table_resource.get_message_identifier(
+                                message_index
+                            ),
+                            message_table_resource.get_string(message_index),
+                        )
 
     def GetMUILanguage(self):
         """Retrieves the MUI language.
@@ -175,33 +338,16 @@ class MessageResourceFile:
         Returns:
           pywrc.mui_resource: MUI resource or None if not available.
         """
-        preferred_wrc_resource_sub_item = None
-
-        wrc_resource = self._wrc_stream.get_resource_by_name("MUI")
-        if wrc_resource:
-            first_wrc_resource_sub_item = None
-            for wrc_resource_item in wrc_resource.items:
-                for wrc_resource_sub_item in wrc_resource_item.sub_items:
-                    if not first_wrc_resource_sub_item:
-                        first_wrc_resource_sub_item = wrc_resource_sub_item
+        return self._GetParsedResource(self._MUI_RESOURCE_NAME, pywrc.mui_resource)
 
-                    language_identifier = wrc_resource_sub_item.identifier
-                    if language_identifier == self._preferred_language_identifier:
-                        if not preferred_wrc_resource_sub_item:
-                            preferred_wrc_resource_sub_item = wrc_resource_sub_item
+    def GetStringTableResource(self):
+        """Retrieves the string table resource.
 
-            if not preferred_wrc_resource_sub_item:
-                preferred_wrc_resource_sub_item = first_wrc_resource_sub_item
-
-        if not preferred_wrc_resource_sub_item:
-            return None
-
-        resource_data = preferred_wrc_resource_sub_item.read()
-
-        mui_resource = pywrc.mui_resource()
-        mui_resource.copy_from_byte_stream(resource_data)
-
-        return mui_resource
+        Returns:
+          pywrc.resource: resource containing the string table resource or None
+              if not available.
+        """
+        return self._GetResource(self._STRING_TABLE_RESOURCE_IDENTIFIER)
 
     def HasMessageTableResource(self):
         """Determines if the resource file as a message table resource.
@@ -209,15 +355,7 @@ class MessageResourceFile:
         Returns:
           bool: True if the resource file as a message table resource.
         """
-        wrc_resource = None
-        if self._wrc_stream:
-            try:
-                wrc_resource = self._wrc_stream.get_resource_by_identifier(
-                    self._MESSAGE_TABLE_RESOURCE_IDENTIFIER
-                )
-            except IOError:
-                pass
-
+        wrc_resource = self._GetResource(self._MESSAGE_TABLE_RESOURCE_IDENTIFIER)
         return bool(wrc_resource)
 
     def OpenFileObject(self, file_object):
@@ -234,11 +372,132 @@ class MessageResourceFile:
             raise IOError("Already open.")
 
         self._exe_file.open_file_object(file_object)
-        self._exe_section = self._exe_file.get_section_by_name(".rsrc")
 
-        if self._exe_section:
-            self._wrc_stream.set_virtual_address(self._exe_section.virtual_address)
-            self._wrc_stream.open_file_object(self._exe_section)
+        try:
+            self._exe_section = self._exe_file.get_section_by_name(".rsrc")
+
+            if self._exe_section:
+                self._wrc_stream.set_virtual_address(self._exe_section.virtual_address)
+                self._wrc_stream.open_file_object(self._exe_section)
+
+        except IOError:
+            # Close the executable such that the native objects can be reused.
+            self._exe_section = None
+            self._exe_file.close()
+            raise
 
         self._file_object = file_object
         self._is_open = True
+
+
+class MessageResourceFilePool:
+    """Bounded pool of reusable Windows Message Resource files.
+
+    Every Windows Message Resource file allocates a native executable file and
+    resource stream object. Closed message resource files are retained by the
+    pool, up to a maximum number, and are reused, hence reading many resource
+    files does not allocate new native objects for every resource file.
+
+    Attributes:
+      number_of_allocated_files (int): number of message resource files that
+          were allocated.
+      number_of_reused_files (int): number of times a message resource file was
+          reused.
+    """
+
+    _MAXIMUM_NUMBER_OF_FILES = 16
+
+    def __init__(
+        self,
+        ascii_codepage="cp1252",
+        preferred_language_identifier=0x0409,
+        maximum_number_of_files=None,
+    ):
+        """Initializes a pool of Windows Message Resource files.
+
+        Args:
+          ascii_codepage (Optional[str]): ASCII string codepage.
+          preferred_language_identifier (Optional[int]): preferred language
+              identifier (LCID).
+          maximum_number_of_files (Optional[int]): maximum number of closed
+              message resource files that is retained for reuse.
+        """
+        super().__init__()
+        self._ascii_codepage = ascii_codepage
+        self._available_files = []
+        self._lock = threading.Lock()
+        self._maximum_number_of_files = (
+            maximum_number_of_files or self._MAXIMUM_NUMBER_OF_FILES
+        )
+        self._preferred_language_identifier = preferred_language_identifier
+        self.number_of_allocated_files = 0
+        self.number_of_reused_files = 0
+
+    def GetNumberOfAvailableFiles(self):
+        """Retrieves the number of message resource files available for reuse.
+
+        Returns:
+          int: number of message resource files available for reuse.
+        """
+        with self._lock:
+            return len(self._available_files)
+
+    def OpenFileObject(self, windows_path, file_object):
+        """Opens a Windows Message Resource file using a file-like object.
+
+        The message resource file is returned to the pool when it is closed,
+        hence it should be used with the 'with' statement. The file-like object
+        is not closed by the message resource file.
+
+        Args:
+          windows_path (str): normalized version of the Windows path.
+          file_object (file): file-like object.
+
+        Returns:
+          MessageResourceFile: open message resource file.
+
+        Raises:
+          IOError: if the message resource file cannot be opened.
+          OSError: if the message resource file cannot be opened.
+        """
+        message_file = None
+        with self._lock:
+            if self._available_files:
+                message_file = self._available_files.pop()
+                self.number_of_reused_files += 1
+            else:
+                self.number_of_allocated_files += 1
+
+        if message_file:
+            message_file.windows_path = windows_path
+        else:
+            message_file = MessageResourceFile(
+                windows_path,
+                ascii_codepage=self._ascii_codepage,
+                preferred_language_identifier=self._preferred_language_identifier,
+                pool=self,
+            )
+
+        try:
+            message_file.OpenFileObject(file_object)
+        except IOError:
+            self.ReleaseFile(message_file)
+            raise
+
+        return message_file
+
+    def ReleaseFile(self, message_file):
+        """Returns a closed message resource file to the pool.
+
+        The message resource file is discarded if the pool already retains the
+        maximum number of message resource files.
+
+        Args:
+          message_file (MessageResourceFile): closed message resource file.
+        """
+        with self._lock:
+            if (
+                len(self._available_files) < self._maximum_number_of_files
+                and message_file not in self._available_files
+            ):
+                self._available_files.append(message_file)
@@ -0,0 +1,153 @@
+"""Inventory of Windows resource files."""
+
+import sqlite3
+
+
+class ResourceFileInventoryEntry:
+    """Windows resource file inventory entry.
+
+    Attributes:
+      file_version (str): file version or None if not available.
+      has_message_table (bool): True if the resource file contains a message
+          table resource.
+      language_identifiers (list[int]): language identifiers (LCIDs) of the
+          resources.
+      product_version (str): product version or None if not available.
+      volume_identifier (str): identifier of the volume that contains the
+          resource file.
+      windows_path (str): Windows path of the resource file.
+    """
+
+    def __init__(self, volume_identifier, windows_path):
+        """Initializes a Windows resource file inventory entry.
+
+        Args:
+          volume_identifier (str): identifier of the volume that contains the
+              resource file.
+          windows_path (str): Windows path of the resource file.
+        """
+        super().__init__()
+        self.file_version = None
+        self.has_message_table = False
+        self.language_identifiers = []
+        self.product_version = None
+        self.volume_identifier = volume_identifier
+        self.windows_path = windows_path
+
+
+class ResourceFileInventory:
+    """Inventory of Windows resource files.
+
+    The inventory is stored in a SQLite database file and contains, per
+    resource file, the file and product version, the language identifiers of
+    the resources and if the resource file contains a message table resource.
+    """
+
+    _CREATE_TABLE_QUERY = (
+        "CREATE TABLE IF NOT EXISTS resource_files ("
+        "volume_identifier TEXT NOT NULL, "
+        "windows_path TEXT NOT NULL, "
+        "file_version TEXT, "
+        "product_version TEXT, "
+        "language_identifiers TEXT NOT NULL, "
+        "has_message_table INTEGER NOT NULL, "
+        "PRIMARY KEY (volume_identifier, windows_path))"
+    )
+
+    _INSERT_ENTRY_QUERY = (
+        "INSERT OR REPLACE INTO resource_files "
+        "(volume_identifier, windows_path, file_version, product_version, "
+        "language_identifiers, has_message_table) "
+        "VALUES (?, ?, ?, ?, ?, ?)"
+    )
+
+    _SELECT_NUMBER_OF_ENTRIES_QUERY = "SELECT COUNT(*) FROM resource_files"
+
+    def __init__(self):
+        """Initializes an inventory of Windows resource files."""
+        super().__init__()
+        self._connection = None
+
+    def AddEntries(self, entries):
+        """Adds inventory entries.
+
+        The entries are added in a single transaction.
+
+        Args:
+          entries (list[ResourceFileInventoryEntry]): inventory entries.
+
+        Raises:
+          IOError: if not open.
+          OSError: if not open.
+        """
+        if not self._connection:
+            raise IOError("Not opened.")
+
+        with self._connection:
+            self._connection.executemany(
+                self._INSERT_ENTRY_QUERY,
+                [
+                    (
+                        entry.volume_identifier,
+                        entry.windows_path,
+                        entry.file_version,
+                        entry.product_version,
+                        ",".join(
+                            f"0x{language_identifier:04x}"
+                            for language_identifier in entry.language_identifiers
+                        ),
+                        int(entry.has_message_table),
+                    )
+                    for entry in entries
+                ],
+            )
+
+    def Close(self):
+        """Closes the inventory.
+
+        Raises:
+          IOError: if not open.
+          OSError: if not open.
+        """
+        if not self._connection:
+            raise IOError("Not opened.")
+
+        self._connection.close()
+        self._connection = None
+
+    def GetNumberOfEntries(self):
+        """Retrieves the number of inventory entries.
+
+        Returns:
+          int: number of inventory entries.
+
+        Raises:
+          IOError: if not open.
+          OSError: if not open.
+        """
+        if not self._connection:
+            raise IOError("Not opened.")
+
+        cursor = self._connection.execute(self._SELECT_NUMBER_OF_ENTRIES_QUERY)
+        number_of_entries, *_ = cursor.fetchone()
+
+        return number_of_entries
+
+    def Open(self, path):
+        """Opens the inventory.
+
+        The inventory database file is created if it does not exist.
+
+        Args:
+          path (str): path of the inventory database file.
+
+        Raises:
+          IOError: if already open.
+          OSError: if already open.
+        """
+        if self._connection:
+            raise IOError("Already open.")
+
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute(self._CREATE_TABLE_QUERY)
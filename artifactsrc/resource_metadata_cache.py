@@ -0,0 +1,229 @@
+"""Persistent cache of Windows resource file metadata."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+
+class ResourceMetadata:
+    """Windows resource file metadata.
+
+    Attributes:
+      file_version (str): file version or None if not available.
+      has_message_table (bool): True if the resource file contains a message
+          table resource.
+      language_identifiers (list[int]): language identifiers (LCIDs) of the
+          resources.
+      mui_language (str): MUI language or None if not available.
+      product_version (str): product version or None if not available.
+    """
+
+    def __init__(self):
+        """Initializes Windows resource file metadata."""
+        super().__init__()
+        self.file_version = None
+        self.has_message_table = False
+        self.language_identifiers = []
+        self.mui_language = None
+        self.product_version = None
+
+
+class ResourceMetadataCache:
+    """Persistent cache of Windows resource file metadata.
+
+    The cache is stored in a SQLite database file and maps the content identity
+    of a resource file to its metadata, hence identical system binaries on
+    different storage media images are parsed only once. The content identity
+    consists of the size of the resource file and a SHA-256 of its first and
+    last block. The first block contains the PE/COFF headers with the timestamp,
+    the checksum and the section headers of the executable, where the checksum
+    covers the entire file, and the last block typically contains the
+    Authenticode signature of a system binary. The block size is small, since
+    the identity is determined of every resource file, including the ones that
+    are cached.
+
+    Attributes:
+      number_of_cache_hits (int): number of resource files of which the
+          metadata was retrieved from the cache.
+      number_of_cache_misses (int): number of resource files of which the
+          metadata was not cached.
+    """
+
+    _BLOCK_SIZE = 4096
+
+    # Number of metadata values that is retained before it is written, since
+    # writing every value in a separate transaction is slow.
+    _MAXIMUM_NUMBER_OF_PENDING_VALUES = 256
+
+    _CREATE_TABLE_QUERY = (
+        "CREATE TABLE IF NOT EXISTS resource_metadata ("
+        "identity TEXT NOT NULL PRIMARY KEY, "
+        "metadata TEXT NOT NULL)"
+    )
+
+    _INSERT_METADATA_QUERY = (
+        "INSERT OR REPLACE INTO resource_metadata (identity, metadata) VALUES (?, ?)"
+    )
+
+    _SELECT_METADATA_QUERY = "SELECT metadata FROM resource_metadata WHERE identity = ?"
+
+    def __init__(self):
+        """Initializes a persistent cache of Windows resource file metadata."""
+        super().__init__()
+        self._connection = None
+        self._lock = threading.Lock()
+        self._pending_values = {}
+        self.number_of_cache_hits = 0
+        self.number_of_cache_misses = 0
+
+    def _WritePendingValues(self):
+        """Writes the pending metadata values to the database file.
+
+        Note that the caller is expected to hold the lock.
+        """
+        if self._pending_values:
+            with self._connection:
+                self._connection.executemany(
+                    self._INSERT_METADATA_QUERY, list(self._pending_values.items())
+                )
+
+            self._pending_values = {}
+
+    def CacheMetadata(self, identity, metadata):
+        """Caches the metadata of a resource file.
+
+        Args:
+          identity (str): content identity of the resource file.
+          metadata (ResourceMetadata): metadata of the resource file.
+
+        Raises:
+          IOError: if not open.
+          OSError: if not open.
+        """
+        if not self._connection:
+            raise IOError("Not opened.")
+
+        value = json.dumps(vars(metadata), sort_keys=True)
+
+        with self._lock:
+            self._pending_values[identity] = value
+
+            if len(self._pending_values) >= self._MAXIMUM_NUMBER_OF_PENDING_VALUES:
+                self._WritePendingValues()
+
+    def Close(self):
+        """Closes the cache.
+
+        Raises:
+          IOError: if not open.
+          OSError: if not open.
+        """
+        if not self._connection:
+            raise IOError("Not opened.")
+
+        with self._lock:
+            self._WritePendingValues()
+
+            self._connection.close()
+            self._connection = None
+
+    def Flush(self):
+        """Writes the pending metadata values to the database file.
+
+        Raises:
+          IOError: if not open.
+          OSError: if not open.
+        """
+        if not self._connection:
+            raise IOError("Not opened.")
+
+        with self._lock:
+            self._WritePendingValues()
+
+    def GetIdentity(self, file_object):
+        """Determines the content identity of a resource file.
+
+        Args:
+          file_object (dfvfs.FileIO): file-like object of the resource file.
+
+        Returns:
+          str: content identity of the resource file.
+        """
+        file_object.seek(0, os.SEEK_END)
+        file_size = file_object.tell()
+
+        hasher = hashlib.sha256()
+
+        file_object.seek(0, os.SEEK_SET)
+        hasher.update(file_object.read(self._BLOCK_SIZE))
+
+        if file_size > self._BLOCK_SIZE:
+            file_offset = max(file_size - self._BLOCK_SIZE, self._BLOCK_SIZE)
+            file_object.seek(file_offset, os.SEEK_SET)
+            hasher.update(file_object.read(self._BLOCK_SIZE))
+
+        file_object.seek(0, os.SEEK_SET)
+
+        return f"{file_size:d}:{hasher.hexdigest():s}"
+
+    def GetMetadata(self, identity):
+        """Retrieves the cached metadata of a resource file.
+
+        Args:
+          identity (str): content identity of the resource file.
+
+        Returns:
+          ResourceMetadata: metadata of the resource file or None if not cached.
+
+        Raises:
+          IOError: if not open.
+          OSError: if not open.
+        """
+        if not self._connection:
+            raise IOError("Not opened.")
+
+        with self._lock:
+            value = self._pending_values.get(identity, None)
+            if value is None:
+                cursor = self._connection.execute(
+                    self._SELECT_METADATA_QUERY, (identity,)
+                )
+                row = cursor.fetchone()
+                if row:
+                    value = row[0]
+
+            if value is None:
+                self.number_of_cache_misses += 1
+                return None
+
+            self.number_of_cache_hits += 1
+
+        metadata = ResourceMetadata()
+        for name, attribute_value in json.loads(value).items():
+            if hasattr(metadata, name):
+                setattr(metadata, name, attribute_value)
+
+        return metadata
+
+    def Open(self, path):
+        """Opens the cache.
+
+        The cache database file is created if it does not exist.
+
+        Args:
+          path (str): path of the cache database file.
+
+        Raises:
+          IOError: if already open.
+          OSError: if already open.
+        """
+        if self._connection:
+            raise IOError("Already open.")
+
+        # The cache is used by the threads that read resource files, hence the
+        # connection is shared and access to it is serialized by the lock.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(self._CREATE_TABLE_QUERY)
@@ -0,0 +1,189 @@
+"""Per storage media image sidecar cache."""
+
+import hashlib
+import json
+import os
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.lib import errors as dfvfs_errors
+from dfvfs.lib import ewf_helper as dfvfs_ewf_helper
+from dfvfs.lib import raw_helper as dfvfs_raw_helper
+from dfvfs.path import factory as dfvfs_path_spec_factory
+from dfvfs.resolver import context as dfvfs_context
+from dfvfs.resolver import resolver as dfvfs_resolver
+
+
+class SidecarCache:
+    """Per storage media image sidecar cache.
+
+    The sidecar cache stores values that are expensive to determine, such as
+    the environment variables read from the Windows Registry, in a JSON file
+    per storage media image, so that repeated scans of the same image can reuse
+    them. The sidecar files are stored in a cache directory instead of next to
+    the storage media image, which can be read-only evidence.
+
+    A storage media image is identified by the absolute path, size and
+    modification time of every segment file, such as the segment files of a
+    split RAW or EWF image, hence a modified image does not reuse stale values.
+    """
+
+    _FORMAT_VERSION = 1
+
+    def __init__(self, path):
+        """Initializes a sidecar cache.
+
+        Args:
+          path (str): path of the cache directory, which is created if it does
+              not exist.
+        """
+        super().__init__()
+        self._path = path
+        self._sidecars = {}
+
+    def _GetSegmentPaths(self, source_path):
+        """Retrieves the paths of the segment files of a storage media image.
+
+        Args:
+          source_path (str): absolute path of the storage media image.
+
+        Returns:
+          list[str]: absolute paths of the segment files, which contains only
+              the path of the storage media image if it is not split.
+        """
+        resolver_context = dfvfs_context.Context()
+
+        os_path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location=source_path
+        )
+        file_system = dfvfs_resolver.Resolver.OpenFileSystem(
+            os_path_spec, resolver_context=resolver_context
+        )
+
+        segment_path_specs = []
+        try:
+            for type_indicator, glob_function in (
+                (
+                    dfvfs_definitions.TYPE_INDICATOR_EWF,
+                    dfvfs_ewf_helper.EWFGlobPathSpec,
+                ),
+                (
+                    dfvfs_definitions.TYPE_INDICATOR_RAW,
+                    dfvfs_raw_helper.RawGlobPathSpec,
+                ),
+            ):
+                path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                    type_indicator, parent=os_path_spec
+                )
+                try:
+                    segment_path_specs = glob_function(file_system, path_spec)
+                except (IndexError, RuntimeError, dfvfs_errors.PathSpecError):
+                    segment_path_specs = []
+
+                if segment_path_specs:
+                    break
+
+        finally:
+            resolver_context.Empty()
+
+        segment_paths = [
+            segment_path_spec.location for segment_path_spec in segment_path_specs
+        ]
+        if source_path not in segment_paths:
+            segment_paths.insert(0, source_path)
+
+        return segment_paths
+
+    def _GetSidecarPath(self, source_path):
+        """Retrieves the path of the sidecar file of a storage media image.
+
+        Args:
+          source_path (str): path of the storage media image.
+
+        Returns:
+          str: path of the sidecar file.
+        """
+        source_path = os.path.abspath(source_path)
+
+        hasher = hashlib.sha256()
+        for segment_path in self._GetSegmentPaths(source_path):
+            stat_object = os.stat(segment_path)
+
+            hasher.update(segment_path.encode("utf-8", errors="surrogatepass"))
+            hasher.update(
+                f":{stat_object.st_size:d}:{stat_object.st_mtime_ns:d}\x00".encode(
+                    "utf-8"
+                )
+            )
+
+        return os.path.join(self._path, f"{hasher.hexdigest():s}.json")
+
+    def _ReadSidecar(self, source_path):
+        """Reads the sidecar of a storage media image.
+
+        Args:
+          source_path (str): path of the storage media image.
+
+        Returns:
+          dict[str, object]: values of the sidecar.
+        """
+        values = self._sidecars.get(source_path, None)
+        if values is not None:
+            return values
+
+        values = {}
+
+        sidecar_path = self._GetSidecarPath(source_path)
+        if os.path.isfile(sidecar_path):
+            try:
+                with open(sidecar_path, "r", encoding="utf-8") as file_object:
+                    sidecar = json.load(file_object)
+
+                if sidecar.get("format_version", None) == self._FORMAT_VERSION:
+                    values = sidecar.get("values", None) or {}
+
+            except (IOError, ValueError):
+                values = {}
+
+        self._sidecars[source_path] = values
+
+        return values
+
+    def GetValue(self, source_path, name):
+        """Retrieves a cached value of a storage media image.
+
+        Args:
+          source_path (str): path of the storage media image.
+          name (str): name of the value.
+
+        Returns:
+          object: value or None if not cached.
+        """
+        values = self._ReadSidecar(source_path)
+        return values.get(name, None)
+
+    def SetValue(self, source_path, name, value):
+        """Sets a cached value of a storage media image.
+
+        The sidecar file is written every time a value is set.
+
+        Args:
+          source_path (str): path of the storage media image.
+          name (str): name of the value.
+          value (object): value, which must be serializable to JSON.
+        """
+        values = self._ReadSidecar(source_path)
+        values[name] = value
+
+        os.makedirs(self._path, exist_ok=True)
+
+        sidecar = {"format_version": self._FORMAT_VERSION, "values": values}
+
+        # Write to a temporary file first so that concurrent scans never read a
+        # partially written sidecar file.
+        sidecar_path = self._GetSidecarPath(source_path)
+        temporary_path = f"{sidecar_path:s}.{os.getpid():d}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file_object:
+            json.dump(sidecar, file_object, indent=2, sort_keys=True)
+            file_object.write("\n")
+
+        os.replace(temporary_path, sidecar_path)
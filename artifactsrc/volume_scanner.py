@@ -1,17 +1,24 @@
 """Volume scanner for artifact definitions."""
 
+import collections
+import concurrent.futures
 import logging
 import os
+import re
+import threading
 import yaml
 
+from artifacts import definitions as artifacts_definitions
+
 from dfimagetools import artifact_filters
 from dfimagetools import environment_variables
-from dfimagetools import windows_registry
+from dfimagetools import resources as dfimagetools_resources
 
 from dfvfs.helpers import file_system_searcher as dfvfs_file_system_searcher
 from dfvfs.helpers import volume_scanner as dfvfs_volume_scanner
-from dfvfs.helpers import windows_path_resolver as dfvfs_windows_path_resolver
 from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.lib import errors as dfvfs_errors
+from dfvfs.resolver import context as dfvfs_context
 from dfvfs.resolver import resolver as dfvfs_resolver
 
 from dfwinreg import registry as dfwinreg_registry
@@ -19,7 +26,17 @@ from dfwinreg import registry as dfwinreg_registry
 from dtfabric import errors as dtfabric_errors
 from dtfabric.runtime import fabric as dtfabric_fabric
 
+from artifactsrc import eventlog_providers
+from artifactsrc import find_specs_cache
+from artifactsrc import message_store
+from artifactsrc import mui_file_resolver
+from artifactsrc import registry_file_cache
+from artifactsrc import registry_key_trie
 from artifactsrc import resource_file
+from artifactsrc import resource_file_inventory
+from artifactsrc import resource_metadata_cache
+from artifactsrc import sidecar_cache
+from artifactsrc import windows_path_resolver
 
 
 class CheckResults:
@@ -28,6 +45,12 @@ class CheckResults:
     Attributes:
       data_formats (set[str]): data formats that were found.
       number_of_file_entries (int): number of file entries that were found.
+      number_of_file_entries_per_volume (dict[str, int]): number of file entries
+          that were found per operating system volume identifier.
+      number_of_registry_keys (int): number of Windows Registry keys that were
+          found.
+      number_of_registry_values (int): number of Windows Registry values that
+          were found.
     """
 
     def __init__(self):
@@ -35,6 +58,150 @@ class CheckResults:
         super().__init__()
         self.data_formats = set()
         self.number_of_file_entries = 0
+        self.number_of_file_entries_per_volume = {}
+        self.number_of_registry_keys = 0
+        self.number_of_registry_values = 0
+
+
+class OperatingSystemVolume:
+    """Operating system volume.
+
+    Attributes:
+      base_path_spec (dfvfs.PathSpec): base path specification of the volume,
+          which is used to open the file system of the volume.
+      environment_collected (bool): True if the environment variables and user
+          accounts have been collected.
+      environment_variables (list[dfimagetools.EnvironmentVariable]): environment
+          variables.
+      file_system (dfvfs.FileSystem): file system.
+      file_system_searcher (dfvfs.FileSystemSearcher): file system searcher.
+      filter_generator (dfimagetools.ArtifactDefinitionFiltersGenerator):
+          artifact definition filters generator.
+      find_specs_fingerprint (str): fingerprint of the environment variables and
+          user accounts used by the filter generator.
+      identifier (str): volume identifier, such as "p1" or "p2/vss1", or an
+          empty string if the volume is not part of a volume system.
+      mount_point (dfvfs.PathSpec): mount point path specification.
+      mui_file_resolver (MUIFileResolver): MUI resource file resolver or None if
+          not a Windows volume.
+      paired_volume (OperatingSystemVolume): system volume an APFS data volume
+          is paired with or None if not paired.
+      path_resolver (WindowsPathResolver): Windows path resolver or None
+          if not a Windows volume.
+      registry_key_trie (RegistryKeyPathTrie): Windows Registry key paths trie
+          or None if not a Windows volume or not used yet.
+      resolver_context (dfvfs.Context): resolver context the file system of the
+          volume was opened with.
+      snapshot_set_identifier (str): identifier of the volume without snapshot
+          identifiers, such as "p2", which is shared by the current volume and
+          its Volume Shadow Copy (VSS) snapshots.
+      system_directories (list[str]): lower case relative paths of the operating
+          system directories that were found.
+      user_accounts (list[dfimagetools.UserAccount]): user accounts.
+      volume_group_identifier (str): identifier of the volume system that
+          contains the volume, such as "p1" for an APFS volume "p1/apfs2".
+      volume_name (str): name of the volume, such as the APFS volume name, or
+          an empty string if not available.
+      volume_role (str): role of the volume, such as "data" or "recovery" for
+          an APFS volume, or None if not known.
+      windows_directory (str): Windows directory or None if not a Windows volume.
+      windows_product_name (str): Windows product name, such as "Windows 10 Pro",
+          or None if not available.
+      windows_registry (dfwinreg.WinRegistry): Windows Registry or None if not a
+          Windows volume.
+      windows_version (str): Windows version, an empty string if it could not
+          be determined or None if not determined yet.
+    """
+
+    def __init__(self, file_system, file_system_searcher, mount_point):
+        """Initializes an operating system volume.
+
+        Args:
+          file_system (dfvfs.FileSystem): file system.
+          file_system_searcher (dfvfs.FileSystemSearcher): file system searcher.
+          mount_point (dfvfs.PathSpec): mount point path specification.
+        """
+        super().__init__()
+        self.base_path_spec = None
+        self.environment_collected = False
+        self.environment_variables = []
+        self.file_system = file_system
+        self.file_system_searcher = file_system_searcher
+        self.filter_generator = None
+        self.find_specs_fingerprint = None
+        self.identifier = ""
+        self.mount_point = mount_point
+        self.mui_file_resolver = None
+        self.paired_volume = None
+        self.path_resolver = None
+        self.registry_key_trie = None
+        self.resolver_context = None
+        self.snapshot_set_identifier = ""
+        self.system_directories = []
+        self.user_accounts = []
+        self.volume_group_identifier = ""
+        self.volume_name = ""
+        self.volume_role = None
+        self.windows_directory = None
+        self.windows_product_name = None
+        self.windows_registry = None
+        self.windows_version = None
+
+
+class ThreadLocalFileSystems:
+    """File systems of operating system volumes per thread.
+
+    dfVFS file systems and file-like objects cannot be used by multiple threads
+    concurrently, hence every thread opens the file system of a volume with its
+    own resolver context.
+    """
+
+    def __init__(self):
+        """Initializes file systems per thread."""
+        super().__init__()
+        self._lock = threading.Lock()
+        self._resolver_contexts = []
+        self._thread_state = threading.local()
+
+    def Empty(self):
+        """Empties the resolver contexts of all threads."""
+        with self._lock:
+            for resolver_context in self._resolver_contexts:
+                resolver_context.Empty()
+
+            self._resolver_contexts = []
+
+    def GetFileSystem(self, operating_system_volume):
+        """Retrieves the file system of a volume for the current thread.
+
+        Args:
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+
+        Returns:
+          dfvfs.FileSystem: file system of the volume.
+
+        Raises:
+          BackEndError: if the file system cannot be opened.
+        """
+        resolver_context = getattr(self._thread_state, "resolver_context", None)
+        if not resolver_context:
+            resolver_context = dfvfs_context.Context()
+            self._thread_state.file_systems = {}
+            self._thread_state.resolver_context = resolver_context
+
+            with self._lock:
+                self._resolver_contexts.append(resolver_context)
+
+        lookup_key = id(operating_system_volume)
+        file_system = self._thread_state.file_systems.get(lookup_key, None)
+        if not file_system:
+            file_system = dfvfs_resolver.Resolver.OpenFileSystem(
+                operating_system_volume.base_path_spec,
+                resolver_context=resolver_context,
+            )
+            self._thread_state.file_systems[lookup_key] = file_system
+
+        return file_system
 
 
 class ArtifactDefinitionsVolumeScanner(dfvfs_volume_scanner.VolumeScanner):
@@ -48,55 +215,81 @@ class ArtifactDefinitionsVolumeScanner(dfvfs_volume_scanner.VolumeScanner):
 
     _DEFINITION_FILES_PATH = os.path.dirname(__file__)
 
-    _SYSTEM_DIRECTORY_FIND_SPECS = [
-        dfvfs_file_system_searcher.FindSpec(
-            case_sensitive=False, location="/sbin", location_separator="/"
-        ),
-        dfvfs_file_system_searcher.FindSpec(
-            case_sensitive=False, location="/System/Library", location_separator="/"
-        ),
-        dfvfs_file_system_searcher.FindSpec(
-            case_sensitive=False,
-            location="\\Windows\\System32",
-            location_separator="\\",
-        ),
-        dfvfs_file_system_searcher.FindSpec(
-            case_sensitive=False, location="\\WINNT\\System32", location_separator="\\"
-        ),
-        dfvfs_file_system_searcher.FindSpec(
-            case_sensitive=False,
-            location="\\WINNT35\\System32",
-            location_separator="\\",
-        ),
-        dfvfs_file_system_searcher.FindSpec(
-            case_sensitive=False, location="\\WTSRV\\System32", location_separator="\\"
-        ),
-    ]
+    # Names of the known roles of APFS volumes, which are also the names of
+    # the corresponding volumes, such as "Preboot".
+    _APFS_VOLUME_ROLES = frozenset(
+        ["data", "hardware", "preboot", "recovery", "update", "vm", "xart"]
+    )
+
+    # Roles of APFS volumes that do not contain an operating system and are
+    # therefore not scanned.
+    _APFS_VOLUME_ROLES_TO_SKIP = _APFS_VOLUME_ROLES - frozenset(["data"])
+
+    _APFS_DATA_VOLUME_SUFFIX = " - data"
+
+    _UUID_RE = re.compile(
+        r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.I
+    )
+
+    # Directories in the macOS users directory that are not user directories.
+    _MACOS_SHARED_USER_DIRECTORIES = frozenset(["Guest", "Shared"])
+
+    _MACOS_SYSTEM_DIRECTORIES = frozenset(["/system/library", "\\system\\library"])
+
+    _WINDOWS_NT_CURRENT_VERSION_KEY_PATH = (
+        "HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Windows NT\\CurrentVersion"
+    )
 
-    # We need to check for both forward and backward slashes since the path
-    # specification will be dfVFS back-end dependent.
-    _WINDOWS_SYSTEM_DIRECTORIES = set(
+    _REGISTRY_SOURCE_TYPES = frozenset(
         [
-            "/windows/system32",
-            "\\windows\\system32",
-            "/winnt/system32",
-            "\\winnt\\system32",
-            "/winnt35/system32",
-            "\\winnt35\\system32",
-            "/wtsrv/system32",
-            "\\wtsrv\\system32",
+            artifacts_definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_KEY,
+            artifacts_definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_VALUE,
         ]
     )
 
-    _WINDOWS_DIRECTORIES = frozenset(
+    _PROFILE_LIST_KEY_PATH = (
+        "HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Windows NT\\CurrentVersion\\"
+        "ProfileList"
+    )
+
+    # Path segments of the operating system directories.
+    _SYSTEM_DIRECTORIES = [
+        ("sbin",),
+        ("System", "Library"),
+        ("Windows", "System32"),
+        ("WINNT", "System32"),
+        ("WINNT35", "System32"),
+        ("WTSRV", "System32"),
+    ]
+
+    _WINDOWS_SYSTEM_DIRECTORIES = frozenset(
         [
-            "C:\\Windows",
-            "C:\\WINNT",
-            "C:\\WTSRV",
-            "C:\\WINNT35",
+            ("windows", "system32"),
+            ("winnt", "system32"),
+            ("winnt35", "system32"),
+            ("wtsrv", "system32"),
         ]
     )
 
+    # Maximum number of threads used to scan multiple volumes and to check an
+    # artifact definition on multiple operating system volumes.
+    _MAXIMUM_NUMBER_OF_VOLUME_THREADS = 4
+
+    # Maximum number of threads used to read resource files in inventory mode.
+    _MAXIMUM_NUMBER_OF_RESOURCE_FILE_THREADS = 8
+
+    _RESOURCE_FILE_EXTENSIONS = frozenset([".dll", ".exe", ".sys"])
+
+    # Number of message files added to the message store per transaction.
+    _MESSAGE_STORE_BATCH_SIZE = 100
+
+    _RESOURCE_FILE_INVENTORY_BATCH_SIZE = 1000
+
+    _RESOURCE_FILE_WINDOWS_PATHS = (
+        "%SystemRoot%\\System32",
+        "%SystemRoot%\\SysWOW64",
+    )
+
     _FORMAT_VERSION_STRING = {
         "bplist": "bplist 0x{format_version:s}",
         "esedb": "esedb 0x{format_version:x}",
@@ -107,7 +300,14 @@ class ArtifactDefinitionsVolumeScanner(dfvfs_volume_scanner.VolumeScanner):
         "scca": "scca {format_version:d}",
     }
 
-    def __init__(self, artifacts_registry, mediator=None):
+    def __init__(
+        self,
+        artifacts_registry,
+        mediator=None,
+        find_specs_cache_object=None,
+        resource_metadata_cache_object=None,
+        sidecar_cache_path=None,
+    ):
         """Initializes an artifact definitions volume scanner.
 
         Args:
@@ -115,23 +315,50 @@ class ArtifactDefinitionsVolumeScanner(dfvfs_volume_scanner.VolumeScanner):
               definitions registry.
           mediator (Optional[dfvfs.VolumeScannerMediator]): a volume scanner
               mediator.
+          find_specs_cache_object (Optional[FindSpecsCache]): in-memory find
+              specifications cache, which can be shared between scanners in
+              the same process that use the same artifact definitions registry.
+          resource_metadata_cache_object (Optional[ResourceMetadataCache]): open
+              persistent cache of resource file metadata, which can be shared
+              between scanners.
+          sidecar_cache_path (Optional[str]): path of the directory of the per
+              storage media image sidecar cache, where None represents no
+              sidecar cache.
         """
         super().__init__(mediator=mediator)
         self._ascii_codepage = "cp1252"
         self._artifacts_registry = artifacts_registry
+        self._checked_file_entries_lock = threading.Lock()
         self._checks_definitions = None
         self._data_location = os.path.join("data")
         self._data_type_fabric = self._ReadDataTypeFabricDefinitionFile("formats.yaml")
         self._data_type_maps = {}
-        self._environment_variables = []
-        self._file_system = None
-        self._file_system_searcher = None
-        self._filter_generator = None
-        self._mount_point = None
+        self._definitions_with_path_variables = {}
+        self._find_specs_cache = (
+            find_specs_cache_object or find_specs_cache.FindSpecsCache()
+        )
+        self._message_resource_file_pool = None
+        self._operating_system_volumes = []
+        self._path_resolution_cache = windows_path_resolver.PathResolutionCache()
         self._path_resolver = None
-        self._preferred_language_identifier = "en-US"
+        self._preferred_language = "en-US"
+        self._preferred_language_identifier = 0x0409
+        self._registry_file_cache = registry_file_cache.RegistryFileCache()
+        self._resource_metadata_cache = resource_metadata_cache_object
+        self._sidecar_cache = None
+        self._volumes_executor = None
         self._windows_directory = None
         self._windows_registry = None
+        self._windows_volume = None
+
+        self._message_resource_file_pool = resource_file.MessageResourceFilePool(
+            ascii_codepage=self._ascii_codepage,
+            preferred_language_identifier=self._preferred_language_identifier,
+            maximum_number_of_files=self._MAXIMUM_NUMBER_OF_RESOURCE_FILE_THREADS,
+        )
+
+        if sidecar_cache_path:
+            self._sidecar_cache = sidecar_cache.SidecarCache(sidecar_cache_path)
 
     def _DetermineDataFormat(self, names, file_object):
         """Determines the data format.
@@ -185,34 +412,294 @@ class ArtifactDefinitionsVolumeScanner(dfvfs_volume_scanner.VolumeScanner):
 
         return data_type_map
 
-    def _OpenMessageResourceFile(self, windows_path):
-        """Opens the message resource file specified by the Windows path.
+    def _GetResourceFileEntries(self, operating_system_volume, windows_paths):
+        """Retrieves the resource files in directories of a Windows volume.
+
+        The directories are traversed recursively and the resource files are
+        selected on their extension.
+
+        Args:
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+          windows_paths (list[str]): Windows paths of the directories.
+
+        Yields:
+          tuple[str, dfvfs.PathSpec]: Windows path and path specification of a
+              resource file.
+        """
+        path_resolver = operating_system_volume.path_resolver
+
+        directories = []
+        for windows_path in windows_paths:
+            path_spec = path_resolver.ResolvePath(windows_path)
+            if path_spec is None:
+                continue
+
+            file_entry = operating_system_volume.file_system.GetFileEntryByPathSpec(
+                path_spec
+            )
+            if file_entry and file_entry.IsDirectory():
+                directories.append(
+                    (
+                        path_resolver.GetWindowsPath(path_spec) or windows_path,
+                        file_entry,
+                    )
+                )
+
+        while directories:
+            windows_path, file_entry = directories.pop(0)
+
+            for sub_file_entry in file_entry.sub_file_entries:
+                if not sub_file_entry.IsAllocated():
+                    continue
+
+                sub_windows_path = "\\".join([windows_path, sub_file_entry.name])
+                if sub_file_entry.IsDirectory():
+                    directories.append((sub_windows_path, sub_file_entry))
+
+                elif sub_file_entry.IsFile():
+                    _, _, extension = sub_file_entry.name.rpartition(".")
+                    if f".{extension.lower():s}" in self._RESOURCE_FILE_EXTENSIONS:
+                        yield sub_windows_path, sub_file_entry.path_spec
+
+    def _ReadResourceFileInventoryEntry(
+        self, windows_path, file_object, operating_system_volume
+    ):
+        """Reads the inventory entry of a resource file.
 
         Args:
-          windows_path (str): Windows path containing the message resource
-              filename.
+          windows_path (str): Windows path of the resource file.
+          file_object (dfvfs.FileIO): file-like object of the resource file.
+          operating_system_volume (OperatingSystemVolume): operating system volume.
 
         Returns:
-          MessageResourceFile: message resource file or None.
+          ResourceFileInventoryEntry: inventory entry or None if the resource file
+              cannot be read.
         """
-        path_spec = self._path_resolver.ResolvePath(windows_path)
-        if path_spec is None:
+        metadata = self._ReadResourceMetadata(windows_path, file_object)
+        if not metadata:
+            return None
+
+        entry = resource_file_inventory.ResourceFileInventoryEntry(
+            operating_system_volume.identifier, windows_path
+        )
+        entry.file_version = metadata.file_version
+        entry.has_message_table = metadata.has_message_table
+        entry.language_identifiers = metadata.language_identifiers
+        entry.product_version = metadata.product_version
+
+        return entry
+
+    def _ReadMessageFile(
+        self, windows_path, file_object, operating_system_volume, store
+    ):
+        """Reads the messages of a message file.
+
+        Args:
+          windows_path (str): Windows path of the message file.
+          file_object (dfvfs.FileIO): file-like object of the message file.
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+          store (MessageStore): message store, used to determine if the
+              messages of the message file are already stored.
+
+        Returns:
+          MessageFile: message file or None if the resource file does not contain
+              a message table or cannot be read.
+        """
+        message_file = message_store.MessageFile(
+            operating_system_volume.identifier, windows_path
+        )
+
+        try:
+            with self._message_resource_file_pool.OpenFileObject(
+                windows_path, file_object
+            ) as message_resource_file:
+                if not message_resource_file.HasMessageTableResource():
+                    return None
+
+                message_file.file_version = message_resource_file.file_version
+
+                # Note that the Windows path of a message file that is already
+                # stored is still added to the message store.
+                if not store.HasMessageFile(
+                    message_file.name, message_file.file_version
+                ):
+                    message_file.messages = list(message_resource_file.GetMessages())
+
+        except IOError as exception:
+            logging.debug(f"Unable to read: {windows_path:s} with error: {exception!s}")
+            return None
+
+        return message_file
+
+    def _ReadResourceFile(
+        self,
+        file_systems,
+        read_function,
+        operating_system_volume,
+        windows_path,
+        path_spec,
+        *arguments,
+    ):
+        """Reads a resource file with the file system of the current thread.
+
+        Args:
+          file_systems (ThreadLocalFileSystems): file systems per thread.
+          read_function (function): function that reads a resource file and is
+              called with the Windows path and the file-like object of the
+              resource file and the additional arguments.
+          operating_system_volume (OperatingSystemVolume): operating system volume
+              that contains the resource file.
+          windows_path (str): Windows path of the resource file.
+          path_spec (dfvfs.PathSpec): path specification of the resource file.
+          arguments (list[object]): additional arguments of the read function.
+
+        Returns:
+          object: result of the read function or None if the resource file cannot
+              be opened.
+        """
+        try:
+            file_system = file_systems.GetFileSystem(operating_system_volume)
+            file_object = file_system.GetFileObjectByPathSpec(path_spec)
+        except (IOError, dfvfs_errors.Error) as exception:
+            logging.debug(f"Unable to open: {windows_path:s} with error: {exception!s}")
+            return None
+
+        if file_object is None:
+            return None
+
+        try:
+            return read_function(windows_path, file_object, *arguments)
+        finally:
+            file_object.close()
+
+    def _ReadResourceFiles(self, read_function, windows_paths, *arguments):
+        """Reads the resource files of the Windows volumes concurrently.
+
+        Args:
+          read_function (function): function that reads a resource file and is
+              called with the Windows path and the file-like object of the
+              resource file, the operating system volume that contains the
+              resource file and the additional arguments.
+          windows_paths (list[str]): Windows paths of the directories that
+              contain the resource files.
+          arguments (list[object]): additional arguments of the read function.
+
+        Yields:
+          object: result of the read function, where None results are omitted,
+              in the order of the resource files.
+        """
+        # The number of pending reads is limited, such that a directory with many
+        # resource files does not result in many pending results.
+        maximum_number_of_pending_reads = (
+            self._MAXIMUM_NUMBER_OF_RESOURCE_FILE_THREADS * 4
+        )
+
+        pending_reads = collections.deque()
+
+        # Every thread reads the resource files with its own file system, since
+        # the file system of the volume cannot be shared between threads.
+        file_systems = ThreadLocalFileSystems()
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._MAXIMUM_NUMBER_OF_RESOURCE_FILE_THREADS
+            ) as executor:
+                for operating_system_volume in self._operating_system_volumes:
+                    if not operating_system_volume.path_resolver:
+                        continue
+
+                    for windows_path, path_spec in self._GetResourceFileEntries(
+                        operating_system_volume, windows_paths
+                    ):
+                        pending_reads.append(
+                            executor.submit(
+                                self._ReadResourceFile,
+                                file_systems,
+                                read_function,
+                                operating_system_volume,
+                                windows_path,
+                                path_spec,
+                                operating_system_volume,
+                                *arguments,
+                            )
+                        )
+
+                        while len(pending_reads) >= maximum_number_of_pending_reads or (
+                            pending_reads and pending_reads[0].done()
+                        ):
+                            result = pending_reads.popleft().result()
+                            if result:
+                                yield result
+
+                while pending_reads:
+                    result = pending_reads.popleft().result()
+                    if result:
+                        yield result
+
+        finally:
+            file_systems.Empty()
+
+    def _ReadResourceMetadata(self, windows_path, file_object):
+        """Reads the metadata of a resource file.
+
+        The metadata is retrieved from the resource metadata cache, if available,
+        otherwise the resource file is parsed and its metadata is cached.
+
+        Args:
+          windows_path (str): Windows path of the resource file.
+          file_object (dfvfs.FileIO): file-like object of the resource file.
+
+        Returns:
+          ResourceMetadata: metadata of the resource file or None if the resource
+              file cannot be read.
+        """
+        identity = None
+        if self._resource_metadata_cache:
+            try:
+                identity = self._resource_metadata_cache.GetIdentity(file_object)
+            except IOError as exception:
+                logging.debug(
+                    f"Unable to read: {windows_path:s} with error: {exception!s}"
+                )
+                return None
+
+            metadata = self._resource_metadata_cache.GetMetadata(identity)
+            if metadata:
+                return metadata
+
+        try:
+            with self._message_resource_file_pool.OpenFileObject(
+                windows_path, file_object
+            ) as message_file:
+                metadata = resource_metadata_cache.ResourceMetadata()
+                metadata.file_version = message_file.file_version
+                metadata.has_message_table = message_file.HasMessageTableResource()
+                metadata.language_identifiers = message_file.GetLanguageIdentifiers()
+                metadata.mui_language = message_file.GetMUILanguage()
+                metadata.product_version = message_file.product_version
+
+        except IOError as exception:
+            logging.debug(f"Unable to read: {windows_path:s} with error: {exception!s}")
             return None
 
-        return self._OpenMessageResourceFileByPathSpec(path_spec)
+        if identity:
+            self._resource_metadata_cache.CacheMetadata(identity, metadata)
+
+        return metadata
 
-    def _OpenMessageResourceFileByPathSpec(self, path_spec):
-        """Opens the message resource file specified by the path specification.
+    def _ReadResourceMetadataByWindowsPath(self, windows_path):
+        """Reads the metadata of the resource file specified by the Windows path.
 
         Args:
-          path_spec (dfvfs.PathSpec): path specification.
+          windows_path (str): Windows path of the resource file.
 
         Returns:
-          MessageResourceFile: message resource file or None.
+          ResourceMetadata: metadata of the resource file or None if the resource
+              file cannot be read.
         """
-        windows_path = self._path_resolver.GetWindowsPath(path_spec)
-        if windows_path is None:
-            logging.warning("Unable to retrieve Windows path.")
+        path_spec = self._path_resolver.ResolvePath(windows_path)
+        if path_spec is None:
+            return None
 
         try:
             file_object = dfvfs_resolver.Resolver.OpenFileObject(path_spec)
@@ -220,19 +707,15 @@ class ArtifactDefinitionsVolumeScanner(dfvfs_volume_scanner.VolumeScanner):
             logging.warning(
                 f"Unable to open: {path_spec.comparable:s} with error: {exception!s}"
             )
-            file_object = None
+            return None
 
         if file_object is None:
             return None
 
-        message_file = resource_file.MessageResourceFile(
-            windows_path,
-            ascii_codepage=self._ascii_codepage,
-            preferred_language_identifier=self._preferred_language_identifier,
-        )
-        message_file.OpenFileObject(file_object)
-
-        return message_file
+        try:
+            return self._ReadResourceMetadata(windows_path, file_object)
+        finally:
+            file_object.close()
 
     def _ReadChecksDefinitions(self):
         """Reads the checks definitions from checks.yaml.
@@ -300,171 +783,1454 @@ class ArtifactDefinitionsVolumeScanner(dfvfs_volume_scanner.VolumeScanner):
 
         return structure_values
 
-    def CheckArtifactDefinition(self, artifact_definition):
-        """Checks if an artifact definition on a storage media image.
+    def _CheckArtifactDefinitionOnVolume(
+        self,
+        operating_system_volume,
+        find_specs,
+        check_definition,
+        checked_file_entries,
+    ):
+        """Checks an artifact definition on an operating system volume.
+
+        File entries that are unchanged between the current volume and its
+        snapshots are only checked for their data format once.
 
         Args:
-          artifact_definition (artifacts.ArtifactDefinition): artifact definition.
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+          find_specs (list[dfvfs.FindSpec]): find specifications of the artifact
+              definition.
+          check_definition (dict[str, object]): checks definition of the artifact
+              definition or None if not available.
+          checked_file_entries (set[tuple[str, int, str, int]]): identities of the
+              file entries of which the data format was checked, which is shared
+              by the operating system volumes.
 
         Returns:
           CheckResults: check results.
         """
         check_result = CheckResults()
 
-        if self._checks_definitions is None:
-            self._checks_definitions = self._ReadChecksDefinitions()
+        file_system = operating_system_volume.file_system
+        file_system_searcher = operating_system_volume.file_system_searcher
 
-        find_specs = list(
-            self._filter_generator.GetFindSpecs([artifact_definition.name])
-        )
-        if find_specs:
-            path_specs = list(self._file_system_searcher.Find(find_specs=find_specs))
-            check_result.number_of_file_entries = len(path_specs)
+        path_specs = list(file_system_searcher.Find(find_specs=find_specs))
+        check_result.number_of_file_entries = len(path_specs)
 
-            check_definition = self._checks_definitions.get(
-                artifact_definition.name.lower(), None
-            )
-            if check_definition:
-                for path_spec in path_specs:
-                    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
-                    if file_entry.size > 0:
-                        file_object = file_entry.GetFileObject()
-                        if file_object:
+        if check_definition:
+            for path_spec in path_specs:
+                file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+                if file_entry.size > 0:
+                    file_entry_identity = self._GetFileEntryIdentity(
+                        operating_system_volume, file_entry
+                    )
+                    if file_entry_identity:
+                        with self._checked_file_entries_lock:
+                            if file_entry_identity in checked_file_entries:
+                                continue
+
+                            checked_file_entries.add(file_entry_identity)
+
+                    file_object = file_entry.GetFileObject()
+                    if file_object:
+                        try:
                             formats = check_definition.get("formats", [])
                             data_format = self._DetermineDataFormat(
                                 formats, file_object
                             )
-                            check_result.data_formats.add(data_format or "unknown")
+                        finally:
+                            file_object.close()
+
+                        check_result.data_formats.add(data_format or "unknown")
 
         return check_result
 
-    def GetWindowsVersion(self):
-        """Determines the Windows version from kernel executable file.
+    def _GetAPFSVolumeRole(self, volume_name, root_file_entry):
+        """Determines the role of an APFS volume.
+
+        The role is determined from the volume name and, if the name is not
+        conclusive, from marker paths in the root directory of the volume.
+
+        Args:
+          volume_name (str): name of the APFS volume.
+          root_file_entry (dfvfs.FileEntry): root file entry of the volume or None
+              if the volume has no root directory.
 
         Returns:
-          str: Windows version or None otherwise.
+          str: role of the APFS volume, such as "data", "preboot", "recovery" or
+              "vm", or None if not known.
         """
-        # Window NT variants.
-        kernel_executable_path = "\\".join(
-            [self._windows_directory, "System32", "ntoskrnl.exe"]
-        )
-        message_file = self._OpenMessageResourceFile(kernel_executable_path)
+        lower_case_volume_name = volume_name.lower()
 
-        if not message_file:
-            # Window 9x variants.
-            kernel_executable_path = "\\".join(
-                [self._windows_directory, "System32", "\\kernel32.dll"]
-            )
-            message_file = self._OpenMessageResourceFile(kernel_executable_path)
+        if lower_case_volume_name in self._APFS_VOLUME_ROLES:
+            return lower_case_volume_name
+
+        if lower_case_volume_name.endswith(self._APFS_DATA_VOLUME_SUFFIX):
+            return "data"
 
-        if not message_file:
+        if not root_file_entry:
             return None
 
-        return message_file.file_version
+        names = [
+            sub_file_entry.name.lower()
+            for sub_file_entry in root_file_entry.sub_file_entries
+            if not sub_file_entry.name.startswith(".")
+        ]
+        if "sleepimage" in names or any(name.startswith("swapfile") for name in names):
+            return "vm"
 
-    def ScanForOperatingSystemVolumes(self, source_path, options=None):
-        """Scans for volumes containing an operating system.
+        if "com.apple.recovery.boot" in names:
+            return "recovery"
+
+        # The root directory of the Preboot and the Recovery volumes contains
+        # a directory per volume group, named after the volume group UUID.
+        if names and all(self._UUID_RE.match(name) for name in names):
+            return "preboot"
+
+        return None
+
+    def _GetPairedSystemVolume(self, data_volume, operating_system_volumes):
+        """Retrieves the system volume an APFS data volume is paired with.
+
+        The data volume is paired with a system volume in the same APFS container
+        with the same name without the " - Data" suffix, or otherwise with the
+        only volume with operating system directories in the container.
 
         Args:
-          source_path (str): source path.
-          options (Optional[dfvfs.VolumeScannerOptions]): volume scanner options.
-              If None the default volume scanner options are used, which are defined
-              in the VolumeScannerOptions class.
+          data_volume (OperatingSystemVolume): APFS data volume.
+          operating_system_volumes (list[OperatingSystemVolume]): scanned volumes.
 
         Returns:
-          bool: True if a volume with an operating system was found.
+          OperatingSystemVolume: paired system volume or None if not available.
+        """
+        system_volumes = [
+            operating_system_volume
+            for operating_system_volume in operating_system_volumes
+            if operating_system_volume is not data_volume
+            and operating_system_volume.system_directories
+            and operating_system_volume.volume_role is None
+            and operating_system_volume.volume_group_identifier
+            == data_volume.volume_group_identifier
+        ]
 
-        Raises:
-          ScannerError: if the source path does not exists, or if the source path
-              is not a file or directory, or if the format of or within the source
-              file is not supported.
+        lower_case_volume_name = data_volume.volume_name.lower()
+        if lower_case_volume_name.endswith(self._APFS_DATA_VOLUME_SUFFIX):
+            system_volume_name = lower_case_volume_name[
+                : -len(self._APFS_DATA_VOLUME_SUFFIX)
+            ]
+            for system_volume in system_volumes:
+                if system_volume.volume_name.lower() == system_volume_name:
+                    return system_volume
+
+        if len(system_volumes) == 1:
+            return system_volumes[0]
+
+        return None
+
+    def _FindSystemDirectories(self, root_file_entry):
+        """Finds operating system directories.
+
+        The operating system directories are resolved one path segment at a
+        time, case-insensitively, which stops at the first path segment that
+        does not exist. The sub file entries of every directory are read only
+        once, such that the root directory is listed only once.
+
+        Args:
+          root_file_entry (dfvfs.FileEntry): root file entry of the file system.
+
+        Returns:
+          list[list[str]]: path segments of the operating system directories that
+              were found, where the path segments contain the names as stored in
+              the file system.
         """
-        if not options:
-            options = dfvfs_volume_scanner.VolumeScannerOptions()
+        sub_file_entries_per_directory = {}
+
+        system_directories = []
+        for path_segments in self._SYSTEM_DIRECTORIES:
+            file_entry = root_file_entry
+            names = []
+            for path_segment in path_segments:
+                lookup_key = tuple(names)
+                sub_file_entries = sub_file_entries_per_directory.get(lookup_key, None)
+                if sub_file_entries is None:
+                    sub_file_entries = {}
+                    for sub_file_entry in file_entry.sub_file_entries:
+                        if sub_file_entry.IsAllocated():
+                            sub_file_entries.setdefault(
+                                sub_file_entry.name.lower(), sub_file_entry
+                            )
 
-        scan_context = self._ScanSource(source_path)
+                    sub_file_entries_per_directory[lookup_key] = sub_file_entries
 
-        self._source_path = source_path
-        self._source_type = scan_context.source_type
+                file_entry = sub_file_entries.get(path_segment.lower(), None)
+                if not file_entry:
+                    break
 
-        base_path_specs = self._GetBasePathSpecs(scan_context, options)
+                names.append(file_entry.name)
 
-        if (
-            not base_path_specs
-            or scan_context.source_type == dfvfs_definitions.SOURCE_TYPE_FILE
-        ):
-            return False
+            if len(names) == len(path_segments):
+                system_directories.append(names)
 
-        for path_spec in base_path_specs:
-            file_system = dfvfs_resolver.Resolver.OpenFileSystem(path_spec)
+        return system_directories
 
-            if path_spec.type_indicator == dfvfs_definitions.TYPE_INDICATOR_OS:
-                mount_point = path_spec
-            else:
-                mount_point = path_spec.parent
+    def _CheckArtifactDefinitionInRegistry(
+        self, operating_system_volume, registry_sources
+    ):
+        """Checks the Windows Registry sources of an artifact definition.
+
+        Args:
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+          registry_sources (list[artifacts.SourceType]): Windows Registry key and
+              value sources.
 
-            file_system_searcher = dfvfs_file_system_searcher.FileSystemSearcher(
-                file_system, mount_point
+        Returns:
+          tuple[int, int]: number of Windows Registry keys and values that were
+              found.
+        """
+        if not operating_system_volume.registry_key_trie:
+            operating_system_volume.registry_key_trie = (
+                registry_key_trie.RegistryKeyPathTrie(
+                    operating_system_volume.windows_registry
+                )
             )
 
-            system_directories = []
-            for system_directory_path_spec in file_system_searcher.Find(
-                find_specs=self._SYSTEM_DIRECTORY_FIND_SPECS
+        trie = operating_system_volume.registry_key_trie
+        user_accounts = operating_system_volume.user_accounts
+
+        number_of_keys = 0
+        number_of_values = 0
+        for source in registry_sources:
+            if (
+                source.type_indicator
+                == artifacts_definitions.TYPE_INDICATOR_WINDOWS_REGISTRY_KEY
             ):
-                relative_path = file_system_searcher.GetRelativePath(
-                    system_directory_path_spec
-                )
-                if relative_path:
-                    system_directories.append(relative_path.lower())
+                for key_path in source.keys:
+                    for expanded_key_path in self._ExpandRegistryKeyPath(
+                        key_path, user_accounts
+                    ):
+                        number_of_keys += len(trie.GetKeysByPath(expanded_key_path))
 
-            if system_directories or len(base_path_specs) == 1:
-                self._file_system_searcher = file_system_searcher
-                self._file_system = file_system
-                self._mount_point = mount_point
+            else:
+                for key_value_pair in source.key_value_pairs:
+                    value_name = key_value_pair["value"]
+                    for expanded_key_path in self._ExpandRegistryKeyPath(
+                        key_value_pair["key"], user_accounts
+                    ):
+                        for registry_key in trie.GetKeysByPath(expanded_key_path):
+                            number_of_keys += 1
+                            if registry_key.GetValueByName(value_name):
+                                number_of_values += 1
 
-            if self._WINDOWS_SYSTEM_DIRECTORIES.intersection(set(system_directories)):
-                path_resolver = dfvfs_windows_path_resolver.WindowsPathResolver(
-                    file_system, mount_point
-                )
+        return number_of_keys, number_of_values
+
+    def _CloseOperatingSystemVolumes(self, operating_system_volumes):
+        """Closes operating system volumes.
+
+        The Windows Registry files, file systems and file objects of the volumes
+        are released and the resolver contexts of the volumes are emptied.
 
-                # TODO: determine Windows directory based on system directories.
-                windows_directory = None
-                for windows_path in self._WINDOWS_DIRECTORIES:
-                    windows_path_spec = path_resolver.ResolvePath(windows_path)
-                    if windows_path_spec is not None:
-                        windows_directory = windows_path
-                        break
+        Args:
+          operating_system_volumes (list[OperatingSystemVolume]): operating system
+              volumes.
+        """
+        for operating_system_volume in operating_system_volumes:
+            # Note that dfwinreg closes the Windows Registry files when the
+            # Windows Registry object is released.
+            operating_system_volume.filter_generator = None
+            operating_system_volume.mui_file_resolver = None
+            operating_system_volume.paired_volume = None
+            operating_system_volume.path_resolver = None
+            operating_system_volume.registry_key_trie = None
+            operating_system_volume.windows_registry = None
+
+            operating_system_volume.file_system_searcher = None
+            operating_system_volume.file_system = None
+
+            if operating_system_volume.resolver_context:
+                operating_system_volume.resolver_context.Empty()
+                operating_system_volume.resolver_context = None
+
+    def _CollectEnvironment(self, operating_system_volume):
+        """Collects the environment of an operating system volume.
+
+        The environment variables and user accounts are read from the Windows
+        Registry or the users directory of a macOS volume, or from the sidecar
+        cache if the storage media image was scanned before.
 
-                if windows_directory:
+        Args:
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+        """
+        operating_system_volume.environment_variables = self._GetCachedResources(
+            operating_system_volume,
+            "environment_variables",
+            dfimagetools_resources.EnvironmentVariable,
+            self._CollectEnvironmentVariables,
+        )
+        operating_system_volume.user_accounts = self._GetCachedResources(
+            operating_system_volume,
+            "user_accounts",
+            dfimagetools_resources.UserAccount,
+            self._CollectUserAccounts,
+        )
+        operating_system_volume.environment_collected = True
+
+        # The Windows path resolver uses the collected environment variables,
+        # such as %ProgramFiles%, to resolve paths, but the Windows directory
+        # determined from the volume takes precedence over %SystemRoot% and
+        # %WinDir%.
+        path_resolver = operating_system_volume.path_resolver
+        if path_resolver:
+            for environment_variable in operating_system_volume.environment_variables:
+                name = environment_variable.name.strip("%")
+                if name.upper() not in ("SYSTEMROOT", "WINDIR") and isinstance(
+                    environment_variable.value, str
+                ):
                     path_resolver.SetEnvironmentVariable(
-                        "SystemRoot", windows_directory
+                        name, environment_variable.value
                     )
-                    path_resolver.SetEnvironmentVariable("WinDir", windows_directory)
 
-                    registry_file_reader = (
-                        windows_registry.StorageMediaImageWindowsRegistryFileReader(
-                            file_system, path_resolver
-                        )
-                    )
-                    winregistry = dfwinreg_registry.WinRegistry(
-                        registry_file_reader=registry_file_reader
-                    )
+        self._SetFilterGenerator(operating_system_volume)
 
-                    collector = (
-                        environment_variables.WindowsEnvironmentVariablesCollector()
-                    )
+    def _CollectEnvironmentVariables(self, operating_system_volume):
+        """Collects the environment variables of an operating system volume.
 
-                    self._environment_variables = list(collector.Collect(winregistry))
-                    self._path_resolver = path_resolver
-                    self._windows_directory = windows_directory
-                    self._windows_registry = winregistry
+        Args:
+          operating_system_volume (OperatingSystemVolume): operating system volume.
 
-            if system_directories:
-                # TODO: on Mac OS prevent detecting the Recovery volume.
-                break
+        Returns:
+          list[dfimagetools.EnvironmentVariable]: environment variables.
+        """
+        if not operating_system_volume.windows_registry:
+            return []
+
+        collector = environment_variables.WindowsEnvironmentVariablesCollector()
+        return list(collector.Collect(operating_system_volume.windows_registry))
+
+    def _CollectMacOSUserAccounts(self, operating_system_volume):
+        """Collects the user accounts of a macOS volume from the users directory.
+
+        Args:
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+
+        Returns:
+          list[dfimagetools.UserAccount]: user accounts.
+        """
+        root_file_entry = self._GetRootFileEntry(operating_system_volume)
+        if not root_file_entry:
+            return []
 
-        self._filter_generator = artifact_filters.ArtifactDefinitionFiltersGenerator(
-            self._artifacts_registry, self._environment_variables, []
+        users_file_entry = root_file_entry.GetSubFileEntryByName(
+            "Users", case_sensitive=False
         )
+        if not users_file_entry:
+            return []
+
+        user_accounts = []
+        for sub_file_entry in users_file_entry.sub_file_entries:
+            username = sub_file_entry.name
+            if (
+                not sub_file_entry.IsDirectory()
+                or username.startswith(".")
+                or username in self._MACOS_SHARED_USER_DIRECTORIES
+            ):
+                continue
+
+            user_accounts.append(
+                dfimagetools_resources.UserAccount(
+                    user_directory="/".join(["", users_file_entry.name, username]),
+                    user_directory_path_separator="/",
+                    username=username,
+                )
+            )
+
+        return sorted(user_accounts, key=lambda user_account: user_account.username)
+
+    def _CollectUserAccounts(self, operating_system_volume):
+        """Collects the user accounts of an operating system volume.
+
+        Args:
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+
+        Returns:
+          list[dfimagetools.UserAccount]: user accounts.
+        """
+        if operating_system_volume.windows_registry:
+            return self._CollectWindowsUserAccounts(operating_system_volume)
+
+        if operating_system_volume.volume_role == "data" or (
+            self._MACOS_SYSTEM_DIRECTORIES.intersection(
+                operating_system_volume.system_directories
+            )
+        ):
+            return self._CollectMacOSUserAccounts(operating_system_volume)
+
+        return []
+
+    def _CollectWindowsUserAccounts(self, operating_system_volume):
+        """Collects the user accounts of a Windows volume from the ProfileList.
+
+        Args:
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+
+        Returns:
+          list[dfimagetools.UserAccount]: user accounts.
+        """
+        registry_key = operating_system_volume.windows_registry.GetKeyByPath(
+            self._PROFILE_LIST_KEY_PATH
+        )
+        if not registry_key:
+            return []
+
+        user_accounts = []
+        for profile_key in registry_key.GetSubkeys():
+            registry_value = profile_key.GetValueByName("ProfileImagePath")
+            if not registry_value:
+                continue
+
+            profile_path = registry_value.GetDataAsObject()
+            if not profile_path or not isinstance(profile_path, str):
+                continue
+
+            # Profiles of system accounts, such as "LocalService", are stored in
+            # the Windows directory.
+            path_segment, separator, remainder = profile_path.partition("\\")
+            if path_segment.upper() in ("%SYSTEMROOT%", "%WINDIR%"):
+                profile_path = "".join(
+                    [operating_system_volume.windows_directory, separator, remainder]
+                )
+
+            user_accounts.append(
+                dfimagetools_resources.UserAccount(
+                    identifier=profile_key.name,
+                    user_directory=profile_path,
+                    user_directory_path_separator="\\",
+                    username=profile_path.rstrip("\\").rpartition("\\")[2],
+                )
+            )
+
+        return user_accounts
+
+    def _GetCachedResources(
+        self, operating_system_volume, name, resource_class, collect_function
+    ):
+        """Retrieves resources of an operating system volume.
+
+        Args:
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+          name (str): name of the resources in the sidecar cache.
+          resource_class (type): class of the resources, such as
+              dfimagetools.EnvironmentVariable.
+          collect_function (function): function to collect the resources if not
+              stored in the sidecar cache.
+
+        Returns:
+          list[object]: resources.
+        """
+        sidecar_value_name = f"{name:s}:{operating_system_volume.identifier:s}"
+
+        if self._sidecar_cache:
+            values = self._sidecar_cache.GetValue(self._source_path, sidecar_value_name)
+            if values is not None:
+                return [resource_class(**value) for value in values]
+
+        resources = collect_function(operating_system_volume)
+
+        if self._sidecar_cache:
+            values = [dict(vars(resource)) for resource in resources]
+            self._sidecar_cache.SetValue(self._source_path, sidecar_value_name, values)
+
+        return resources
+
+    def _GetFileEntryIdentity(self, operating_system_volume, file_entry):
+        """Retrieves the identity of a file entry within a snapshot set.
+
+        The identity consists of the snapshot set identifier, the inode number,
+        which for NTFS is the file reference that includes the sequence number,
+        the modification time and the size.
+
+        Args:
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+          file_entry (dfvfs.FileEntry): file entry.
+
+        Returns:
+          tuple[str, int, str, int]: identity of the file entry or None if not
+              available.
+        """
+        stat_attribute = file_entry.GetStatAttribute()
+        inode_number = getattr(stat_attribute, "inode_number", None)
+        if inode_number is None:
+            return None
+
+        modification_time = file_entry.modification_time
+        if modification_time:
+            modification_time = modification_time.CopyToDateTimeString()
+
+        return (
+            operating_system_volume.snapshot_set_identifier,
+            inode_number,
+            modification_time or "",
+            file_entry.size,
+        )
+
+    def _GetWindowsVersionFromKernelExecutable(self):
+        """Determines the Windows version from the kernel executable file.
+
+        Returns:
+          str: Windows version or None otherwise.
+        """
+        # Window NT variants.
+        kernel_executable_path = "\\".join(
+            [self._windows_directory, "System32", "ntoskrnl.exe"]
+        )
+        metadata = self._ReadResourceMetadataByWindowsPath(kernel_executable_path)
+
+        if not metadata:
+            # Window 9x variants.
+            kernel_executable_path = "\\".join(
+                [self._windows_directory, "System32", "kernel32.dll"]
+            )
+            metadata = self._ReadResourceMetadataByWindowsPath(kernel_executable_path)
+
+        if not metadata:
+            return None
+
+        return metadata.file_version
+
+    def _GetWindowsVersionFromRegistry(self, operating_system_volume):
+        """Determines the Windows version from the Windows Registry.
+
+        The Windows version is composed of the major and minor version, the build
+        number and, if available, the update build revision (UBR), such as
+        "10.0.19045.3636".
+
+        Args:
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+
+        Returns:
+          str: Windows version or None otherwise.
+        """
+        if not operating_system_volume.windows_registry:
+            return None
+
+        try:
+            registry_key = operating_system_volume.windows_registry.GetKeyByPath(
+                self._WINDOWS_NT_CURRENT_VERSION_KEY_PATH
+            )
+        except RuntimeError:
+            registry_key = None
+
+        if not registry_key:
+            return None
+
+        value_data = {}
+        for value_name in (
+            "CurrentBuildNumber",
+            "CurrentMajorVersionNumber",
+            "CurrentMinorVersionNumber",
+            "CurrentVersion",
+            "ProductName",
+            "UBR",
+        ):
+            registry_value = registry_key.GetValueByName(value_name)
+            if registry_value:
+                value_data[value_name] = registry_value.GetDataAsObject()
+
+        operating_system_volume.windows_product_name = value_data.get(
+            "ProductName", None
+        )
+
+        # Windows 10 and later store the major and minor version in separate
+        # values and retain "6.3" as CurrentVersion for compatibility.
+        major_version = value_data.get("CurrentMajorVersionNumber", None)
+        minor_version = value_data.get("CurrentMinorVersionNumber", None)
+        if major_version is None:
+            major_version, _, minor_version = (
+                value_data.get("CurrentVersion", None) or ""
+            ).partition(".")
+
+        build_number = value_data.get("CurrentBuildNumber", None)
+        if not major_version or not build_number:
+            return None
+
+        version_segments = [
+            f"{major_version!s}",
+            f"{minor_version or 0!s}",
+            f"{build_number!s}",
+        ]
+
+        update_build_revision = value_data.get("UBR", None)
+        if update_build_revision is not None:
+            version_segments.append(f"{update_build_revision!s}")
+
+        return ".".join(version_segments)
+
+    def _GetVolumeIdentifier(self, path_spec, include_snapshots=True):
+        """Retrieves the identifier of a volume.
+
+        Args:
+          path_spec (dfvfs.PathSpec): base path specification of the volume.
+          include_snapshots (Optional[bool]): True if Volume Shadow Copy (VSS)
+              snapshot identifiers should be included.
+
+        Returns:
+          str: volume identifier, such as "p1" or "p2/vss1", or an empty string
+              if the volume is not part of a volume system.
+        """
+        volume_identifiers = []
+        while path_spec:
+            is_snapshot = (
+                path_spec.type_indicator == dfvfs_definitions.TYPE_INDICATOR_VSHADOW
+            )
+            if (include_snapshots or not is_snapshot) and path_spec.type_indicator in (
+                dfvfs_definitions.VOLUME_SYSTEM_TYPE_INDICATORS
+            ):
+                location = getattr(path_spec, "location", None)
+                if location:
+                    volume_identifiers.append(location.lstrip("/"))
+
+            path_spec = path_spec.parent
+
+        return "/".join(reversed(volume_identifiers))
+
+    def _GetVolumesExecutor(self):
+        """Retrieves the executor used to process multiple volumes concurrently.
+
+        Returns:
+          concurrent.futures.ThreadPoolExecutor: volumes executor.
+        """
+        if not self._volumes_executor:
+            self._volumes_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._MAXIMUM_NUMBER_OF_VOLUME_THREADS
+            )
+
+        return self._volumes_executor
+
+    def _ExpandRegistryKeyPath(self, key_path, user_accounts):
+        """Expands the variables in a Windows Registry key path.
+
+        Args:
+          key_path (str): Windows Registry key path.
+          user_accounts (list[dfimagetools.UserAccount]): user accounts.
+
+        Returns:
+          list[str]: expanded key paths, where a key path is expanded for every
+              user account. Key paths with unsupported variables are omitted.
+        """
+        key_path_segments = key_path.split("\\")
+
+        # The Windows Registry file of the current user is not known, hence
+        # HKEY_CURRENT_USER is expanded to the key of every user.
+        if key_path_segments[0].upper() in ("HKCU", "HKEY_CURRENT_USER"):
+            key_path_segments = ["HKEY_USERS", "%%users.sid%%"] + key_path_segments[1:]
+
+        expanded_key_paths = [[]]
+        for key_path_segment in key_path_segments:
+            lower_case_key_path_segment = key_path_segment.lower()
+            if lower_case_key_path_segment == "%%users.sid%%":
+                values = [
+                    user_account.identifier
+                    for user_account in user_accounts
+                    if user_account.identifier
+                ]
+            elif lower_case_key_path_segment == "%%current_control_set%%":
+                values = ["CurrentControlSet"]
+            elif "%%" in key_path_segment:
+                return []
+            else:
+                values = [key_path_segment]
+
+            expanded_key_paths = [
+                expanded_key_path + [value]
+                for expanded_key_path in expanded_key_paths
+                for value in values
+            ]
+
+        return [
+            "\\".join(expanded_key_path) for expanded_key_path in expanded_key_paths
+        ]
+
+    def _GetRegistrySources(self, artifact_definition, visited_names=None):
+        """Retrieves the Windows Registry sources of an artifact definition.
+
+        The sources of artifact definitions referenced by a group source are
+        included.
+
+        Args:
+          artifact_definition (artifacts.ArtifactDefinition): artifact definition.
+          visited_names (Optional[set[str]]): lower case names of the artifact
+              definitions that were already visited.
+
+        Returns:
+          list[artifacts.SourceType]: Windows Registry key and value sources.
+        """
+        if visited_names is None:
+            visited_names = set()
+
+        lookup_key = artifact_definition.name.lower()
+        if lookup_key in visited_names:
+            return []
+
+        visited_names.add(lookup_key)
+
+        registry_sources = []
+        for source in artifact_definition.sources:
+            if source.type_indicator in self._REGISTRY_SOURCE_TYPES:
+                registry_sources.append(source)
+
+            for name in getattr(source, "names", None) or []:
+                group_definition = self._artifacts_registry.GetDefinitionByName(name)
+                if group_definition:
+                    registry_sources.extend(
+                        self._GetRegistrySources(group_definition, visited_names)
+                    )
+
+        return registry_sources
+
+    def _GetRootFileEntry(self, operating_system_volume):
+        """Retrieves the root file entry of an operating system volume.
+
+        Args:
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+
+        Returns:
+          dfvfs.FileEntry: root file entry or None if not available.
+        """
+        file_system = operating_system_volume.file_system
+        mount_point = operating_system_volume.mount_point
+        if mount_point.type_indicator == dfvfs_definitions.TYPE_INDICATOR_OS:
+            return file_system.GetFileEntryByPathSpec(mount_point)
+
+        return file_system.GetRootFileEntry()
+
+    def _HasPathVariables(self, artifact_definition):
+        """Determines if the paths of an artifact definition contain variables.
+
+        The sources of artifact definitions referenced by a group source are
+        included.
+
+        Args:
+          artifact_definition (artifacts.ArtifactDefinition): artifact definition.
+
+        Returns:
+          bool: True if a path of the artifact definition contains a %%variable%%.
+        """
+        lookup_key = artifact_definition.name.lower()
+        has_path_variables = self._definitions_with_path_variables.get(lookup_key, None)
+        if has_path_variables is not None:
+            return has_path_variables
+
+        # Prevent infinite recursion on artifact groups that reference each other.
+        self._definitions_with_path_variables[lookup_key] = False
+
+        has_path_variables = False
+        for source in artifact_definition.sources:
+            for path in getattr(source, "paths", None) or []:
+                if "%%" in path:
+                    has_path_variables = True
+                    break
+
+            for name in getattr(source, "names", None) or []:
+                if has_path_variables:
+                    break
+
+                group_definition = self._artifacts_registry.GetDefinitionByName(name)
+                if group_definition:
+                    has_path_variables = self._HasPathVariables(group_definition)
+
+            if has_path_variables:
+                break
+
+        self._definitions_with_path_variables[lookup_key] = has_path_variables
+
+        return has_path_variables
+
+    def _InitializeWindowsVolume(self, operating_system_volume):
+        """Initializes the Windows specific state of an operating system volume.
+
+        Args:
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+        """
+        path_resolver = windows_path_resolver.WindowsPathResolver(
+            operating_system_volume.file_system,
+            operating_system_volume.mount_point,
+            path_resolution_cache=self._path_resolution_cache,
+            cache_identifier=operating_system_volume.identifier,
+        )
+
+        windows_directory = operating_system_volume.windows_directory
+        if windows_directory:
+            path_resolver.SetEnvironmentVariable("SystemRoot", windows_directory)
+            path_resolver.SetEnvironmentVariable("WinDir", windows_directory)
+
+            registry_file_reader = registry_file_cache.CachingWindowsRegistryFileReader(
+                operating_system_volume.file_system,
+                path_resolver,
+                self._registry_file_cache,
+                cache_identifier=(
+                    self._source_path or "",
+                    operating_system_volume.identifier,
+                ),
+            )
+            winregistry = dfwinreg_registry.WinRegistry(
+                registry_file_reader=registry_file_reader
+            )
+
+            operating_system_volume.mui_file_resolver = (
+                mui_file_resolver.MUIFileResolver(
+                    operating_system_volume.file_system,
+                    path_resolver,
+                    preferred_language=self._preferred_language,
+                )
+            )
+            operating_system_volume.path_resolver = path_resolver
+            operating_system_volume.windows_registry = winregistry
+
+    def _ScanOperatingSystemVolume(self, path_spec):
+        """Scans a volume for operating system directories.
+
+        Every volume is opened with its own resolver context, so that volumes
+        can be checked concurrently.
+
+        Args:
+          path_spec (dfvfs.PathSpec): base path specification of the volume.
+
+        Returns:
+          OperatingSystemVolume: operating system volume.
+        """
+        resolver_context = dfvfs_context.Context()
+        file_system = dfvfs_resolver.Resolver.OpenFileSystem(
+            path_spec, resolver_context=resolver_context
+        )
+
+        if path_spec.type_indicator == dfvfs_definitions.TYPE_INDICATOR_OS:
+            mount_point = path_spec
+        else:
+            mount_point = path_spec.parent
+
+        file_system_searcher = dfvfs_file_system_searcher.FileSystemSearcher(
+            file_system, mount_point
+        )
+
+        operating_system_volume = OperatingSystemVolume(
+            file_system, file_system_searcher, mount_point
+        )
+        operating_system_volume.base_path_spec = path_spec
+        operating_system_volume.resolver_context = resolver_context
+        operating_system_volume.identifier = self._GetVolumeIdentifier(path_spec)
+        operating_system_volume.snapshot_set_identifier = self._GetVolumeIdentifier(
+            path_spec, include_snapshots=False
+        )
+
+        root_file_entry = self._GetRootFileEntry(operating_system_volume)
+
+        if (
+            path_spec.type_indicator == dfvfs_definitions.TYPE_INDICATOR_APFS
+            and path_spec.parent.type_indicator
+            == dfvfs_definitions.TYPE_INDICATOR_APFS_CONTAINER
+        ):
+            container_file_system = dfvfs_resolver.Resolver.OpenFileSystem(
+                path_spec.parent, resolver_context=resolver_context
+            )
+            fsapfs_volume = container_file_system.GetAPFSVolumeByPathSpec(
+                path_spec.parent
+            )
+            operating_system_volume.volume_group_identifier = self._GetVolumeIdentifier(
+                path_spec.parent.parent
+            )
+            operating_system_volume.volume_name = getattr(fsapfs_volume, "name", "")
+            operating_system_volume.volume_role = self._GetAPFSVolumeRole(
+                operating_system_volume.volume_name, root_file_entry
+            )
+
+            # Prevent walking volumes, such as the Recovery volume, that do not
+            # contain an operating system.
+            if operating_system_volume.volume_role in self._APFS_VOLUME_ROLES_TO_SKIP:
+                return operating_system_volume
+
+        # Note that APFS can have a volume without a root directory.
+        if root_file_entry:
+            for path_segments in self._FindSystemDirectories(root_file_entry):
+                relative_path = file_system.PATH_SEPARATOR.join([""] + path_segments)
+                operating_system_volume.system_directories.append(relative_path.lower())
+
+                lower_case_path_segments = tuple(
+                    path_segment.lower() for path_segment in path_segments
+                )
+                if (
+                    not operating_system_volume.windows_directory
+                    and lower_case_path_segments in self._WINDOWS_SYSTEM_DIRECTORIES
+                ):
+                    operating_system_volume.windows_directory = "\\".join(
+                        ["C:", path_segments[0]]
+                    )
+
+        return operating_system_volume
+
+    def _SetFilterGenerator(self, operating_system_volume):
+        """Sets the artifact definition filters generator of a volume.
+
+        Args:
+          operating_system_volume (OperatingSystemVolume): operating system volume.
+        """
+        operating_system_volume.filter_generator = (
+            artifact_filters.ArtifactDefinitionFiltersGenerator(
+                self._artifacts_registry,
+                operating_system_volume.environment_variables,
+                operating_system_volume.user_accounts,
+            )
+        )
+        operating_system_volume.find_specs_fingerprint = (
+            self._find_specs_cache.GetFingerprint(
+                operating_system_volume.environment_variables,
+                operating_system_volume.user_accounts,
+            )
+        )
+
+    def Close(self):
+        """Closes the scanner.
+
+        The state of a previous scan is reset and the threads used to process
+        the operating system volumes concurrently are stopped. The scanner can
+        be reused after it was closed.
+        """
+        self.Reset()
+
+        if self._volumes_executor:
+            self._volumes_executor.shutdown(wait=True)
+            self._volumes_executor = None
+
+    def CheckArtifactDefinition(self, artifact_definition):
+        """Checks if an artifact definition on a storage media image.
+
+        If multiple operating system volumes were found the artifact definition
+        is checked on every volume, concurrently, and the check results of the
+        individual volumes are combined. This includes the Volume Shadow Copy
+        (VSS) snapshots selected by the volume scanner options.
+
+        Windows Registry key and value sources are checked in the Windows
+        Registry of every Windows volume.
+
+        Args:
+          artifact_definition (artifacts.ArtifactDefinition): artifact definition.
+
+        Returns:
+          CheckResults: check results.
+        """
+        check_result = CheckResults()
+
+        if self._checks_definitions is None:
+            self._checks_definitions = self._ReadChecksDefinitions()
+
+        check_definition = self._checks_definitions.get(
+            artifact_definition.name.lower(), None
+        )
+
+        checked_file_entries = set()
+
+        # The environment is collected when the first artifact definition that
+        # uses path variables is checked.
+        if self._HasPathVariables(artifact_definition):
+            for operating_system_volume in self._operating_system_volumes:
+                if not operating_system_volume.environment_collected:
+                    self._CollectEnvironment(operating_system_volume)
+
+        registry_sources = self._GetRegistrySources(artifact_definition)
+        if registry_sources:
+            for operating_system_volume in self._operating_system_volumes:
+                if not operating_system_volume.windows_registry:
+                    continue
+
+                # The user accounts are needed to expand the users key paths.
+                if not operating_system_volume.environment_collected:
+                    self._CollectEnvironment(operating_system_volume)
+
+                number_of_keys, number_of_values = (
+                    self._CheckArtifactDefinitionInRegistry(
+                        operating_system_volume, registry_sources
+                    )
+                )
+                check_result.number_of_registry_keys += number_of_keys
+                check_result.number_of_registry_values += number_of_values
+
+        volumes_with_find_specs = []
+        for operating_system_volume in self._operating_system_volumes:
+            find_specs = self._find_specs_cache.GetFindSpecs(
+                operating_system_volume.filter_generator,
+                artifact_definition.name,
+                operating_system_volume.find_specs_fingerprint,
+            )
+            if find_specs:
+                volumes_with_find_specs.append((operating_system_volume, find_specs))
+
+        if len(volumes_with_find_specs) > 1:
+            volumes_executor = self._GetVolumesExecutor()
+            volume_check_results = list(
+                volumes_executor.map(
+                    lambda arguments: self._CheckArtifactDefinitionOnVolume(
+                        arguments[0],
+                        arguments[1],
+                        check_definition,
+                        checked_file_entries,
+                    ),
+                    volumes_with_find_specs,
+                )
+            )
+        else:
+            volume_check_results = [
+                self._CheckArtifactDefinitionOnVolume(
+                    operating_system_volume,
+                    find_specs,
+                    check_definition,
+                    checked_file_entries,
+                )
+                for operating_system_volume, find_specs in volumes_with_find_specs
+            ]
+
+        for (operating_system_volume, _), volume_check_result in zip(
+            volumes_with_find_specs, volume_check_results
+        ):
+            if volume_check_result.number_of_file_entries:
+                check_result.number_of_file_entries += (
+                    volume_check_result.number_of_file_entries
+                )
+                check_result.number_of_file_entries_per_volume[
+                    operating_system_volume.identifier
+                ] = volume_check_result.number_of_file_entries
+                check_result.data_formats.update(volume_check_result.data_formats)
+
+        return check_result
+
+    def GetMUIFilePath(self, windows_path, languages=None):
+        """Retrieves the Windows path of the MUI resource file of a resource file.
+
+        Args:
+          windows_path (str): Windows path of the resource file on the first
+              Windows volume.
+          languages (Optional[list[str]]): languages in order of preference, where
+              None represents the preferred language.
+
+        Returns:
+          str: Windows path of the MUI resource file or None if not available.
+        """
+        if not self._windows_volume or not self._windows_volume.mui_file_resolver:
+            return None
+
+        return self._windows_volume.mui_file_resolver.GetMUIFilePath(
+            windows_path, languages=languages
+        )
+
+    def GetPathResolutionCacheStatistics(self):
+        """Retrieves statistics of the Windows path resolution cache.
+
+        Returns:
+          tuple[int, int, float]: number of path segments resolved from the cache,
+              number of path segments resolved in the file system and cache hit
+              rate.
+        """
+        return (
+            self._path_resolution_cache.number_of_cache_hits,
+            self._path_resolution_cache.number_of_cache_misses,
+            self._path_resolution_cache.GetHitRate(),
+        )
+
+    def GetRegistryFileCacheStatistics(self):
+        """Retrieves statistics of the Windows Registry file cache.
+
+        Returns:
+          tuple[int, int]: number of Windows Registry files opened from the cache
+              and number of Windows Registry files read from the storage media
+              image.
+        """
+        return (
+            self._registry_file_cache.number_of_cache_hits,
+            self._registry_file_cache.number_of_cache_misses,
+        )
+
+    def GetWindowsProductName(self):
+        """Retrieves the Windows product name.
+
+        The Windows product name is read from the CurrentVersion key in the
+        SOFTWARE Windows Registry file when the Windows version is determined.
+
+        Returns:
+          str: Windows product name, such as "Windows 10 Pro", or None if not
+              available.
+        """
+        if not self._windows_volume:
+            return None
+
+        if self._windows_volume.windows_version is None:
+            self.GetWindowsVersion()
+
+        return self._windows_volume.windows_product_name
+
+    def GetWindowsVersion(self, cross_check=False):
+        """Determines the Windows version.
+
+        The Windows version is read from the CurrentVersion key in the SOFTWARE
+        Windows Registry file and, if not available, from the version resource
+        of the kernel executable file. The Windows version is cached per volume.
+
+        Args:
+          cross_check (Optional[bool]): True if the Windows version read from the
+              Windows Registry should be checked against the version of the
+              kernel executable file.
+
+        Returns:
+          str: Windows version or None otherwise.
+        """
+        if not self._windows_volume:
+            return None
+
+        if self._windows_volume.windows_version is None:
+            windows_version = self._GetWindowsVersionFromRegistry(self._windows_volume)
+
+            kernel_executable_version = None
+            if not windows_version or cross_check:
+                kernel_executable_version = (
+                    self._GetWindowsVersionFromKernelExecutable()
+                )
+
+            if windows_version and kernel_executable_version:
+                # The build number of the kernel executable file can differ from
+                # that of the operating system, hence only the major and minor
+                # version numbers are compared.
+                if (
+                    windows_version.split(".")[:2]
+                    != kernel_executable_version.split(".")[:2]
+                ):
+                    logging.warning(
+                        f"Windows version: {windows_version:s} does not match "
+                        f"kernel executable version: {kernel_executable_version:s}"
+                    )
+
+            self._windows_volume.windows_version = (
+                windows_version or kernel_executable_version or ""
+            )
+
+        return self._windows_volume.windows_version or None
+
+    def ExtractMessageTables(self, store, windows_paths=None):
+        """Adds the message tables of the Windows volumes to a message store.
+
+        The message files are read concurrently by a pool of threads and added
+        to the message store in batches as they become available, hence the
+        number of messages retained in memory is bounded. A message file with
+        the same name and file version as a message file in the message store is
+        not extracted again.
+
+        Args:
+          store (MessageStore): message store.
+          windows_paths (Optional[list[str]]): Windows paths of the directories
+              that contain the message files, where None represents the System32
+              and SysWOW64 directories.
+
+        Returns:
+          int: number of message files of which the messages were added to the
+              message store.
+        """
+        number_of_message_files = 0
+        message_files = []
+
+        for message_file in self._ReadResourceFiles(
+            self._ReadMessageFile,
+            windows_paths or self._RESOURCE_FILE_WINDOWS_PATHS,
+            store,
+        ):
+            message_files.append(message_file)
+
+            if len(message_files) >= self._MESSAGE_STORE_BATCH_SIZE:
+                number_of_message_files += store.AddMessageFiles(message_files)
+                message_files = []
+
+        if message_files:
+            number_of_message_files += store.AddMessageFiles(message_files)
+
+        return number_of_message_files
+
+    def InventoryResourceFiles(self, inventory, windows_paths=None):
+        """Adds the resource files of the Windows volumes to an inventory.
+
+        The resource files are read concurrently by a pool of threads and the
+        inventory entries are added in batches as they become available, hence
+        the number of entries retained in memory is bounded.
+
+        Args:
+          inventory (ResourceFileInventory): inventory of resource files.
+          windows_paths (Optional[list[str]]): Windows paths of the directories
+              that contain the resource files, where None represents the System32
+              and SysWOW64 directories.
+
+        Returns:
+          int: number of resource files added to the inventory.
+        """
+        number_of_entries = 0
+        entries = []
+
+        for entry in self._ReadResourceFiles(
+            self._ReadResourceFileInventoryEntry,
+            windows_paths or self._RESOURCE_FILE_WINDOWS_PATHS,
+        ):
+            entries.append(entry)
+
+            if len(entries) >= self._RESOURCE_FILE_INVENTORY_BATCH_SIZE:
+                inventory.AddEntries(entries)
+                number_of_entries += len(entries)
+                entries = []
+
+        if entries:
+            inventory.AddEntries(entries)
+            number_of_entries += len(entries)
+
+        return number_of_entries
+
+    def Reset(self):
+        """Resets the state of a previous scan.
+
+        The operating system volumes of the previous scan are closed, such that
+        their file systems and Windows Registry files are not retained when the
+        scanner is reused for multiple sources.
+        """
+        operating_system_volumes = list(self._operating_system_volumes)
+        for operating_system_volume in self._operating_system_volumes:
+            paired_volume = operating_system_volume.paired_volume
+            if paired_volume and paired_volume not in operating_system_volumes:
+                operating_system_volumes.append(paired_volume)
+
+        self._operating_system_volumes = []
+        self._path_resolver = None
+        self._windows_directory = None
+        self._windows_registry = None
+        self._windows_volume = None
+
+        self._CloseOperatingSystemVolumes(operating_system_volumes)
+
+        # Note that the Windows Registry file cache is retained, since its data
+        # is identified by storage media image and can be reused when the same
+        # storage media image is scanned again.
+        self._path_resolution_cache.Empty()
+
+    def ResolveEventLogProviders(self):
+        """Resolves the event message files of the EventLog providers.
+
+        The EventLog providers are read from the SYSTEM Windows Registry file of
+        the first Windows volume and the Windows paths of their event message
+        files are resolved with the Windows path resolver of that volume. Every
+        unique message file is read only once, by a pool of threads.
+
+        Returns:
+          dict[str, list[EventLogMessageFile]]: event message files per EventLog
+              provider name.
+        """
+        if not self._windows_volume or not self._windows_volume.windows_registry:
+            return {}
+
+        operating_system_volume = self._windows_volume
+        path_resolver = operating_system_volume.path_resolver
+
+        providers_reader = eventlog_providers.EventLogProvidersReader(
+            operating_system_volume.windows_registry
+        )
+        providers = providers_reader.ReadProviders()
+
+        # The event message files can contain environment variables, such as
+        # %ProgramFiles%, that are collected from the Windows Registry.
+        if not operating_system_volume.environment_collected:
+            self._CollectEnvironment(operating_system_volume)
+
+        mui_windows_paths = {}
+        windows_paths = {}
+        for provider in providers:
+            for windows_path in provider.event_message_files:
+                lookup_key = windows_path.lower()
+                if lookup_key in mui_windows_paths:
+                    continue
+
+                windows_paths[lookup_key] = windows_path
+
+                # On Windows Vista and later the messages are typically stored in
+                # the MUI resource file of the message file.
+                mui_windows_path = None
+                if operating_system_volume.mui_file_resolver:
+                    mui_windows_path = (
+                        operating_system_volume.mui_file_resolver.GetMUIFilePath(
+                            windows_path
+                        )
+                    )
+
+                mui_windows_paths[lookup_key] = mui_windows_path
+                if mui_windows_path:
+                    windows_paths[mui_windows_path.lower()] = mui_windows_path
+
+        # The same message file can be referred to by different Windows paths,
+        # such as "%SystemRoot%\\System32\\netmsg.dll" and
+        # "C:\\Windows\\System32\\netmsg.dll", hence every message file is read
+        # once per resolved path specification.
+        path_spec_comparables = {}
+        path_specs = {}
+        for lookup_key, windows_path in windows_paths.items():
+            path_spec = path_resolver.ResolvePath(windows_path)
+            if path_spec:
+                path_spec_comparables[lookup_key] = path_spec.comparable
+                path_specs.setdefault(path_spec.comparable, path_spec)
+
+        # Every thread reads the message files with its own file system, since
+        # the file system of the volume cannot be shared between threads.
+        file_systems = ThreadLocalFileSystems()
+
+        metadata_per_path_spec = {}
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._MAXIMUM_NUMBER_OF_RESOURCE_FILE_THREADS
+            ) as executor:
+                futures = {
+                    comparable: executor.submit(
+                        self._ReadResourceFile,
+                        file_systems,
+                        self._ReadResourceMetadata,
+                        operating_system_volume,
+                        path_resolver.GetWindowsPath(path_spec),
+                        path_spec,
+                    )
+                    for comparable, path_spec in path_specs.items()
+                }
+                for comparable, future in futures.items():
+                    metadata_per_path_spec[comparable] = future.result()
+
+        finally:
+            file_systems.Empty()
+
+        metadata_per_path = {
+            lookup_key: metadata_per_path_spec.get(comparable, None)
+            for lookup_key, comparable in path_spec_comparables.items()
+        }
+
+        message_files_per_provider = {}
+        for provider in providers:
+            message_files = []
+            for windows_path in provider.event_message_files:
+                message_file = eventlog_providers.EventLogMessageFile(
+                    windows_path, metadata=metadata_per_path.get(windows_path.lower())
+                )
+
+                mui_windows_path = mui_windows_paths.get(windows_path.lower(), None)
+                if mui_windows_path:
+                    message_file.mui_metadata = metadata_per_path.get(
+                        mui_windows_path.lower(), None
+                    )
+                    message_file.mui_windows_path = mui_windows_path
+
+                message_files.append(message_file)
+
+            message_files_per_provider[provider.name] = message_files
+
+        return message_files_per_provider
+
+    def ScanForOperatingSystemVolumes(self, source_path, options=None):
+        """Scans for volumes containing an operating system.
+
+        All volumes that contain operating system directories are retained, such
+        that artifact definitions are checked on every operating system of, for
+        example, a dual-boot system. The first Windows volume, or otherwise the
+        first operating system volume, is used to determine the Windows version.
+
+        APFS volumes that do not contain an operating system, such as the Preboot,
+        Recovery and VM volumes, are skipped and an APFS data volume is retained
+        together with the system volume it is paired with.
+
+        Args:
+          source_path (str): source path.
+          options (Optional[dfvfs.VolumeScannerOptions]): volume scanner options.
+              If None the default volume scanner options are used, which are defined
+              in the VolumeScannerOptions class.
+
+        Returns:
+          bool: True if a volume with an operating system was found.
+
+        Raises:
+          ScannerError: if the source path does not exists, or if the source path
+              is not a file or directory, or if the format of or within the source
+              file is not supported.
+        """
+        if not options:
+            options = dfvfs_volume_scanner.VolumeScannerOptions()
+
+        self.Reset()
+
+        scan_context = self._ScanSource(source_path)
+
+        self._source_path = source_path
+        self._source_type = scan_context.source_type
+
+        base_path_specs = self._GetBasePathSpecs(scan_context, options)
+
+        if (
+            not base_path_specs
+            or scan_context.source_type == dfvfs_definitions.SOURCE_TYPE_FILE
+        ):
+            return False
+
+        # The volumes are scanned concurrently, since every volume is opened with
+        # its own resolver context, but the scan results are processed in the
+        # order of the base path specifications so that the selection of the
+        # operating system volumes is deterministic.
+        if len(base_path_specs) > 1:
+            volumes_executor = self._GetVolumesExecutor()
+            operating_system_volumes = volumes_executor.map(
+                self._ScanOperatingSystemVolume, base_path_specs
+            )
+        else:
+            operating_system_volumes = map(
+                self._ScanOperatingSystemVolume, base_path_specs
+            )
+
+        # An APFS data volume does not necessarily contain operating system
+        # directories and is selected when paired with a system volume.
+        operating_system_volumes = list(operating_system_volumes)
+        for operating_system_volume in operating_system_volumes:
+            if operating_system_volume.volume_role in self._APFS_VOLUME_ROLES_TO_SKIP:
+                continue
+
+            if operating_system_volume.volume_role == "data":
+                operating_system_volume.paired_volume = self._GetPairedSystemVolume(
+                    operating_system_volume, operating_system_volumes
+                )
+
+            if (
+                operating_system_volume.system_directories
+                or operating_system_volume.paired_volume
+                or len(base_path_specs) == 1
+            ):
+                self._operating_system_volumes.append(operating_system_volume)
+
+        # Close the volumes that are not used, such that their file systems are
+        # not retained until the next scan.
+        used_volumes = set(map(id, self._operating_system_volumes))
+        used_volumes.update(
+            id(operating_system_volume.paired_volume)
+            for operating_system_volume in self._operating_system_volumes
+            if operating_system_volume.paired_volume
+        )
+        self._CloseOperatingSystemVolumes(
+            [
+                operating_system_volume
+                for operating_system_volume in operating_system_volumes
+                if id(operating_system_volume) not in used_volumes
+            ]
+        )
+
+        if not self._operating_system_volumes:
+            return False
+
+        for operating_system_volume in self._operating_system_volumes:
+            if operating_system_volume.windows_directory:
+                self._InitializeWindowsVolume(operating_system_volume)
+
+                if not self._windows_directory:
+                    self._path_resolver = operating_system_volume.path_resolver
+                    self._windows_directory = operating_system_volume.windows_directory
+                    self._windows_registry = operating_system_volume.windows_registry
+                    self._windows_volume = operating_system_volume
+
+            self._SetFilterGenerator(operating_system_volume)
 
         return True
@@ -0,0 +1,341 @@
+"""Windows path resolver with a cache of resolved path prefixes."""
+
+import collections
+import threading
+
+from dfvfs.helpers import windows_path_resolver as dfvfs_windows_path_resolver
+from dfvfs.path import factory as dfvfs_path_spec_factory
+
+
+class PathResolutionCache:
+    """Cache of resolved Windows path prefixes.
+
+    The cache maps the lower case path segments of a Windows directory, such as
+    ("", "windows", "system32") for "C:\\Windows\\System32", to its location in
+    the file system and the corresponding file entry. The cache can be shared by
+    multiple Windows path resolvers, where every resolver uses a distinct cache
+    identifier.
+
+    Attributes:
+      number_of_cache_hits (int): number of path segments that were resolved
+          from the cache.
+      number_of_cache_misses (int): number of path segments that were resolved
+          in the file system.
+    """
+
+    _MAXIMUM_NUMBER_OF_CACHED_ENTRIES = 4096
+
+    def __init__(self, maximum_number_of_cached_entries=None):
+        """Initializes a path resolution cache.
+
+        Args:
+          maximum_number_of_cached_entries (Optional[int]): maximum number of
+              cached path prefixes. The least recently used path prefix is
+              removed when the maximum is exceeded.
+        """
+        super().__init__()
+        self._file_entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._maximum_number_of_cached_entries = (
+            maximum_number_of_cached_entries or self._MAXIMUM_NUMBER_OF_CACHED_ENTRIES
+        )
+        self.number_of_cache_hits = 0
+        self.number_of_cache_misses = 0
+
+    def CacheFileEntry(self, cache_identifier, lookup_segments, location, file_entry):
+        """Caches the file entry of a path prefix resolved in the file system.
+
+        Args:
+          cache_identifier (tuple[object, ...]): identifier of the Windows path
+              resolver.
+          lookup_segments (tuple[str, ...]): lower case path segments of the path
+              prefix.
+          location (str): location of the path prefix in the file system or None
+              if the path prefix does not exist.
+          file_entry (dfvfs.FileEntry): file entry of the path prefix or None if
+              the path prefix does not exist.
+        """
+        lookup_key = (cache_identifier, lookup_segments)
+
+        with self._lock:
+            self.number_of_cache_misses += 1
+
+            self._file_entries[lookup_key] = (location, file_entry)
+            if len(self._file_entries) > self._maximum_number_of_cached_entries:
+                self._file_entries.popitem(last=False)
+
+    def Empty(self):
+        """Empties the cache."""
+        with self._lock:
+            self._file_entries = collections.OrderedDict()
+
+    def GetLongestPrefix(self, cache_identifier, lookup_segments):
+        """Retrieves the longest cached path prefix of a path.
+
+        Args:
+          cache_identifier (tuple[object, ...]): identifier of the Windows path
+              resolver.
+          lookup_segments (tuple[str, ...]): lower case path segments of the path.
+
+        Returns:
+          tuple[int, str, dfvfs.FileEntry]: number of path segments in the path
+              prefix, location and file entry of the path prefix, where location
+              and file entry are None if the path prefix does not exist, or
+              (0, None, None) if no prefix of the path is cached.
+        """
+        with self._lock:
+            for number_of_segments in range(len(lookup_segments), 0, -1):
+                lookup_key = (cache_identifier, lookup_segments[:number_of_segments])
+                cached_values = self._file_entries.get(lookup_key, None)
+                if cached_values:
+                    self._file_entries.move_to_end(lookup_key)
+                    self.number_of_cache_hits += number_of_segments
+                    location, file_entry = cached_values
+                    return number_of_segments, location, file_entry
+
+        return 0, None, None
+
+    def GetHitRate(self):
+        """Determines the cache hit rate.
+
+        Returns:
+          float: fraction of the path segments that were resolved from the cache
+              or 0.0 if no path segments were resolved.
+        """
+        with self._lock:
+            number_of_cache_hits = self.number_of_cache_hits
+            number_of_lookups = number_of_cache_hits + self.number_of_cache_misses
+
+        if not number_of_lookups:
+            return 0.0
+
+        return number_of_cache_hits / number_of_lookups
+
+
+class WindowsPathResolver(dfvfs_windows_path_resolver.WindowsPathResolver):
+    """Windows path resolver with a cache of resolved path prefixes.
+
+    The directories of a path are resolved case-insensitively, segment by
+    segment, starting at the longest cached prefix of the path, hence a path
+    that shares a prefix with a previously resolved path, for example
+    "C:\\Windows\\System32", only requires a file system lookup per path
+    segment that was not resolved before. Paths that the cache cannot represent,
+    such as paths that contain ".." or a path variable after the first path
+    segment, are resolved by the dfVFS Windows path resolver.
+    """
+
+    def __init__(
+        self,
+        file_system,
+        mount_point,
+        drive_letter="C",
+        path_resolution_cache=None,
+        cache_identifier="",
+    ):
+        """Initializes a Windows path resolver.
+
+        Args:
+          file_system (dfvfs.FileSystem): a file system.
+          mount_point (dfvfs.PathSpec): mount point path specification.
+          drive_letter (Optional[str]): drive letter used by the file system.
+          path_resolution_cache (Optional[PathResolutionCache]): path resolution
+              cache, which can be shared between Windows path resolvers that use
+              distinct cache identifiers.
+          cache_identifier (Optional[str]): identifier of the Windows path
+              resolver in the path resolution cache.
+
+        Raises:
+          PathSpecError: if the mount point path specification is incorrect.
+          ValueError: when file system or mount point is not set.
+        """
+        super().__init__(file_system, mount_point, drive_letter=drive_letter)
+        self._cache_identifier = cache_identifier
+        self._environment_variables_key = ()
+        self._path_resolution_cache = path_resolution_cache or PathResolutionCache()
+
+    def _GetFileEntryByPathSpec(self, location, path_spec):
+        """Retrieves the file entry of a path resolved by the dfVFS resolver.
+
+        Args:
+          location (str): location of the path in the file system or None if
+              not available.
+          path_spec (dfvfs.PathSpec): path specification of the path or None if
+              not available.
+
+        Returns:
+          tuple[str, dfvfs.FileEntry]: location and file entry or (None, None)
+              if not available.
+        """
+        if not path_spec:
+            return None, None
+
+        file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+        if not file_entry:
+            return None, None
+
+        return location, file_entry
+
+    def _GetRootDirectory(self):
+        """Retrieves the root directory of the Windows path resolver.
+
+        Returns:
+          tuple[str, dfvfs.FileEntry]: location and file entry of the mount point.
+        """
+        if dfvfs_path_spec_factory.Factory.IsSystemLevelTypeIndicator(
+            self._file_system.type_indicator
+        ):
+            file_entry = self._file_system.GetFileEntryByPathSpec(self._mount_point)
+            return self._mount_point.location, file_entry
+
+        return self._file_system.JoinPath([]), self._file_system.GetRootFileEntry()
+
+    def _IsSpecialPathSegment(self, path_segment, expand_variables):
+        """Determines if a path segment cannot be resolved by name.
+
+        Args:
+          path_segment (str): path segment.
+          expand_variables (bool): True if path variables should be expanded.
+
+        Returns:
+          bool: True if the path segment is empty, relative or a path variable.
+        """
+        return path_segment in ("", ".", "..") or bool(
+            expand_variables and self._PATH_EXPANSION_VARIABLE.match(path_segment)
+        )
+
+    def _ResolveDirectory(self, path, expand_variables=True):
+        """Resolves a Windows directory using the path resolution cache.
+
+        Args:
+          path (str): Windows path of the directory to resolve.
+          expand_variables (Optional[bool]): True if path variables should be
+              expanded or not.
+
+        Returns:
+          tuple[str, dfvfs.FileEntry]: location and file entry of the directory
+              or (None, None) if not available.
+        """
+        path_segments = path.split(self._PATH_SEPARATOR)
+
+        # The first path segment is a drive, such as "C:", an empty path segment
+        # of a path relative to the root, such as "\\Windows", or a path
+        # variable, such as "%SystemRoot%".
+        first_path_segment = path_segments[0]
+        is_drive = first_path_segment == "" or (
+            len(first_path_segment) == 2 and first_path_segment[1] == ":"
+        )
+        is_variable = bool(
+            expand_variables and self._PATH_EXPANSION_VARIABLE.match(first_path_segment)
+        )
+        if (not is_drive and not is_variable) or any(
+            self._IsSpecialPathSegment(path_segment, expand_variables)
+            for path_segment in path_segments[1:]
+        ):
+            location, path_spec = super()._ResolvePath(
+                path, expand_variables=expand_variables
+            )
+            return self._GetFileEntryByPathSpec(location, path_spec)
+
+        # The path variables are part of the cache identifier, since the expanded
+        # path depends on the environment variables of the resolver.
+        cache_identifier = (
+            self._cache_identifier,
+            self._environment_variables_key if expand_variables else None,
+        )
+        lookup_segments = tuple(
+            [first_path_segment.lower() if is_variable else ""]
+            + [path_segment.lower() for path_segment in path_segments[1:]]
+        )
+
+        number_of_cached_segments, location, file_entry = (
+            self._path_resolution_cache.GetLongestPrefix(
+                cache_identifier, lookup_segments
+            )
+        )
+        if not number_of_cached_segments:
+            if is_variable:
+                location, path_spec = super()._ResolvePath(
+                    first_path_segment, expand_variables=expand_variables
+                )
+                location, file_entry = self._GetFileEntryByPathSpec(location, path_spec)
+            else:
+                location, file_entry = self._GetRootDirectory()
+
+            self._path_resolution_cache.CacheFileEntry(
+                cache_identifier, lookup_segments[:1], location, file_entry
+            )
+            number_of_cached_segments = 1
+
+        for segment_index in range(number_of_cached_segments, len(path_segments)):
+            if not file_entry:
+                return None, None
+
+            file_entry = file_entry.GetSubFileEntryByName(
+                path_segments[segment_index], case_sensitive=False
+            )
+            if file_entry:
+                location_segments = self._file_system.SplitPath(location)
+                location_segments.append(file_entry.name)
+                location = self._file_system.JoinPath(location_segments)
+            else:
+                location = None
+
+            self._path_resolution_cache.CacheFileEntry(
+                cache_identifier,
+                lookup_segments[: segment_index + 1],
+                location,
+                file_entry,
+            )
+
+        if not file_entry or not file_entry.IsDirectory():
+            return None, None
+
+        return location, file_entry
+
+    def _ResolvePath(self, path, expand_variables=True):
+        """Resolves a Windows path in file system specific format.
+
+        Args:
+          path (str): Windows path to resolve.
+          expand_variables (Optional[bool]): True if path variables should be
+              expanded or not.
+
+        Returns:
+          tuple[str, dfvfs.PathSpec]: location and matching path specification or
+              (None, None) if not available.
+        """
+        directory_path, separator, name = path.rpartition(self._PATH_SEPARATOR)
+
+        # Paths without a directory or of which the last path segment is relative
+        # or a path variable are resolved by the dfVFS Windows path resolver.
+        if not separator or self._IsSpecialPathSegment(name, expand_variables):
+            return super()._ResolvePath(path, expand_variables=expand_variables)
+
+        location, file_entry = self._ResolveDirectory(
+            directory_path, expand_variables=expand_variables
+        )
+        if not file_entry:
+            return None, None
+
+        sub_file_entry = file_entry.GetSubFileEntryByName(name, case_sensitive=False)
+        if not sub_file_entry:
+            return None, None
+
+        path_segments = self._file_system.SplitPath(location)
+        path_segments.append(sub_file_entry.name)
+        location = self._file_system.JoinPath(path_segments)
+
+        return location, sub_file_entry.path_spec
+
+    def SetEnvironmentVariable(self, name, value):
+        """Sets an environment variable in the Windows path helper.
+
+        Args:
+          name (str): name of the environment variable without enclosing
+              %-characters, such as "SystemRoot" as in "%SystemRoot%".
+          value (str): value of the environment variable.
+        """
+        super().SetEnvironmentVariable(name, value)
+        self._environment_variables_key = tuple(
+            sorted(self._environment_variables.items())
+        )
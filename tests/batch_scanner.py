@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""Tests for the batch scanner for artifact definitions."""
+
+import concurrent.futures.process
+import json
+import os
+import unittest
+
+from unittest import mock
+
+from artifacts import artifact as artifacts_artifact
+from artifacts import registry as artifacts_registry
+
+from dfvfs.helpers import volume_scanner as dfvfs_volume_scanner
+
+from artifactsrc import batch_scanner
+from artifactsrc import definitions_history
+from artifactsrc import volume_scanner
+
+from tests import test_lib
+
+
+class BatchScannerTest(test_lib.BaseTestCase):
+    """Tests for the batch scanner for artifact definitions."""
+
+    # pylint: disable=protected-access
+
+    def _CreateTestBatchScanner(self):
+        """Creates a batch scanner for testing.
+
+        Returns:
+          BatchScanner: batch scanner.
+        """
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+
+        volume_scanner_options = dfvfs_volume_scanner.VolumeScannerOptions()
+        volume_scanner_options.partitions = ["all"]
+        volume_scanner_options.snapshots = ["none"]
+        volume_scanner_options.volumes = ["all"]
+
+        return batch_scanner.BatchScanner(registry, [], volume_scanner_options)
+
+    def testGetResultsFilename(self):
+        """Tests the _GetResultsFilename function."""
+        scanner = self._CreateTestBatchScanner()
+
+        filename = scanner._GetResultsFilename(3, "/cases/image.E01")
+        self.assertEqual(filename, "0003_image.E01.json")
+
+    def testReadManifestFile(self):
+        """Tests the ReadManifestFile function."""
+        scanner = self._CreateTestBatchScanner()
+
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "manifest.txt")
+            with open(path, "w", encoding="utf-8") as file_object:
+                file_object.write("# Images\n/cases/image1.raw\n\n/cases/image2.E01\n")
+
+            source_paths = scanner.ReadManifestFile(path)
+
+        self.assertEqual(source_paths, ["/cases/image1.raw", "/cases/image2.E01"])
+
+    def testScanImages(self):
+        """Tests the ScanImages function."""
+        test_file_path = self._GetTestFilePath(["wrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        scanner = self._CreateTestBatchScanner()
+
+        with test_lib.TempDirectory() as temp_directory:
+            summary = scanner.ScanImages(
+                [test_file_path], temp_directory, number_of_workers=1
+            )
+
+            self.assertEqual(summary["number_of_images"], 1)
+            self.assertEqual(summary["number_of_failed_images"], 1)
+
+            path = os.path.join(temp_directory, "0000_wrc_test.dll.json")
+            with open(path, "r", encoding="utf-8") as file_object:
+                image_results = json.load(file_object)
+
+            self.assertEqual(image_results["source"], test_file_path)
+            self.assertIsNotNone(image_results["error"])
+
+            path = os.path.join(temp_directory, "summary.json")
+            self.assertTrue(os.path.exists(path))
+
+    def testScanImagesWithBrokenProcessPool(self):
+        """Tests the ScanImages function with a broken process pool."""
+        scanner = self._CreateTestBatchScanner()
+
+        with test_lib.TempDirectory() as temp_directory:
+            source_paths = [
+                os.path.join(temp_directory, "image1.raw"),
+                os.path.join(temp_directory, "image2.raw"),
+                os.path.join(temp_directory, "image3.raw"),
+            ]
+
+            image_results = {
+                "artifact_definitions": {},
+                "checked_definitions": {},
+                "error": None,
+                "operating_system_version": None,
+                "source": source_paths[0],
+                "windows_product_name": None,
+            }
+
+            with mock.patch.object(
+                batch_scanner,
+                "_ScanImage",
+                side_effect=[
+                    image_results,
+                    concurrent.futures.process.BrokenProcessPool("bogus"),
+                ],
+            ):
+                with self.assertLogs(level="WARNING"):
+                    with self.assertRaises(
+                        concurrent.futures.process.BrokenProcessPool
+                    ):
+                        scanner.ScanImages(
+                            source_paths, temp_directory, number_of_workers=1
+                        )
+
+            path = os.path.join(temp_directory, "summary.json")
+            with open(path, "r", encoding="utf-8") as file_object:
+                summary = json.load(file_object)
+
+            self.assertEqual(summary["number_of_images"], 3)
+            self.assertEqual(summary["number_of_failed_images"], 2)
+            self.assertEqual(len(summary["images"]), 3)
+            self.assertIsNone(summary["images"][0]["error"])
+            self.assertEqual(summary["images"][2]["source"], source_paths[2])
+
+            path = os.path.join(temp_directory, summary["images"][2]["results_file"])
+            self.assertTrue(os.path.exists(path))
+
+    def testScanImagesWithHistory(self):
+        """Tests the ScanImages function with a history."""
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        for name in ("WindowsPrefetch", "WindowsSAM"):
+            registry.RegisterDefinition(
+                artifacts_artifact.ArtifactDefinition(name, description=name)
+            )
+
+        volume_scanner_options = dfvfs_volume_scanner.VolumeScannerOptions()
+
+        check_result = volume_scanner.CheckResults()
+        check_result.number_of_file_entries = 1
+
+        with test_lib.TempDirectory() as temp_directory:
+            history_path = os.path.join(temp_directory, "history.db")
+
+            history = definitions_history.ArtifactDefinitionsHistory()
+            history.Open(history_path)
+            history.AddResults("10.0.19041.1", {"WindowsPrefetch": 0, "WindowsSAM": 1})
+            history.Close()
+
+            scanner = batch_scanner.BatchScanner(
+                registry,
+                ["WindowsPrefetch", "WindowsSAM"],
+                volume_scanner_options,
+                history_path=history_path,
+                triage=True,
+            )
+
+            scanner_class = volume_scanner.ArtifactDefinitionsVolumeScanner
+            with mock.patch.object(
+                scanner_class, "ScanForOperatingSystemVolumes", return_value=True
+            ):
+                with mock.patch.object(
+                    scanner_class, "GetWindowsVersion", return_value="10.0.19041.1"
+                ):
+                    with mock.patch.object(
+                        scanner_class,
+                        "CheckArtifactDefinition",
+                        return_value=check_result,
+                    ) as check_function:
+                        summary = scanner.ScanImages(
+                            [os.path.join(temp_directory, "image.raw")],
+                            temp_directory,
+                            number_of_workers=1,
+                        )
+
+            # WindowsPrefetch never matched before and is skipped in triage mode.
+            self.assertEqual(check_function.call_count, 1)
+            self.assertEqual(summary["number_of_failed_images"], 0)
+            self.assertEqual(summary["artifact_definitions"], {"WindowsSAM": 1})
+
+            batch_scanner._WORKER_STATE["history"].Close()
+
+            # The check results are added to the history by the batch scanner.
+            history.Open(history_path)
+            try:
+                results = history._GetResults("10.0.19041.1")
+            finally:
+                history.Close()
+
+            self.assertEqual(results, {"windowsprefetch": (1, 0), "windowssam": (2, 2)})
+
+    def testScanImagesWithUnexpectedError(self):
+        """Tests the ScanImages function with an unexpected error."""
+        scanner = self._CreateTestBatchScanner()
+
+        with test_lib.TempDirectory() as temp_directory:
+            source_paths = [
+                os.path.join(temp_directory, "image1.raw"),
+                os.path.join(temp_directory, "image2.raw"),
+            ]
+
+            with mock.patch.object(
+                batch_scanner.volume_scanner.ArtifactDefinitionsVolumeScanner,
+                "ScanForOperatingSystemVolumes",
+                side_effect=[KeyError("bogus"), False],
+            ) as scan_function:
+                with self.assertLogs(level="ERROR"):
+                    summary = scanner.ScanImages(
+                        source_paths, temp_directory, number_of_workers=1
+                    )
+
+            self.assertEqual(scan_function.call_count, 2)
+            self.assertEqual(summary["number_of_images"], 2)
+            self.assertEqual(summary["number_of_failed_images"], 2)
+
+            self.assertEqual(
+                summary["images"][0]["error"], "Unexpected error: KeyError: 'bogus'"
+            )
+            self.assertEqual(summary["images"][1]["source"], source_paths[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
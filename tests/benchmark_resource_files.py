@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Tests for the script to benchmark reading Windows Message Resource files."""
+
+import json
+import os
+import sys
+import unittest
+
+from unittest import mock
+
+from tools import benchmark_resource_files
+
+from tests import test_lib
+
+
+class BenchmarkResourceFilesTest(test_lib.BaseTestCase):
+    """Tests for the script to benchmark reading Windows Message Resource files."""
+
+    def testMain(self):
+        """Tests the Main function."""
+        generator = benchmark_resource_files.SyntheticPEFileGenerator(seed=0)
+
+        with test_lib.TempDirectory() as temp_directory:
+            corpus_path = os.path.join(temp_directory, "corpus")
+            os.mkdir(corpus_path)
+
+            for file_index in range(4):
+                path = os.path.join(corpus_path, f"synthetic{file_index:05d}.dll")
+                with open(path, "wb") as file_object:
+                    file_object.write(generator.GenerateFile())
+
+            output_path = os.path.join(temp_directory, "results.json")
+            arguments = [
+                "benchmark_resource_files.py",
+                "--output",
+                output_path,
+                "--synthetic-files",
+                "0",
+                "--test-data",
+                corpus_path,
+            ]
+            with mock.patch.object(sys, "argv", arguments):
+                result = benchmark_resource_files.Main()
+
+            self.assertEqual(result, 0)
+
+            with open(output_path, "r", encoding="utf-8") as file_object:
+                output = json.load(file_object)
+
+        self.assertEqual(output["format_version"], 1)
+        self.assertEqual(
+            sorted(output["environment"].keys()),
+            ["artifactsrc", "platform", "pyexe", "python", "pywrc"],
+        )
+        self.assertEqual(
+            output["parameters"], {"iterations": 1, "seed": 0, "synthetic_files": 0}
+        )
+        self.assertEqual(len(output["results"]), 1)
+
+        corpus_result = output["results"][0]
+        self.assertEqual(corpus_result["corpus"], "test_data")
+        self.assertEqual(corpus_result["iterations"], 1)
+        self.assertEqual(corpus_result["number_of_failures"], 0)
+        self.assertEqual(corpus_result["number_of_files"], 4)
+        self.assertGreater(corpus_result["number_of_messages"], 0)
+        self.assertGreater(corpus_result["file_size_mean"], 0)
+
+        self.assertEqual(
+            sorted(corpus_result["operations"].keys()),
+            ["close", "message_table", "mui", "open", "version"],
+        )
+        self.assertEqual(
+            sorted(corpus_result["total"].keys()),
+            [
+                "bytes_read_mean",
+                "maximum_us",
+                "mean_us",
+                "median_us",
+                "p95_us",
+                "total_s",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Tests for the artifact definitions filter."""
+
+import unittest
+
+from artifacts import artifact as artifacts_artifact
+from artifacts import definitions as artifacts_definitions
+from artifacts import registry as artifacts_registry
+
+from artifactsrc import definitions_filter
+
+from tests import test_lib
+
+
+class ArtifactDefinitionsFilterTest(test_lib.BaseTestCase):
+    """Tests for the artifact definitions filter."""
+
+    def _CreateTestRegistry(self):
+        """Creates an artifact definitions registry for testing.
+
+        Returns:
+          artifacts.ArtifactDefinitionsRegistry: artifact definitions registry.
+        """
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+
+        artifact_definition = artifacts_artifact.ArtifactDefinition(
+            "WindowsEventLogs", description="Windows Event logs"
+        )
+        artifact_definition.AppendSource(
+            artifacts_definitions.TYPE_INDICATOR_ARTIFACT_GROUP,
+            {"names": ["WindowsEventLogSystem", "WindowsSecurityLogs"]},
+        )
+        registry.RegisterDefinition(artifact_definition)
+
+        artifact_definition = artifacts_artifact.ArtifactDefinition(
+            "WindowsEventLogSystem", description="Windows System Event log"
+        )
+        artifact_definition.AppendSource(
+            artifacts_definitions.TYPE_INDICATOR_FILE,
+            {
+                "paths": [
+                    "%%environ_systemroot%%\\System32\\winevt\\Logs\\System.evtx"
+                ],
+                "separator": "\\",
+            },
+        )
+        registry.RegisterDefinition(artifact_definition)
+
+        artifact_definition = artifacts_artifact.ArtifactDefinition(
+            "WindowsSecurityLogs", description="Windows Security Event logs"
+        )
+        artifact_definition.AppendSource(
+            artifacts_definitions.TYPE_INDICATOR_ARTIFACT_GROUP,
+            {"names": ["WindowsEventLogSecurity", "WindowsEventLogs"]},
+        )
+        registry.RegisterDefinition(artifact_definition)
+
+        artifact_definition = artifacts_artifact.ArtifactDefinition(
+            "WindowsEventLogSecurity", description="Windows Security Event log"
+        )
+        artifact_definition.AppendSource(
+            artifacts_definitions.TYPE_INDICATOR_FILE,
+            {
+                "paths": [
+                    "%%environ_systemroot%%\\System32\\winevt\\Logs\\Security.evtx"
+                ],
+                "separator": "\\",
+            },
+        )
+        registry.RegisterDefinition(artifact_definition)
+
+        artifact_definition = artifacts_artifact.ArtifactDefinition(
+            "ChromeHistory", description="Chrome history"
+        )
+        artifact_definition.AppendSource(
+            artifacts_definitions.TYPE_INDICATOR_FILE,
+            {"paths": ["%%users.homedir%%/.config/google-chrome/*/History"]},
+        )
+        registry.RegisterDefinition(artifact_definition)
+
+        return registry
+
+    def _GetDefinitionNames(self, test_filter):
+        """Retrieves the names of the artifact definitions selected by a filter.
+
+        Args:
+          test_filter (ArtifactDefinitionsFilter): artifact definitions filter.
+
+        Returns:
+          list[str]: names of the selected artifact definitions.
+        """
+        return sorted(
+            artifact_definition.name
+            for artifact_definition in test_filter.GetDefinitions()
+        )
+
+    def testGetDefinitionsWithoutFilter(self):
+        """Tests the GetDefinitions function without filter."""
+        registry = self._CreateTestRegistry()
+        test_filter = definitions_filter.ArtifactDefinitionsFilter(registry)
+
+        names = self._GetDefinitionNames(test_filter)
+        self.assertEqual(len(names), 5)
+
+    def testGetDefinitionsWithGroupClosure(self):
+        """Tests the GetDefinitions function with a group definition."""
+        registry = self._CreateTestRegistry()
+        test_filter = definitions_filter.ArtifactDefinitionsFilter(
+            registry, definitions=["windowseventlogs"]
+        )
+
+        names = self._GetDefinitionNames(test_filter)
+        self.assertEqual(
+            names,
+            [
+                "WindowsEventLogSecurity",
+                "WindowsEventLogSystem",
+                "WindowsEventLogs",
+                "WindowsSecurityLogs",
+            ],
+        )
+
+    def testGetDefinitionsWithGlob(self):
+        """Tests the GetDefinitions function with a name glob."""
+        registry = self._CreateTestRegistry()
+        test_filter = definitions_filter.ArtifactDefinitionsFilter(
+            registry, definitions=["Chrome*", "WindowsEventLogSy*"]
+        )
+
+        names = self._GetDefinitionNames(test_filter)
+        self.assertEqual(names, ["ChromeHistory", "WindowsEventLogSystem"])
+
+    def testGetDefinitionsWithExclude(self):
+        """Tests the GetDefinitions function with excluded definitions."""
+        registry = self._CreateTestRegistry()
+        test_filter = definitions_filter.ArtifactDefinitionsFilter(
+            registry,
+            definitions=["WindowsEventLogs"],
+            exclude_definitions=["WindowsSecurityLogs"],
+        )
+
+        names = self._GetDefinitionNames(test_filter)
+        self.assertEqual(names, ["WindowsEventLogSystem", "WindowsEventLogs"])
+
+        test_filter = definitions_filter.ArtifactDefinitionsFilter(
+            registry, exclude_definitions=["Windows*"]
+        )
+
+        names = self._GetDefinitionNames(test_filter)
+        self.assertEqual(names, ["ChromeHistory"])
+
+    def testIsGroupOnly(self):
+        """Tests the IsGroupOnly function."""
+        registry = self._CreateTestRegistry()
+        test_filter = definitions_filter.ArtifactDefinitionsFilter(registry)
+
+        artifact_definition = registry.GetDefinitionByName("WindowsEventLogs")
+        self.assertTrue(test_filter.IsGroupOnly(artifact_definition))
+
+        artifact_definition = registry.GetDefinitionByName("ChromeHistory")
+        self.assertFalse(test_filter.IsGroupOnly(artifact_definition))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Tests for the history of artifact definition check results."""
+
+import os
+import unittest
+
+from artifacts import artifact as artifacts_artifact
+
+from artifactsrc import definitions_history
+from artifactsrc import definitions_planner
+
+from tests import test_lib
+
+
+class ArtifactDefinitionsHistoryTest(test_lib.BaseTestCase):
+    """Tests for the history of artifact definition check results."""
+
+    def _CreateTestPlannedDefinitions(self, names):
+        """Creates planned artifact definitions for testing.
+
+        Args:
+          names (list[str]): names of the artifact definitions.
+
+        Returns:
+          list[PlannedDefinition]: planned artifact definitions.
+        """
+        return [
+            definitions_planner.PlannedDefinition(
+                artifacts_artifact.ArtifactDefinition(name, description=name)
+            )
+            for name in names
+        ]
+
+    def testOpenClose(self):
+        """Tests the Open and Close functions."""
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "history.db")
+
+            history = definitions_history.ArtifactDefinitionsHistory()
+            history.Open(path)
+
+            with self.assertRaises(IOError):
+                history.Open(path)
+
+            history.Close()
+
+            with self.assertRaises(IOError):
+                history.Close()
+
+    def testOpenReadOnly(self):
+        """Tests the Open function with read_only."""
+        planned_definitions = self._CreateTestPlannedDefinitions(
+            ["WindowsPrefetch", "WindowsSAM"]
+        )
+
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "history.db")
+
+            history = definitions_history.ArtifactDefinitionsHistory()
+
+            with self.assertRaises(IOError):
+                history.Open(path, read_only=True)
+
+            history.Open(path)
+            history.AddResults("10.0.19041.1", {"WindowsPrefetch": 0, "WindowsSAM": 1})
+
+            read_only_history = definitions_history.ArtifactDefinitionsHistory()
+            read_only_history.Open(path, read_only=True)
+
+            try:
+                with self.assertRaises(IOError):
+                    read_only_history.AddResults("10.0.19041.1", {"WindowsSAM": 1})
+
+                # Results added by the writer are visible to the reader.
+                history.AddResults(
+                    "10.0.19041.1", {"WindowsPrefetch": 0, "WindowsSAM": 1}
+                )
+
+                prioritized_definitions = read_only_history.PrioritizeDefinitions(
+                    planned_definitions, "10.0.19041.1", skip_unmatched=True
+                )
+                names = [
+                    planned_definition.artifact_definition.name
+                    for planned_definition in prioritized_definitions
+                ]
+                self.assertEqual(names, ["WindowsSAM"])
+
+            finally:
+                read_only_history.Close()
+                history.Close()
+
+    def testPrioritizeDefinitions(self):
+        """Tests the AddResults and PrioritizeDefinitions functions."""
+        planned_definitions = self._CreateTestPlannedDefinitions(
+            ["WindowsPrefetch", "WindowsSAM", "WindowsUnknown", "WindowsXPLogs"]
+        )
+
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "history.db")
+
+            history = definitions_history.ArtifactDefinitionsHistory()
+            history.Open(path)
+
+            try:
+                history.AddResults(
+                    "10.0.19041.1",
+                    {"WindowsPrefetch": 0, "WindowsSAM": 1, "WindowsXPLogs": 0},
+                )
+                # Note that the update build revision is not part of the version
+                # in the history.
+                history.AddResults(
+                    "10.0.19041.3636",
+                    {"WindowsPrefetch": 5, "WindowsSAM": 1, "WindowsXPLogs": 0},
+                )
+
+                prioritized_definitions = history.PrioritizeDefinitions(
+                    planned_definitions, "10.0.19041.1"
+                )
+                names = [
+                    planned_definition.artifact_definition.name
+                    for planned_definition in prioritized_definitions
+                ]
+                self.assertEqual(
+                    names,
+                    [
+                        "WindowsSAM",
+                        "WindowsPrefetch",
+                        "WindowsUnknown",
+                        "WindowsXPLogs",
+                    ],
+                )
+
+                prioritized_definitions = history.PrioritizeDefinitions(
+                    planned_definitions, "10.0.19041.1", skip_unmatched=True
+                )
+                names = [
+                    planned_definition.artifact_definition.name
+                    for planned_definition in prioritized_definitions
+                ]
+                self.assertEqual(
+                    names, ["WindowsSAM", "WindowsPrefetch", "WindowsUnknown"]
+                )
+
+                prioritized_definitions = history.PrioritizeDefinitions(
+                    planned_definitions, "5.1.2600.5512", skip_unmatched=True
+                )
+                self.assertEqual(len(prioritized_definitions), 4)
+
+            finally:
+                history.Close()
+
+
+if __name__ == "__main__":
+    unittest.main()
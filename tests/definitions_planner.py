@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Tests for the artifact definitions planner."""
+
+import unittest
+
+from artifacts import artifact as artifacts_artifact
+from artifacts import definitions as artifacts_definitions
+
+from artifactsrc import definitions_planner
+
+from tests import test_lib
+
+
+class ArtifactDefinitionsPlannerTest(test_lib.BaseTestCase):
+    """Tests for the artifact definitions planner."""
+
+    # pylint: disable=protected-access
+
+    def _CreateTestDefinition(self, name, paths, separator="\\"):
+        """Creates an artifact definition for testing.
+
+        Args:
+          name (str): name of the artifact definition.
+          paths (list[str]): paths of the file source.
+          separator (Optional[str]): path segment separator.
+
+        Returns:
+          artifacts.ArtifactDefinition: artifact definition.
+        """
+        artifact_definition = artifacts_artifact.ArtifactDefinition(
+            name, description=name
+        )
+        artifact_definition.AppendSource(
+            artifacts_definitions.TYPE_INDICATOR_FILE,
+            {"paths": paths, "separator": separator},
+        )
+        return artifact_definition
+
+    def testGetGlobStarRecursionDepth(self):
+        """Tests the _GetGlobStarRecursionDepth function."""
+        planner = definitions_planner.ArtifactDefinitionsPlanner()
+
+        self.assertEqual(planner._GetGlobStarRecursionDepth("*"), 0)
+        self.assertEqual(planner._GetGlobStarRecursionDepth("**"), 10)
+        self.assertEqual(planner._GetGlobStarRecursionDepth("**3"), 3)
+        self.assertEqual(planner._GetGlobStarRecursionDepth("**99"), 10)
+
+    def testIsLiteralPathSegment(self):
+        """Tests the _IsLiteralPathSegment function."""
+        planner = definitions_planner.ArtifactDefinitionsPlanner()
+
+        self.assertTrue(planner._IsLiteralPathSegment("system32"))
+        self.assertTrue(planner._IsLiteralPathSegment("%%environ_systemroot%%"))
+        self.assertFalse(planner._IsLiteralPathSegment("*.evtx"))
+        self.assertFalse(planner._IsLiteralPathSegment("%%users.homedir%%"))
+
+    def testPlanPath(self):
+        """Tests the _PlanPath function."""
+        planner = definitions_planner.ArtifactDefinitionsPlanner()
+
+        estimated_cost, literal_prefix, number_of_literal_segments = planner._PlanPath(
+            "\\Windows\\System32\\config\\SAM", "\\"
+        )
+        self.assertEqual(estimated_cost, 4)
+        self.assertEqual(literal_prefix, ["windows", "system32", "config", "sam"])
+        self.assertEqual(number_of_literal_segments, 4)
+
+        estimated_cost, literal_prefix, number_of_literal_segments = planner._PlanPath(
+            "\\Windows\\*\\config", "\\"
+        )
+        self.assertEqual(estimated_cost, 17)
+        self.assertEqual(literal_prefix, ["windows"])
+        self.assertEqual(number_of_literal_segments, 2)
+
+    def testPlanDefinition(self):
+        """Tests the PlanDefinition function."""
+        planner = definitions_planner.ArtifactDefinitionsPlanner()
+
+        artifact_definition = self._CreateTestDefinition(
+            "WindowsEventLogs",
+            [
+                "%%environ_systemroot%%\\System32\\winevt\\Logs\\*.evtx",
+                "%%environ_systemroot%%\\System32\\config\\*.evt",
+            ],
+        )
+
+        planned_definition = planner.PlanDefinition(artifact_definition)
+        self.assertEqual(planned_definition.estimated_cost, 23)
+        self.assertEqual(
+            planned_definition.locality_key,
+            ("\\", ("%%environ_systemroot%%", "system32")),
+        )
+        self.assertEqual(planned_definition.number_of_literal_segments, 7)
+        self.assertEqual(planned_definition.number_of_segments, 9)
+
+    def testPlanDefinitions(self):
+        """Tests the PlanDefinitions function."""
+        planner = definitions_planner.ArtifactDefinitionsPlanner()
+
+        artifact_definitions = [
+            self._CreateTestDefinition("LinuxPasswd", ["/etc/passwd"], separator="/"),
+            self._CreateTestDefinition("WindowsPrefetch", ["\\Windows\\Prefetch\\*"]),
+            self._CreateTestDefinition("WindowsSAM", ["\\Windows\\config\\SAM"]),
+            self._CreateTestDefinition("WindowsAll", ["\\Windows\\**"]),
+            self._CreateTestDefinition("WindowsSystem", ["\\Windows\\config\\SYSTEM"]),
+        ]
+
+        planned_definitions = planner.PlanDefinitions(artifact_definitions)
+        names = [
+            planned_definition.artifact_definition.name
+            for planned_definition in planned_definitions
+        ]
+        self.assertEqual(
+            names,
+            [
+                "LinuxPasswd",
+                "WindowsAll",
+                "WindowsSAM",
+                "WindowsSystem",
+                "WindowsPrefetch",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
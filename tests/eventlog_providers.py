@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Tests for the Windows EventLog providers."""
+
+import unittest
+
+from dfwinreg import definitions as dfwinreg_definitions
+from dfwinreg import fake as dfwinreg_fake
+from dfwinreg import registry as dfwinreg_registry
+
+from artifactsrc import eventlog_providers
+
+from tests import test_lib
+
+
+class EventLogProvidersReaderTest(test_lib.BaseTestCase):
+    """Tests for the Windows EventLog providers reader."""
+
+    # pylint: disable=protected-access
+
+    def _CreateTestWindowsRegistry(self):
+        """Creates a Windows Registry with EventLog providers for testing.
+
+        Returns:
+          dfwinreg.WinRegistry: Windows Registry.
+        """
+        registry_file = dfwinreg_fake.FakeWinRegistryFile(
+            key_path_prefix="HKEY_LOCAL_MACHINE\\System"
+        )
+
+        select_key = dfwinreg_fake.FakeWinRegistryKey("Select")
+        select_key.AddValue(
+            dfwinreg_fake.FakeWinRegistryValue(
+                "Current",
+                data=(1).to_bytes(4, "little"),
+                data_type=dfwinreg_definitions.REG_DWORD_LITTLE_ENDIAN,
+            )
+        )
+        registry_file.AddKeyByPath("\\", select_key)
+
+        for log_type, provider_name, event_message_file in (
+            ("Application", "TestProvider", "%SystemRoot%\\System32\\test.dll"),
+            ("Application", "Other", "\\SystemRoot\\System32\\other.dll"),
+            ("System", "TestProvider", "System32\\test.dll;C:\\Test\\test.exe"),
+        ):
+            provider_key = dfwinreg_fake.FakeWinRegistryKey(provider_name)
+            provider_key.AddValue(
+                dfwinreg_fake.FakeWinRegistryValue(
+                    "EventMessageFile",
+                    data=event_message_file.encode("utf-16-le"),
+                    data_type=dfwinreg_definitions.REG_EXPAND_SZ,
+                )
+            )
+            registry_file.AddKeyByPath(
+                f"\\ControlSet001\\Services\\EventLog\\{log_type:s}", provider_key
+            )
+
+        registry_file.Open(None)
+
+        win_registry = dfwinreg_registry.WinRegistry()
+        win_registry.MapFile("HKEY_LOCAL_MACHINE\\System", registry_file)
+
+        return win_registry
+
+    def testNormalizeMessageFilePath(self):
+        """Tests the _NormalizeMessageFilePath function."""
+        reader = eventlog_providers.EventLogProvidersReader(None)
+
+        for path, expected_path in (
+            ("%SystemRoot%\\System32\\test.dll", "%SystemRoot%\\System32\\test.dll"),
+            ("\\SystemRoot\\System32\\test.dll", "%SystemRoot%\\System32\\test.dll"),
+            ("SystemRoot\\System32\\test.dll", "%SystemRoot%\\System32\\test.dll"),
+            ("System32\\test.dll", "%SystemRoot%\\System32\\test.dll"),
+            (" C:\\Test\\test.exe", "C:\\Test\\test.exe"),
+        ):
+            normalized_path = reader._NormalizeMessageFilePath(path)
+            self.assertEqual(normalized_path, expected_path)
+
+    def testReadProviders(self):
+        """Tests the ReadProviders function."""
+        win_registry = self._CreateTestWindowsRegistry()
+        reader = eventlog_providers.EventLogProvidersReader(win_registry)
+
+        providers = reader.ReadProviders()
+        self.assertEqual(len(providers), 2)
+
+        self.assertEqual(providers[0].name, "Other")
+        self.assertEqual(
+            providers[0].event_message_files, ["%SystemRoot%\\System32\\other.dll"]
+        )
+
+        self.assertEqual(providers[1].name, "TestProvider")
+        self.assertEqual(providers[1].log_types, ["Application", "System"])
+        self.assertEqual(
+            providers[1].event_message_files,
+            ["%SystemRoot%\\System32\\test.dll", "C:\\Test\\test.exe"],
+        )
+
+        reader = eventlog_providers.EventLogProvidersReader(
+            dfwinreg_registry.WinRegistry()
+        )
+
+        providers = reader.ReadProviders()
+        self.assertEqual(providers, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Tests for the find specifications cache."""
+
+import unittest
+
+from dfimagetools import resources as dfimagetools_resources
+
+from artifactsrc import find_specs_cache
+
+from tests import test_lib
+
+
+class TestArtifactDefinitionFiltersGenerator:
+    """Artifact definition filters generator for testing.
+
+    Attributes:
+      number_of_calls (int): number of times GetFindSpecs was called.
+    """
+
+    def __init__(self):
+        """Initializes an artifact definition filters generator."""
+        super().__init__()
+        self.number_of_calls = 0
+
+    def GetFindSpecs(self, names=None):
+        """Retrieves find specifications for one or more artifact definitions.
+
+        Args:
+          names (Optional[list[str]]): names of the artifact definitions to
+              filter on.
+
+        Yields:
+          str: find specification.
+        """
+        self.number_of_calls += 1
+        for name in names or []:
+            yield f"find_spec:{name:s}"
+
+
+class FindSpecsCacheTest(test_lib.BaseTestCase):
+    """Tests for the find specifications cache."""
+
+    def testGetFindSpecs(self):
+        """Tests the GetFindSpecs function."""
+        filter_generator = TestArtifactDefinitionFiltersGenerator()
+        test_cache = find_specs_cache.FindSpecsCache(maximum_number_of_cached_entries=2)
+
+        find_specs = test_cache.GetFindSpecs(filter_generator, "WindowsSAM", "1")
+        self.assertEqual(find_specs, ["find_spec:WindowsSAM"])
+
+        find_specs = test_cache.GetFindSpecs(filter_generator, "windowssam", "1")
+        self.assertEqual(find_specs, ["find_spec:WindowsSAM"])
+        self.assertEqual(filter_generator.number_of_calls, 1)
+        self.assertEqual(test_cache.number_of_cache_hits, 1)
+        self.assertEqual(test_cache.number_of_cache_misses, 1)
+
+        test_cache.GetFindSpecs(filter_generator, "WindowsSAM", "2")
+        self.assertEqual(filter_generator.number_of_calls, 2)
+
+        # Test that the least recently used entry is removed.
+        test_cache.GetFindSpecs(filter_generator, "WindowsSystem", "1")
+        test_cache.GetFindSpecs(filter_generator, "WindowsSAM", "1")
+        self.assertEqual(filter_generator.number_of_calls, 4)
+
+    def testGetFingerprint(self):
+        """Tests the GetFingerprint function."""
+        test_cache = find_specs_cache.FindSpecsCache()
+
+        environment_variable = dfimagetools_resources.EnvironmentVariable(
+            case_sensitive=False, name="SystemRoot", value="C:\\Windows"
+        )
+        user_account = dfimagetools_resources.UserAccount(
+            user_directory="C:\\Users\\test", username="test"
+        )
+
+        fingerprint = test_cache.GetFingerprint([], [])
+        self.assertIsNotNone(fingerprint)
+
+        other_fingerprint = test_cache.GetFingerprint([environment_variable], [])
+        self.assertNotEqual(fingerprint, other_fingerprint)
+
+        fingerprint = test_cache.GetFingerprint([environment_variable], [user_account])
+        self.assertNotEqual(fingerprint, other_fingerprint)
+
+        other_fingerprint = test_cache.GetFingerprint(
+            [environment_variable], [user_account]
+        )
+        self.assertEqual(fingerprint, other_fingerprint)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Tests for the store of Windows message table strings."""
+
+import os
+import unittest
+
+from artifactsrc import message_store
+
+from tests import test_lib
+
+
+class MessageStoreTest(test_lib.BaseTestCase):
+    """Tests for the store of Windows message table strings."""
+
+    # pylint: disable=protected-access
+
+    def testOpenClose(self):
+        """Tests the Open and Close functions."""
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "messages.db")
+
+            store = message_store.MessageStore()
+            store.Open(path)
+
+            with self.assertRaises(IOError):
+                store.Open(path)
+
+            store.Close()
+
+            with self.assertRaises(IOError):
+                store.Close()
+
+    def testAddMessageFiles(self):
+        """Tests the AddMessageFiles and HasMessageFile functions."""
+        message_file1 = message_store.MessageFile(
+            "p1", "C:\\Windows\\System32\\WEVTAPI.dll"
+        )
+        message_file1.file_version = "10.0.19041.1"
+        message_file1.messages = [
+            (0x0409, 1, "Category\r\n"),
+            (0x0413, 1, "Categorie\r\n"),
+        ]
+
+        message_file2 = message_store.MessageFile(
+            "p2", "C:\\Windows\\System32\\wevtapi.dll"
+        )
+        message_file2.file_version = "10.0.19041.1"
+        message_file2.messages = [(0x0409, 1, "Category\r\n")]
+
+        self.assertEqual(message_file1.name, "wevtapi.dll")
+
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "messages.db")
+
+            store = message_store.MessageStore()
+
+            with self.assertRaises(IOError):
+                store.AddMessageFiles([message_file1])
+
+            store.Open(path)
+
+            try:
+                self.assertFalse(store.HasMessageFile("wevtapi.dll", "10.0.19041.1"))
+
+                number_of_message_files = store.AddMessageFiles(
+                    [message_file1, message_file2]
+                )
+                self.assertEqual(number_of_message_files, 1)
+                self.assertEqual(store.GetNumberOfMessages(), 2)
+
+                self.assertTrue(store.HasMessageFile("wevtapi.dll", "10.0.19041.1"))
+                self.assertFalse(store.HasMessageFile("wevtapi.dll", "10.0.19041.2"))
+                self.assertFalse(store.HasMessageFile("wevtapi.dll", None))
+
+            finally:
+                store.Close()
+
+    def testAddMessageFilesWithoutFileVersion(self):
+        """Tests the AddMessageFiles function with unversioned message files."""
+        message_file = message_store.MessageFile(
+            "p1", "C:\\Windows\\System32\\unversioned.dll"
+        )
+        message_file.messages = [(0x0409, 1, "Category\r\n")]
+
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "messages.db")
+
+            store = message_store.MessageStore()
+            store.Open(path)
+
+            try:
+                self.assertFalse(store.HasMessageFile("unversioned.dll", None))
+
+                number_of_message_files = store.AddMessageFiles([message_file])
+                self.assertEqual(number_of_message_files, 1)
+
+                self.assertTrue(store.HasMessageFile("unversioned.dll", None))
+
+                number_of_message_files = store.AddMessageFiles([message_file])
+                self.assertEqual(number_of_message_files, 0)
+
+                cursor = store._connection.execute(
+                    "SELECT COUNT(*) FROM message_files WHERE name = ?",
+                    ("unversioned.dll",),
+                )
+                number_of_rows, *_ = cursor.fetchone()
+                self.assertEqual(number_of_rows, 1)
+                self.assertEqual(store.GetNumberOfMessages(), 1)
+
+            finally:
+                store.Close()
+
+
+if __name__ == "__main__":
+    unittest.main()
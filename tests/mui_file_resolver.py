@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Tests for the MUI resource file resolver."""
+
+import os
+import unittest
+
+from dfvfs.helpers import windows_path_resolver as dfvfs_windows_path_resolver
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as dfvfs_path_spec_factory
+from dfvfs.resolver import resolver as dfvfs_resolver
+
+from artifactsrc import mui_file_resolver
+
+from tests import test_lib
+
+
+class MUIFileResolverTest(test_lib.BaseTestCase):
+    """Tests for the MUI resource file resolver."""
+
+    # pylint: disable=protected-access
+
+    def testGetLanguageFallbacks(self):
+        """Tests the _GetLanguageFallbacks function."""
+        resolver = mui_file_resolver.MUIFileResolver(None, None)
+
+        fallbacks = resolver._GetLanguageFallbacks(
+            ["nl-NL", "en-US"], ["de-de", "en-gb", "en-us", "nl-be"]
+        )
+        self.assertEqual(fallbacks, ["nl-nl", "en-us", "en-gb", "nl-be", "de-de"])
+
+    def testGetMUIFilePath(self):
+        """Tests the GetMUIFilePath function."""
+        with test_lib.TempDirectory() as temp_directory:
+            system_directory = os.path.join(temp_directory, "Windows", "System32")
+            for language, filename in (
+                ("en-GB", "other.dll.mui"),
+                ("en-US", "test.dll.mui"),
+                ("nl-NL", "test.dll.mui"),
+                ("drivers", "test.dll.mui"),
+            ):
+                os.makedirs(os.path.join(system_directory, language), exist_ok=True)
+                with open(
+                    os.path.join(system_directory, language, filename), "wb"
+                ) as file_object:
+                    file_object.write(b"bogus")
+
+            mount_point = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_OS, location=temp_directory
+            )
+            file_system = dfvfs_resolver.Resolver.OpenFileSystem(mount_point)
+            path_resolver = dfvfs_windows_path_resolver.WindowsPathResolver(
+                file_system, mount_point
+            )
+
+            path_resolver.SetEnvironmentVariable("SystemRoot", "C:\\Windows")
+
+            resolver = mui_file_resolver.MUIFileResolver(file_system, path_resolver)
+
+            mui_path = resolver.GetMUIFilePath("C:\\Windows\\System32\\test.dll")
+            self.assertEqual(mui_path, "C:\\Windows\\System32\\en-US\\test.dll.mui")
+
+            mui_path = resolver.GetMUIFilePath(
+                "C:\\Windows\\System32\\TEST.DLL", languages=["nl-NL"]
+            )
+            self.assertEqual(mui_path, "C:\\Windows\\System32\\nl-NL\\test.dll.mui")
+
+            # Test fallback to a language with the same primary language.
+            mui_path = resolver.GetMUIFilePath("C:\\Windows\\System32\\other.dll")
+            self.assertEqual(mui_path, "C:\\Windows\\System32\\en-GB\\other.dll.mui")
+
+            # Test fallback to any other language.
+            mui_path = resolver.GetMUIFilePath(
+                "C:\\Windows\\System32\\test.dll", languages=["de-DE"]
+            )
+            self.assertEqual(mui_path, "C:\\Windows\\System32\\en-US\\test.dll.mui")
+
+            # Test that the listings are shared by different Windows paths of
+            # the same directory.
+            mui_path = resolver.GetMUIFilePath("%SystemRoot%\\system32\\test.dll")
+            self.assertEqual(mui_path, "%SystemRoot%\\system32\\en-US\\test.dll.mui")
+
+            mui_path = resolver.GetMUIFilePath("C:\\Windows\\System32\\bogus.dll")
+            self.assertIsNone(mui_path)
+
+            mui_path = resolver.GetMUIFilePath("C:\\Windows\\bogus.dll")
+            self.assertIsNone(mui_path)
+
+            # The System32 directory and its en-GB, en-US and nl-NL language
+            # subdirectories are listed only once.
+            self.assertEqual(resolver.number_of_directory_listings, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
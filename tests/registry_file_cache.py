@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Tests for the Windows Registry file cache."""
+
+import os
+import shutil
+import unittest
+
+from dfvfs.helpers import windows_path_resolver as dfvfs_windows_path_resolver
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as dfvfs_path_spec_factory
+from dfvfs.resolver import resolver as dfvfs_resolver
+
+from artifactsrc import registry_file_cache
+
+from tests import test_lib
+
+
+class RegistryFileCacheTest(test_lib.BaseTestCase):
+    """Tests for the Windows Registry file cache."""
+
+    def testCacheData(self):
+        """Tests the CacheData and GetData functions."""
+        cache = registry_file_cache.RegistryFileCache(maximum_cached_data_size=16)
+
+        cache.CacheData("p1", "C:\\Windows\\System32\\config\\SYSTEM", b"A" * 8)
+        cache.CacheData("p1", "C:\\Windows\\System32\\config\\SOFTWARE", b"B" * 8)
+
+        data = cache.GetData("p1", "c:\\windows\\system32\\config\\system")
+        self.assertEqual(data, b"A" * 8)
+
+        # The least recently used data is removed when the maximum is exceeded.
+        cache.CacheData("p1", "C:\\Windows\\System32\\config\\SAM", b"C" * 8)
+
+        data = cache.GetData("p1", "C:\\Windows\\System32\\config\\SOFTWARE")
+        self.assertIsNone(data)
+
+        data = cache.GetData("p1", "C:\\Windows\\System32\\config\\SYSTEM")
+        self.assertIsNotNone(data)
+
+        data = cache.GetData("p2", "C:\\Windows\\System32\\config\\SYSTEM")
+        self.assertIsNone(data)
+
+        # Data larger than the maximum is not cached.
+        cache.CacheData("p1", "C:\\Windows\\System32\\config\\SECURITY", b"D" * 32)
+
+        data = cache.GetData("p1", "C:\\Windows\\System32\\config\\SECURITY")
+        self.assertIsNone(data)
+
+        self.assertEqual(cache.number_of_cache_hits, 2)
+        self.assertEqual(cache.number_of_cache_misses, 3)
+
+
+class CachingWindowsRegistryFileReaderTest(test_lib.BaseTestCase):
+    """Tests for the caching Windows Registry file reader."""
+
+    def _CreateTestReader(self, path, registry_file_cache_object):
+        """Creates a caching Windows Registry file reader for testing.
+
+        Every reader opens the file system again, as when a storage media image
+        is scanned again.
+
+        Args:
+          path (str): path of the directory that contains the Windows directory.
+          registry_file_cache_object (RegistryFileCache): Windows Registry file
+              cache.
+
+        Returns:
+          CachingWindowsRegistryFileReader: caching Windows Registry file reader.
+        """
+        mount_point = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location=path
+        )
+        file_system = dfvfs_resolver.Resolver.OpenFileSystem(mount_point)
+        path_resolver = dfvfs_windows_path_resolver.WindowsPathResolver(
+            file_system, mount_point
+        )
+
+        return registry_file_cache.CachingWindowsRegistryFileReader(
+            file_system,
+            path_resolver,
+            registry_file_cache_object,
+            cache_identifier=(path, "p1"),
+        )
+
+    def _CreateTestWindowsDirectory(self, path):
+        """Creates a Windows directory with Windows Registry files for testing.
+
+        Args:
+          path (str): path of the directory in which to create the Windows
+              directory.
+        """
+        config_directory = os.path.join(path, "Windows", "System32", "config")
+        os.makedirs(config_directory)
+
+        shutil.copy(
+            self._GetTestFilePath(["regf_test.hiv"]),
+            os.path.join(config_directory, "SYSTEM"),
+        )
+        with open(os.path.join(config_directory, "SECURITY"), "wb") as file_object:
+            file_object.write(b"bogus")
+
+    def testOpen(self):
+        """Tests the Open function."""
+        test_file_path = self._GetTestFilePath(["regf_test.hiv"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestWindowsDirectory(temp_directory)
+
+            cache = registry_file_cache.RegistryFileCache()
+            reader = self._CreateTestReader(temp_directory, cache)
+
+            # The data is read from the storage media image only once.
+            for _ in range(2):
+                registry_file = reader.Open("C:\\Windows\\System32\\config\\SYSTEM")
+                self.assertIsNotNone(registry_file)
+
+                try:
+                    root_key = registry_file.GetRootKey()
+                    self.assertIsNotNone(root_key)
+
+                    registry_value = root_key.GetValueByName("Test")
+                    self.assertIsNotNone(registry_value)
+                    self.assertEqual(registry_value.GetDataAsObject(), 1)
+
+                finally:
+                    registry_file.Close()
+
+            self.assertEqual(cache.number_of_cache_hits, 1)
+            self.assertEqual(cache.number_of_cache_misses, 1)
+
+            registry_file = reader.Open("C:\\Windows\\System32\\config\\SECURITY")
+            self.assertIsNone(registry_file)
+
+            registry_file = reader.Open("C:\\Windows\\System32\\config\\SAM")
+            self.assertIsNone(registry_file)
+
+    def testOpenAfterRescan(self):
+        """Tests the Open function when a storage media image is scanned again."""
+        test_file_path = self._GetTestFilePath(["regf_test.hiv"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestWindowsDirectory(temp_directory)
+
+            cache = registry_file_cache.RegistryFileCache()
+
+            for _ in range(2):
+                reader = self._CreateTestReader(temp_directory, cache)
+                registry_file = reader.Open("C:\\Windows\\System32\\config\\SYSTEM")
+                self.assertIsNotNone(registry_file)
+                registry_file.Close()
+
+            self.assertEqual(cache.number_of_cache_hits, 1)
+            self.assertEqual(cache.number_of_cache_misses, 1)
+
+            # A modified Windows Registry file is read again.
+            path = os.path.join(
+                temp_directory, "Windows", "System32", "config", "SYSTEM"
+            )
+            stat_object = os.stat(path)
+            os.utime(
+                path, ns=(stat_object.st_atime_ns, stat_object.st_mtime_ns + 10**9)
+            )
+
+            reader = self._CreateTestReader(temp_directory, cache)
+            registry_file = reader.Open("C:\\Windows\\System32\\config\\SYSTEM")
+            self.assertIsNotNone(registry_file)
+            registry_file.Close()
+
+            self.assertEqual(cache.number_of_cache_hits, 1)
+            self.assertEqual(cache.number_of_cache_misses, 2)
+
+    def testOpenWithoutCaching(self):
+        """Tests the Open function with a file larger than the cache maximum."""
+        test_file_path = self._GetTestFilePath(["regf_test.hiv"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestWindowsDirectory(temp_directory)
+
+            cache = registry_file_cache.RegistryFileCache(maximum_cached_data_size=4096)
+            reader = self._CreateTestReader(temp_directory, cache)
+
+            # The file is read from the storage media image every time, since it
+            # is larger than the maximum size of the cache.
+            for _ in range(2):
+                registry_file = reader.Open("C:\\Windows\\System32\\config\\SYSTEM")
+                self.assertIsNotNone(registry_file)
+
+                try:
+                    registry_value = registry_file.GetRootKey().GetValueByName("Test")
+                    self.assertEqual(registry_value.GetDataAsObject(), 1)
+
+                finally:
+                    registry_file.Close()
+
+            self.assertEqual(cache.number_of_cache_hits, 0)
+            self.assertEqual(cache.number_of_cache_misses, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Tests for the Windows Registry key paths trie."""
+
+import unittest
+
+from unittest import mock
+
+from dfwinreg import fake as dfwinreg_fake
+from dfwinreg import registry as dfwinreg_registry
+
+from artifactsrc import registry_key_trie
+
+from tests import test_lib
+
+
+class RegistryKeyPathTrieTest(test_lib.BaseTestCase):
+    """Tests for the Windows Registry key paths trie."""
+
+    # pylint: disable=protected-access
+
+    def _CreateTestRegistry(self):
+        """Creates a Windows Registry for testing.
+
+        Returns:
+          dfwinreg.WinRegistry: Windows Registry.
+        """
+        registry_file = dfwinreg_fake.FakeWinRegistryFile(
+            key_path_prefix="HKEY_LOCAL_MACHINE\\Software"
+        )
+        for key_path in (
+            "\\Microsoft\\Windows\\CurrentVersion\\Run",
+            "\\Microsoft\\Windows\\CurrentVersion\\RunOnce",
+            "\\Microsoft\\Windows NT\\CurrentVersion\\ProfileList\\S-1-5-18",
+            "\\Microsoft\\Windows NT\\CurrentVersion\\Winlogon",
+        ):
+            parent_key_path, _, name = key_path.rpartition("\\")
+            registry_file.AddKeyByPath(
+                parent_key_path, dfwinreg_fake.FakeWinRegistryKey(name)
+            )
+
+        registry_file.Open(None)
+
+        win_registry = dfwinreg_registry.WinRegistry()
+        win_registry.MapFile("HKEY_LOCAL_MACHINE\\Software", registry_file)
+
+        registry_file = dfwinreg_fake.FakeWinRegistryFile(
+            key_path_prefix="HKEY_LOCAL_MACHINE\\System"
+        )
+        registry_file.AddKeyByPath("\\", dfwinreg_fake.FakeWinRegistryKey("Select"))
+        registry_file.Open(None)
+
+        win_registry.MapFile("HKEY_LOCAL_MACHINE\\System", registry_file)
+        return win_registry
+
+    def testGetKeysByPath(self):
+        """Tests the GetKeysByPath function."""
+        trie = registry_key_trie.RegistryKeyPathTrie(self._CreateTestRegistry())
+
+        keys = trie.GetKeysByPath(
+            "HKLM\\Software\\Microsoft\\Windows\\CurrentVersion\\Run"
+        )
+        self.assertEqual([key.name for key in keys], ["Run"])
+
+        keys = trie.GetKeysByPath(
+            "HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Run*"
+        )
+        self.assertEqual(sorted(key.name for key in keys), ["Run", "RunOnce"])
+
+        keys = trie.GetKeysByPath(
+            "HKEY_LOCAL_MACHINE\\Software\\Microsoft\\*\\CurrentVersion"
+        )
+        self.assertEqual(len(keys), 2)
+
+        keys = trie.GetKeysByPath("HKEY_LOCAL_MACHINE\\Software\\Bogus\\Key")
+        self.assertEqual(keys, [])
+
+        # Key paths that share a prefix are resolved only once.
+        number_of_key_lookups = trie.number_of_key_lookups
+        keys = trie.GetKeysByPath(
+            "HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Windows\\CurrentVersion\\Run"
+        )
+        self.assertEqual(len(keys), 1)
+        self.assertEqual(trie.number_of_key_lookups, number_of_key_lookups)
+
+    def testGetKeysByPathWithRootKeyGlob(self):
+        """Tests the GetKeysByPath function with a glob in the root key subkey."""
+        trie = registry_key_trie.RegistryKeyPathTrie(self._CreateTestRegistry())
+
+        keys = trie.GetKeysByPath("HKEY_LOCAL_MACHINE\\S*\\Select")
+        self.assertEqual([key.name for key in keys], ["Select"])
+
+        keys = trie.GetKeysByPath("HKEY_LOCAL_MACHINE\\*\\Microsoft\\Windows")
+        self.assertEqual([key.name for key in keys], ["Windows"])
+
+        subkey_names = trie._GetRootKeySubkeyNames("HKEY_USERS")
+        self.assertEqual(subkey_names, ["S-1-5-18", "S-1-5-18_Classes"])
+
+    def testGetKeysByPathLookups(self):
+        """Tests that GetKeysByPath resolves key paths segment by segment."""
+        win_registry = self._CreateTestRegistry()
+        trie = registry_key_trie.RegistryKeyPathTrie(win_registry)
+
+        with mock.patch.object(
+            win_registry, "GetKeyByPath", wraps=win_registry.GetKeyByPath
+        ) as get_key_by_path:
+            keys = trie.GetKeysByPath(
+                "HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Windows NT\\"
+                "CurrentVersion\\Winlogon"
+            )
+            self.assertEqual([key.name for key in keys], ["Winlogon"])
+
+            # Only the key of the Windows Registry file is retrieved by path.
+            get_key_by_path.assert_called_once_with("HKEY_LOCAL_MACHINE\\Software")
+
+        self.assertEqual(trie.number_of_key_lookups, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -955,6 +955,13 @@ class MessageResourceFileTest(test_lib.BaseTestCase):
         self.assertIsNone(message_resource_file.product_version)
 
         # Test with empty version information.
+        message_resource_file = resource_file.MessageResourceFile(
+            "C:\\Windows\\System32\\test.dll"
+        )
+
+        wrc_stream = TestWrcStream()
+        message_resource_file._wrc_stream = wrc_stream
+
         wrc_resource = TestWrcResource()
         wrc_stream.resources[0x10] = wrc_resource
 
@@ -970,6 +977,72 @@ class MessageResourceFileTest(test_lib.BaseTestCase):
         self.assertEqual(message_resource_file.file_version, "0.0.0.0")
         self.assertEqual(message_resource_file.product_version, "2.0.0.0")
 
+    def testGetResourceLanguages(self):
+        """Tests the _GetResourceLanguages function."""
+        message_resource_file = resource_file.MessageResourceFile(
+            "C:\\Windows\\System32\\test.dll"
+        )
+
+        wrc_stream = TestWrcStream()
+        message_resource_file._wrc_stream = wrc_stream
+
+        wrc_resource = TestWrcResource()
+        wrc_stream.resources[0x10] = wrc_resource
+
+        for item_identifier, language_identifiers in (
+            (1, [0x0407, 0x0409]),
+            (2, [0x0409, 0x0413]),
+        ):
+            wrc_resource_item = TestWrcResourceItem(item_identifier)
+            wrc_resource.items.append(wrc_resource_item)
+
+            for language_identifier in language_identifiers:
+                wrc_resource_sub_item = TestWrcResourceItem(language_identifier)
+                wrc_resource_item.sub_items.append(wrc_resource_sub_item)
+
+        resource_languages = message_resource_file._GetResourceLanguages(0x10)
+        self.assertEqual(list(resource_languages.keys()), [0x0407, 0x0409, 0x0413])
+        self.assertIs(resource_languages[0x0409], wrc_resource.items[0].sub_items[1])
+
+        # Test that the index is built only once.
+        del wrc_stream.resources[0x10]
+
+        resource_languages = message_resource_file._GetResourceLanguages(0x10)
+        self.assertEqual(len(resource_languages), 3)
+
+        resource_languages = message_resource_file._GetResourceLanguages("MUI")
+        self.assertEqual(resource_languages, {})
+
+    def testGetResourceSubItem(self):
+        """Tests the _GetResourceSubItem function."""
+        message_resource_file = resource_file.MessageResourceFile(
+            "C:\\Windows\\System32\\test.dll", preferred_language_identifier=0x0413
+        )
+
+        wrc_stream = TestWrcStream()
+        message_resource_file._wrc_stream = wrc_stream
+
+        wrc_resource = TestWrcResource()
+        wrc_stream.resources[0x10] = wrc_resource
+
+        wrc_resource_item = TestWrcResourceItem(1)
+        wrc_resource.items.append(wrc_resource_item)
+
+        for language_identifier in (0x0407, 0x0413):
+            wrc_resource_sub_item = TestWrcResourceItem(language_identifier)
+            wrc_resource_item.sub_items.append(wrc_resource_sub_item)
+
+        wrc_resource_sub_item = message_resource_file._GetResourceSubItem(0x10)
+        self.assertEqual(wrc_resource_sub_item.identifier, 0x0413)
+
+        message_resource_file._preferred_language_identifier = 0x0409
+
+        wrc_resource_sub_item = message_resource_file._GetResourceSubItem(0x10)
+        self.assertEqual(wrc_resource_sub_item.identifier, 0x0407)
+
+        wrc_resource_sub_item = message_resource_file._GetResourceSubItem(0x0B)
+        self.assertIsNone(wrc_resource_sub_item)
+
     def testGetVersionInformationResourceNoWrc(self):
         """Tests the _GetVersionInformationResource function."""
         test_file_path = self._GetTestFilePath(["nowrc_test.dll"])
@@ -1008,6 +1081,12 @@ class MessageResourceFileTest(test_lib.BaseTestCase):
 
             self.assertIsNotNone(version_information_resource)
 
+            # Test that the version information resource is parsed only once.
+            self.assertIs(
+                message_resource_file._GetVersionInformationResource(),
+                version_information_resource,
+            )
+
             message_resource_file.Close()
 
     def testFileVersionProperty(self):
@@ -1078,6 +1157,25 @@ class MessageResourceFileTest(test_lib.BaseTestCase):
 
             message_resource_file.Close()
 
+    def testGetLanguageIdentifiers(self):
+        """Tests the GetLanguageIdentifiers function."""
+        test_file_path = self._GetTestFilePath(["wrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        message_resource_file = resource_file.MessageResourceFile(
+            "C:\\Windows\\System32\\wrc_test.dll"
+        )
+
+        with open(test_file_path, "rb") as file_object:
+            message_resource_file.OpenFileObject(file_object)
+
+            try:
+                language_identifiers = message_resource_file.GetLanguageIdentifiers()
+                self.assertEqual(language_identifiers, [0x0409])
+
+            finally:
+                message_resource_file.Close()
+
     def testGetMessageTableResourceNoWrc(self):
         """Tests the GetMessageTableResource function."""
         test_file_path = self._GetTestFilePath(["nowrc_test.dll"])
@@ -1116,6 +1214,26 @@ class MessageResourceFileTest(test_lib.BaseTestCase):
             finally:
                 message_resource_file.Close()
 
+    def testGetMessages(self):
+        """Tests the GetMessages function."""
+        test_file_path = self._GetTestFilePath(["wrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        message_resource_file = resource_file.MessageResourceFile(
+            "C:\\Windows\\System32\\wrc_test.dll"
+        )
+
+        with open(test_file_path, "rb") as file_object:
+            message_resource_file.OpenFileObject(file_object)
+
+            try:
+                messages = list(message_resource_file.GetMessages())
+                self.assertEqual(len(messages), 3)
+                self.assertEqual(messages[0], (0x0409, 0x00000001, "Category\r\n"))
+
+            finally:
+                message_resource_file.Close()
+
     def testGetMUILanguage(self):
         """Tests the GetMUILanguage function."""
         test_file_path = self._GetTestFilePath(["wrc_test.mui.dll"])
@@ -1141,6 +1259,25 @@ class MessageResourceFileTest(test_lib.BaseTestCase):
         mui_language = message_resource_file.GetMUILanguage()
         self.assertIsNone(mui_language)
 
+    def testGetStringTableResource(self):
+        """Tests the GetStringTableResource function."""
+        test_file_path = self._GetTestFilePath(["nowrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        message_resource_file = resource_file.MessageResourceFile(
+            "C:\\Windows\\System32\\nowrc_test.dll"
+        )
+
+        with open(test_file_path, "rb") as file_object:
+            message_resource_file.OpenFileObject(file_object)
+
+            try:
+                resource = message_resource_file.GetStringTableResource()
+                self.assertIsNone(resource)
+
+            finally:
+                message_resource_file.Close()
+
     def testHasMessageTableResourceNoWrc(self):
         """Tests the HasMessageTableResource function."""
         test_file_path = self._GetTestFilePath(["nowrc_test.dll"])
@@ -1179,6 +1316,112 @@ class MessageResourceFileTest(test_lib.BaseTestCase):
             finally:
                 message_resource_file.Close()
 
+    def testWithStatement(self):
+        """Tests the with statement."""
+        test_file_path = self._GetTestFilePath(["wrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        message_resource_file = resource_file.MessageResourceFile(
+            "C:\\Windows\\System32\\wrc_test.dll"
+        )
+
+        with open(test_file_path, "rb") as file_object:
+            with message_resource_file:
+                message_resource_file.OpenFileObject(file_object)
+                self.assertEqual(message_resource_file.file_version, "1.0.0.0")
+
+            self.assertFalse(message_resource_file._is_open)
+
+            # Test if the message resource file can be opened again.
+            with message_resource_file:
+                message_resource_file.OpenFileObject(file_object)
+                self.assertTrue(message_resource_file.HasMessageTableResource())
+
+
+class MessageResourceFilePoolTest(test_lib.BaseTestCase):
+    """Tests for the Windows Message Resource file pool."""
+
+    # pylint: disable=protected-access
+
+    def testOpenFileObject(self):
+        """Tests the OpenFileObject function."""
+        test_file_path = self._GetTestFilePath(["wrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        test_pool = resource_file.MessageResourceFilePool(maximum_number_of_files=1)
+
+        with open(test_file_path, "rb") as file_object:
+            with test_pool.OpenFileObject(
+                "C:\\Windows\\System32\\first.dll", file_object
+            ) as first_message_file:
+                self.assertEqual(first_message_file.file_version, "1.0.0.0")
+
+                with test_pool.OpenFileObject(
+                    "C:\\Windows\\System32\\second.dll", file_object
+                ) as second_message_file:
+                    self.assertIsNot(second_message_file, first_message_file)
+
+            self.assertEqual(test_pool.number_of_allocated_files, 2)
+            self.assertEqual(test_pool.GetNumberOfAvailableFiles(), 1)
+
+            with test_pool.OpenFileObject(
+                "C:\\Windows\\System32\\third.dll", file_object
+            ) as message_file:
+                self.assertEqual(
+                    message_file.windows_path, "C:\\Windows\\System32\\third.dll"
+                )
+                self.assertTrue(message_file.HasMessageTableResource())
+
+            self.assertEqual(test_pool.number_of_allocated_files, 2)
+            self.assertEqual(test_pool.number_of_reused_files, 1)
+
+        # Test if a message resource file that cannot be opened is returned to
+        # the pool.
+        with open(__file__, "rb") as file_object:
+            with self.assertRaises(IOError):
+                test_pool.OpenFileObject("C:\\bogus.dll", file_object)
+
+        self.assertEqual(test_pool.GetNumberOfAvailableFiles(), 1)
+
+    def testOpenFileObjectWithPreferredLanguage(self):
+        """Tests the OpenFileObject function with a preferred language."""
+        test_file_path = self._GetTestFilePath(["wrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        test_pool = resource_file.MessageResourceFilePool(
+            preferred_language_identifier=0x0409
+        )
+
+        with open(test_file_path, "rb") as file_object:
+            with test_pool.OpenFileObject(
+                "C:\\Windows\\System32\\test.dll", file_object
+            ) as message_file:
+                original_wrc_stream = message_file._wrc_stream
+
+                wrc_stream = TestWrcStream()
+                message_file._resource_languages = {}
+                message_file._resources = {}
+                message_file._wrc_stream = wrc_stream
+
+                wrc_resource = TestWrcResource()
+                wrc_stream.resources[0x10] = wrc_resource
+
+                wrc_resource_item = TestWrcResourceItem(1)
+                wrc_resource.items.append(wrc_resource_item)
+
+                # Note that the preferred language is not the first language of
+                # the resource.
+                for language_identifier in (0x0407, 0x0409, 0x0413):
+                    wrc_resource_sub_item = TestWrcResourceItem(language_identifier)
+                    wrc_resource_item.sub_items.append(wrc_resource_sub_item)
+
+                try:
+                    wrc_resource_sub_item = message_file._GetResourceSubItem(0x10)
+                    self.assertEqual(wrc_resource_sub_item.identifier, 0x0409)
+
+                finally:
+                    message_file._wrc_stream = original_wrc_stream
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Tests for the inventory of Windows resource files."""
+
+import os
+import unittest
+
+from artifactsrc import resource_file_inventory
+
+from tests import test_lib
+
+
+class ResourceFileInventoryTest(test_lib.BaseTestCase):
+    """Tests for the inventory of Windows resource files."""
+
+    def testOpenClose(self):
+        """Tests the Open and Close functions."""
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "inventory.db")
+
+            inventory = resource_file_inventory.ResourceFileInventory()
+            inventory.Open(path)
+
+            with self.assertRaises(IOError):
+                inventory.Open(path)
+
+            inventory.Close()
+
+            with self.assertRaises(IOError):
+                inventory.Close()
+
+    def testAddEntries(self):
+        """Tests the AddEntries and GetNumberOfEntries functions."""
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "inventory.db")
+
+            inventory = resource_file_inventory.ResourceFileInventory()
+
+            with self.assertRaises(IOError):
+                inventory.AddEntries([])
+
+            inventory.Open(path)
+
+            try:
+                entry = resource_file_inventory.ResourceFileInventoryEntry(
+                    "p1", "C:\\Windows\\System32\\wrc_test.dll"
+                )
+                entry.file_version = "1.0.0.0"
+                entry.has_message_table = True
+                entry.language_identifiers = [0x0409]
+                entry.product_version = "1.0.0.0"
+
+                inventory.AddEntries([entry])
+                self.assertEqual(inventory.GetNumberOfEntries(), 1)
+
+                # An entry of the same resource file replaces the previous entry.
+                inventory.AddEntries([entry])
+                self.assertEqual(inventory.GetNumberOfEntries(), 1)
+
+            finally:
+                inventory.Close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Tests for the persistent cache of Windows resource file metadata."""
+
+import io
+import os
+import unittest
+
+from artifactsrc import resource_metadata_cache
+
+from tests import test_lib
+
+
+class ResourceMetadataCacheTest(test_lib.BaseTestCase):
+    """Tests for the persistent cache of Windows resource file metadata."""
+
+    def testOpenClose(self):
+        """Tests the Open and Close functions."""
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "cache.db")
+
+            cache = resource_metadata_cache.ResourceMetadataCache()
+            cache.Open(path)
+
+            with self.assertRaises(IOError):
+                cache.Open(path)
+
+            cache.Close()
+
+            with self.assertRaises(IOError):
+                cache.Close()
+
+    def testCacheMetadata(self):
+        """Tests the CacheMetadata and GetMetadata functions."""
+        metadata = resource_metadata_cache.ResourceMetadata()
+        metadata.file_version = "10.0.19041.1"
+        metadata.has_message_table = True
+        metadata.language_identifiers = [0x0409]
+        metadata.product_version = "10.0.19041.1"
+
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "cache.db")
+
+            cache = resource_metadata_cache.ResourceMetadataCache()
+
+            with self.assertRaises(IOError):
+                cache.GetMetadata("1024:abc")
+
+            cache.Open(path)
+
+            try:
+                self.assertIsNone(cache.GetMetadata("1024:abc"))
+
+                cache.CacheMetadata("1024:abc", metadata)
+
+                cached_metadata = cache.GetMetadata("1024:abc")
+                self.assertIsNotNone(cached_metadata)
+                self.assertEqual(cached_metadata.file_version, "10.0.19041.1")
+
+            finally:
+                cache.Close()
+
+            # Test that the metadata is retained when the cache is reopened.
+            cache = resource_metadata_cache.ResourceMetadataCache()
+            cache.Open(path)
+
+            try:
+                cached_metadata = cache.GetMetadata("1024:abc")
+                self.assertIsNotNone(cached_metadata)
+                self.assertTrue(cached_metadata.has_message_table)
+                self.assertEqual(cached_metadata.language_identifiers, [0x0409])
+                self.assertIsNone(cached_metadata.mui_language)
+
+            finally:
+                cache.Close()
+
+        self.assertEqual(cache.number_of_cache_hits, 1)
+        self.assertEqual(cache.number_of_cache_misses, 0)
+
+    def testGetIdentity(self):
+        """Tests the GetIdentity function."""
+        cache = resource_metadata_cache.ResourceMetadataCache()
+
+        file_object = io.BytesIO(b"MZ" + b"\x00" * 254)
+        identity = cache.GetIdentity(file_object)
+        self.assertTrue(identity.startswith("256:"))
+        self.assertEqual(file_object.tell(), 0)
+
+        # Test that the last block is part of the identity.
+        data = b"A" * (256 * 1024)
+        identity1 = cache.GetIdentity(io.BytesIO(data))
+        identity2 = cache.GetIdentity(io.BytesIO(data[:-1] + b"B"))
+        self.assertNotEqual(identity1, identity2)
+
+        # Test that only the first and last block are part of the identity.
+        middle_offset = len(data) // 2
+        identity2 = cache.GetIdentity(
+            io.BytesIO(data[:middle_offset] + b"B" + data[middle_offset + 1 :])
+        )
+        self.assertEqual(identity1, identity2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Tests for the per storage media image sidecar cache."""
+
+import os
+import unittest
+
+from artifactsrc import sidecar_cache
+
+from tests import test_lib
+
+
+class SidecarCacheTest(test_lib.BaseTestCase):
+    """Tests for the per storage media image sidecar cache."""
+
+    # pylint: disable=protected-access
+
+    def testGetAndSetValue(self):
+        """Tests the GetValue and SetValue functions."""
+        with test_lib.TempDirectory() as temp_directory:
+            source_path = os.path.join(temp_directory, "image.raw")
+            with open(source_path, "wb") as file_object:
+                file_object.write(b"\x00" * 512)
+
+            cache_path = os.path.join(temp_directory, "cache")
+
+            cache = sidecar_cache.SidecarCache(cache_path)
+            self.assertIsNone(cache.GetValue(source_path, "environment_variables"))
+
+            cache.SetValue(source_path, "environment_variables", [{"name": "%a%"}])
+
+            cache = sidecar_cache.SidecarCache(cache_path)
+            value = cache.GetValue(source_path, "environment_variables")
+            self.assertEqual(value, [{"name": "%a%"}])
+
+            # A modified storage media image does not reuse the cached values.
+            with open(source_path, "ab") as file_object:
+                file_object.write(b"\x00" * 512)
+
+            cache = sidecar_cache.SidecarCache(cache_path)
+            self.assertIsNone(cache.GetValue(source_path, "environment_variables"))
+
+    def testGetAndSetValueWithSplitImage(self):
+        """Tests the GetValue and SetValue functions with a split image."""
+        with test_lib.TempDirectory() as temp_directory:
+            for filename in ("image.000", "image.001"):
+                segment_path = os.path.join(temp_directory, filename)
+                with open(segment_path, "wb") as file_object:
+                    file_object.write(b"\x00" * 512)
+
+            source_path = os.path.join(temp_directory, "image.000")
+            cache_path = os.path.join(temp_directory, "cache")
+
+            cache = sidecar_cache.SidecarCache(cache_path)
+
+            segment_paths = cache._GetSegmentPaths(source_path)
+            self.assertEqual(segment_paths, [source_path, segment_path])
+
+            cache.SetValue(source_path, "environment_variables", [{"name": "%a%"}])
+
+            cache = sidecar_cache.SidecarCache(cache_path)
+            value = cache.GetValue(source_path, "environment_variables")
+            self.assertEqual(value, [{"name": "%a%"}])
+
+            # A modified segment file, other than the first, does not reuse the
+            # cached values.
+            with open(segment_path, "ab") as file_object:
+                file_object.write(b"\x00" * 512)
+
+            cache = sidecar_cache.SidecarCache(cache_path)
+            self.assertIsNone(cache.GetValue(source_path, "environment_variables"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,781 @@
+#!/usr/bin/env python3
+"""Tests for the volume scanner for artifact definitions."""
+
+import os
+import shutil
+import time
+import unittest
+
+from unittest import mock
+
+from artifacts import artifact as artifacts_artifact
+from artifacts import definitions as artifacts_definitions
+from artifacts import registry as artifacts_registry
+
+from dfimagetools import resources as dfimagetools_resources
+
+from dfvfs.helpers import volume_scanner as dfvfs_volume_scanner
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as dfvfs_path_spec_factory
+from dfvfs.resolver import resolver as dfvfs_resolver
+
+from dfwinreg import definitions as dfwinreg_definitions
+from dfwinreg import fake as dfwinreg_fake
+from dfwinreg import registry as dfwinreg_registry
+
+from artifactsrc import message_store
+from artifactsrc import resource_file_inventory
+from artifactsrc import resource_metadata_cache
+from artifactsrc import volume_scanner
+
+from tests import test_lib
+
+
+class ArtifactDefinitionsVolumeScannerTest(test_lib.BaseTestCase):
+    """Tests for the artifact definitions volume scanner."""
+
+    # pylint: disable=protected-access
+
+    def _CreateTestWindowsVolume(self, scanner, path):
+        """Creates a Windows volume with resource files for testing.
+
+        Args:
+          scanner (ArtifactDefinitionsVolumeScanner): scanner to which the
+              Windows volume is added.
+          path (str): path of the directory in which to create the Windows
+              volume.
+        """
+        system_directory = os.path.join(path, "Windows", "System32")
+        os.makedirs(os.path.join(system_directory, "drivers"))
+
+        shutil.copy(
+            self._GetTestFilePath(["wrc_test.dll"]),
+            os.path.join(system_directory, "test.dll"),
+        )
+        shutil.copy(
+            self._GetTestFilePath(["nowrc_test.dll"]),
+            os.path.join(system_directory, "drivers", "test.sys"),
+        )
+        for filename in ("bogus.dll", "readme.txt"):
+            with open(os.path.join(system_directory, filename), "wb") as file_object:
+                file_object.write(b"bogus")
+
+        mount_point = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location=path
+        )
+        file_system = dfvfs_resolver.Resolver.OpenFileSystem(mount_point)
+
+        operating_system_volume = volume_scanner.OperatingSystemVolume(
+            file_system, None, mount_point
+        )
+        operating_system_volume.base_path_spec = mount_point
+        operating_system_volume.identifier = "p1"
+        operating_system_volume.windows_directory = "C:\\Windows"
+
+        scanner._InitializeWindowsVolume(operating_system_volume)
+        scanner._operating_system_volumes = [operating_system_volume]
+
+    def testGetAPFSVolumeRole(self):
+        """Tests the _GetAPFSVolumeRole function."""
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        self.assertEqual(scanner._GetAPFSVolumeRole("Recovery", None), "recovery")
+        self.assertEqual(
+            scanner._GetAPFSVolumeRole("Macintosh HD - Data", None), "data"
+        )
+        self.assertIsNone(scanner._GetAPFSVolumeRole("Macintosh HD", None))
+
+        with test_lib.TempDirectory() as temp_directory:
+            os.makedirs(
+                os.path.join(temp_directory, "5A2E5F4C-6D84-4A55-9D1B-0C3F2B7E1A90")
+            )
+
+            path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_OS, location=temp_directory
+            )
+            root_file_entry = dfvfs_resolver.Resolver.OpenFileEntry(path_spec)
+
+            volume_role = scanner._GetAPFSVolumeRole("Untitled", root_file_entry)
+            self.assertEqual(volume_role, "preboot")
+
+            os.makedirs(os.path.join(temp_directory, "System", "Library"))
+
+            volume_role = scanner._GetAPFSVolumeRole("Untitled", root_file_entry)
+            self.assertIsNone(volume_role)
+
+    def testGetPairedSystemVolume(self):
+        """Tests the _GetPairedSystemVolume function."""
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        operating_system_volumes = []
+        for volume_name, system_directories in (
+            ("Macintosh HD", ["/system/library"]),
+            ("Macintosh HD - Data", []),
+            ("Other", ["/system/library"]),
+        ):
+            operating_system_volume = volume_scanner.OperatingSystemVolume(
+                None, None, None
+            )
+            operating_system_volume.system_directories = system_directories
+            operating_system_volume.volume_group_identifier = "p2"
+            operating_system_volume.volume_name = volume_name
+            operating_system_volumes.append(operating_system_volume)
+
+        data_volume = operating_system_volumes[1]
+        data_volume.volume_role = "data"
+
+        system_volume = scanner._GetPairedSystemVolume(
+            data_volume, operating_system_volumes
+        )
+        self.assertIs(system_volume, operating_system_volumes[0])
+
+        data_volume.volume_name = "Data"
+
+        system_volume = scanner._GetPairedSystemVolume(
+            data_volume, operating_system_volumes
+        )
+        self.assertIsNone(system_volume)
+
+    def testCollectMacOSUserAccounts(self):
+        """Tests the _CollectMacOSUserAccounts function."""
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        with test_lib.TempDirectory() as temp_directory:
+            for username in ("Shared", "alice", "bob"):
+                os.makedirs(os.path.join(temp_directory, "Users", username))
+
+            mount_point = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_OS, location=temp_directory
+            )
+            file_system = dfvfs_resolver.Resolver.OpenFileSystem(mount_point)
+            operating_system_volume = volume_scanner.OperatingSystemVolume(
+                file_system, None, mount_point
+            )
+
+            user_accounts = scanner._CollectMacOSUserAccounts(operating_system_volume)
+            self.assertEqual(
+                [user_account.user_directory for user_account in user_accounts],
+                ["/Users/alice", "/Users/bob"],
+            )
+
+    def testCollectWindowsUserAccounts(self):
+        """Tests the _CollectWindowsUserAccounts function."""
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        registry_file = dfwinreg_fake.FakeWinRegistryFile(
+            key_path_prefix="HKEY_LOCAL_MACHINE\\Software"
+        )
+        profile_list_key = dfwinreg_fake.FakeWinRegistryKey("ProfileList")
+        for security_identifier, profile_path in (
+            ("S-1-5-19", "%SystemRoot%\\ServiceProfiles\\LocalService"),
+            ("S-1-5-21-1-2-3-1001", "C:\\Users\\alice"),
+        ):
+            profile_key = dfwinreg_fake.FakeWinRegistryKey(security_identifier)
+            profile_key.AddValue(
+                dfwinreg_fake.FakeWinRegistryValue(
+                    "ProfileImagePath",
+                    data=profile_path.encode("utf-16-le"),
+                    data_type=dfwinreg_definitions.REG_EXPAND_SZ,
+                )
+            )
+            profile_list_key.AddSubkey(security_identifier, profile_key)
+
+        registry_file.AddKeyByPath(
+            "\\Microsoft\\Windows NT\\CurrentVersion", profile_list_key
+        )
+        registry_file.Open(None)
+
+        winregistry = dfwinreg_registry.WinRegistry()
+        winregistry.MapFile("HKEY_LOCAL_MACHINE\\Software", registry_file)
+
+        operating_system_volume = volume_scanner.OperatingSystemVolume(None, None, None)
+        operating_system_volume.windows_directory = "C:\\Windows"
+        operating_system_volume.windows_registry = winregistry
+
+        user_accounts = scanner._CollectWindowsUserAccounts(operating_system_volume)
+        self.assertEqual(len(user_accounts), 2)
+
+        self.assertEqual(user_accounts[0].identifier, "S-1-5-19")
+        self.assertEqual(
+            user_accounts[0].user_directory,
+            "C:\\Windows\\ServiceProfiles\\LocalService",
+        )
+        self.assertEqual(user_accounts[1].user_directory, "C:\\Users\\alice")
+        self.assertEqual(user_accounts[1].username, "alice")
+
+    def testGetWindowsVersionFromRegistry(self):
+        """Tests the _GetWindowsVersionFromRegistry function."""
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        registry_file = dfwinreg_fake.FakeWinRegistryFile(
+            key_path_prefix="HKEY_LOCAL_MACHINE\\Software"
+        )
+        current_version_key = dfwinreg_fake.FakeWinRegistryKey("CurrentVersion")
+        for value_name, value_data in (
+            ("CurrentBuildNumber", "19045"),
+            ("CurrentVersion", "6.3"),
+            ("ProductName", "Windows 10 Pro"),
+        ):
+            current_version_key.AddValue(
+                dfwinreg_fake.FakeWinRegistryValue(
+                    value_name,
+                    data=value_data.encode("utf-16-le"),
+                    data_type=dfwinreg_definitions.REG_SZ,
+                )
+            )
+
+        registry_file.AddKeyByPath("\\Microsoft\\Windows NT", current_version_key)
+        registry_file.Open(None)
+
+        winregistry = dfwinreg_registry.WinRegistry()
+        winregistry.MapFile("HKEY_LOCAL_MACHINE\\Software", registry_file)
+
+        operating_system_volume = volume_scanner.OperatingSystemVolume(None, None, None)
+        operating_system_volume.windows_registry = winregistry
+
+        windows_version = scanner._GetWindowsVersionFromRegistry(
+            operating_system_volume
+        )
+        self.assertEqual(windows_version, "6.3.19045")
+        self.assertEqual(operating_system_volume.windows_product_name, "Windows 10 Pro")
+
+        for value_name, value_data in (
+            ("CurrentMajorVersionNumber", 10),
+            ("CurrentMinorVersionNumber", 0),
+            ("UBR", 3636),
+        ):
+            current_version_key.AddValue(
+                dfwinreg_fake.FakeWinRegistryValue(
+                    value_name,
+                    data=value_data.to_bytes(4, "little"),
+                    data_type=dfwinreg_definitions.REG_DWORD_LITTLE_ENDIAN,
+                )
+            )
+
+        windows_version = scanner._GetWindowsVersionFromRegistry(
+            operating_system_volume
+        )
+        self.assertEqual(windows_version, "10.0.19045.3636")
+
+        operating_system_volume.windows_registry = None
+        windows_version = scanner._GetWindowsVersionFromRegistry(
+            operating_system_volume
+        )
+        self.assertIsNone(windows_version)
+
+        scanner._windows_volume = operating_system_volume
+        operating_system_volume.windows_version = ""
+
+        windows_product_name = scanner.GetWindowsProductName()
+        self.assertEqual(windows_product_name, "Windows 10 Pro")
+
+    def testExpandRegistryKeyPath(self):
+        """Tests the _ExpandRegistryKeyPath function."""
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        user_accounts = [
+            dfimagetools_resources.UserAccount(identifier="S-1-5-18"),
+            dfimagetools_resources.UserAccount(identifier="S-1-5-21-1-2-3-1001"),
+        ]
+
+        key_paths = scanner._ExpandRegistryKeyPath(
+            "HKEY_LOCAL_MACHINE\\System\\%%current_control_set%%\\Services",
+            user_accounts,
+        )
+        self.assertEqual(
+            key_paths, ["HKEY_LOCAL_MACHINE\\System\\CurrentControlSet\\Services"]
+        )
+
+        key_paths = scanner._ExpandRegistryKeyPath(
+            "HKEY_CURRENT_USER\\Software\\Microsoft", user_accounts
+        )
+        self.assertEqual(
+            key_paths,
+            [
+                "HKEY_USERS\\S-1-5-18\\Software\\Microsoft",
+                "HKEY_USERS\\S-1-5-21-1-2-3-1001\\Software\\Microsoft",
+            ],
+        )
+
+        key_paths = scanner._ExpandRegistryKeyPath(
+            "HKEY_USERS\\%%users.sid%%\\Software", []
+        )
+        self.assertEqual(key_paths, [])
+
+        key_paths = scanner._ExpandRegistryKeyPath(
+            "HKEY_LOCAL_MACHINE\\%%environ_bogus%%", user_accounts
+        )
+        self.assertEqual(key_paths, [])
+
+    def testFindSystemDirectories(self):
+        """Tests the _FindSystemDirectories function."""
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        with test_lib.TempDirectory() as temp_directory:
+            os.makedirs(os.path.join(temp_directory, "sbin"))
+            os.makedirs(os.path.join(temp_directory, "WINNT", "system32"))
+            os.makedirs(os.path.join(temp_directory, "System"))
+
+            path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_OS, location=temp_directory
+            )
+            root_file_entry = dfvfs_resolver.Resolver.OpenFileEntry(path_spec)
+
+            system_directories = scanner._FindSystemDirectories(root_file_entry)
+            self.assertEqual(system_directories, [["sbin"], ["WINNT", "system32"]])
+
+    def testScanForOperatingSystemVolumesOutOfOrder(self):
+        """Tests ScanForOperatingSystemVolumes with out-of-order volume scans."""
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        with test_lib.TempDirectory() as temp_directory:
+            base_path_specs = []
+            for index, system_directory in enumerate(
+                [["sbin"], ["Windows", "System32"], ["WINNT", "System32"]]
+            ):
+                path = os.path.join(temp_directory, f"p{index + 1:d}")
+                os.makedirs(os.path.join(path, *system_directory))
+
+                base_path_specs.append(
+                    dfvfs_path_spec_factory.Factory.NewPathSpec(
+                        dfvfs_definitions.TYPE_INDICATOR_OS, location=path
+                    )
+                )
+
+            scan_operating_system_volume = scanner._ScanOperatingSystemVolume
+
+            def _ScanOperatingSystemVolumeWithDelay(path_spec):
+                """Scans a volume where the first volumes complete last."""
+                index = base_path_specs.index(path_spec)
+                time.sleep(0.1 * (len(base_path_specs) - index))
+                return scan_operating_system_volume(path_spec)
+
+            scan_context = mock.MagicMock()
+            scan_context.source_type = dfvfs_definitions.SOURCE_TYPE_DIRECTORY
+
+            with (
+                mock.patch.object(scanner, "_ScanSource", return_value=scan_context),
+                mock.patch.object(
+                    scanner, "_GetBasePathSpecs", return_value=base_path_specs
+                ),
+                mock.patch.object(
+                    scanner,
+                    "_ScanOperatingSystemVolume",
+                    side_effect=_ScanOperatingSystemVolumeWithDelay,
+                ),
+            ):
+                result = scanner.ScanForOperatingSystemVolumes(temp_directory)
+
+            self.assertTrue(result)
+
+            mount_points = [
+                operating_system_volume.mount_point
+                for operating_system_volume in scanner._operating_system_volumes
+            ]
+            self.assertEqual(mount_points, base_path_specs)
+
+            self.assertIsNotNone(scanner._windows_volume)
+            self.assertEqual(scanner._windows_volume.mount_point, base_path_specs[1])
+            self.assertEqual(scanner._windows_directory, "C:\\Windows")
+
+    def testClose(self):
+        """Tests the Close function."""
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        volumes_executor = scanner._GetVolumesExecutor()
+
+        with mock.patch.object(scanner, "Reset") as mock_reset:
+            scanner.Close()
+
+        mock_reset.assert_called_once_with()
+        self.assertIsNone(scanner._volumes_executor)
+
+        with self.assertRaises(RuntimeError):
+            volumes_executor.submit(int)
+
+        # The scanner can be reused after it was closed.
+        self.assertIsNotNone(scanner._GetVolumesExecutor())
+
+        scanner.Close()
+
+    def testReset(self):
+        """Tests the Reset function."""
+        test_file_path = self._GetTestFilePath(["wrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestWindowsVolume(scanner, temp_directory)
+
+            operating_system_volume = scanner._operating_system_volumes[0]
+            operating_system_volume.resolver_context = mock.MagicMock()
+
+            paired_volume = volume_scanner.OperatingSystemVolume(None, None, None)
+            paired_volume.resolver_context = mock.MagicMock()
+            operating_system_volume.paired_volume = paired_volume
+
+            resolver_contexts = [
+                operating_system_volume.resolver_context,
+                paired_volume.resolver_context,
+            ]
+
+            scanner._registry_file_cache.CacheData(
+                ("image.raw", "p1"), "C:\\Windows\\System32\\config\\SYSTEM", b"regf"
+            )
+
+            scanner.Reset()
+
+            self.assertEqual(scanner._operating_system_volumes, [])
+
+            # The Windows Registry file cache is retained for a rescan of the same
+            # storage media image.
+            data = scanner._registry_file_cache.GetData(
+                ("image.raw", "p1"), "C:\\Windows\\System32\\config\\SYSTEM"
+            )
+            self.assertEqual(data, b"regf")
+            self.assertIsNone(scanner._windows_registry)
+
+            for resolver_context in resolver_contexts:
+                resolver_context.Empty.assert_called_once_with()
+
+            self.assertIsNone(operating_system_volume.file_system)
+            self.assertIsNone(operating_system_volume.path_resolver)
+            self.assertIsNone(operating_system_volume.resolver_context)
+            self.assertIsNone(operating_system_volume.windows_registry)
+            self.assertIsNone(paired_volume.resolver_context)
+
+    def testResolveEventLogProviders(self):
+        """Tests the ResolveEventLogProviders function."""
+        for filename in ("nowrc_test.dll", "wrc_test.dll"):
+            test_file_path = self._GetTestFilePath([filename])
+            self._SkipIfPathNotExists(test_file_path)
+
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        message_files_per_provider = scanner.ResolveEventLogProviders()
+        self.assertEqual(message_files_per_provider, {})
+
+        registry_file = dfwinreg_fake.FakeWinRegistryFile(
+            key_path_prefix="HKEY_LOCAL_MACHINE\\System"
+        )
+        select_key = dfwinreg_fake.FakeWinRegistryKey("Select")
+        select_key.AddValue(
+            dfwinreg_fake.FakeWinRegistryValue(
+                "Current",
+                data=(1).to_bytes(4, "little"),
+                data_type=dfwinreg_definitions.REG_DWORD_LITTLE_ENDIAN,
+            )
+        )
+        registry_file.AddKeyByPath("\\", select_key)
+
+        provider_key = dfwinreg_fake.FakeWinRegistryKey("TestProvider")
+        provider_key.AddValue(
+            dfwinreg_fake.FakeWinRegistryValue(
+                "EventMessageFile",
+                data="%SystemRoot%\\System32\\test.dll;missing.dll".encode("utf-16-le"),
+                data_type=dfwinreg_definitions.REG_EXPAND_SZ,
+            )
+        )
+        registry_file.AddKeyByPath(
+            "\\ControlSet001\\Services\\EventLog\\Application", provider_key
+        )
+
+        # Note that the message files of the other provider refer to the same
+        # message file as the test provider by a different Windows path.
+        provider_key = dfwinreg_fake.FakeWinRegistryKey("OtherProvider")
+        provider_key.AddValue(
+            dfwinreg_fake.FakeWinRegistryValue(
+                "EventMessageFile",
+                data=(
+                    "C:\\Windows\\System32\\TEST.dll;%ProgramFiles%\\Test\\test.dll"
+                ).encode("utf-16-le"),
+                data_type=dfwinreg_definitions.REG_EXPAND_SZ,
+            )
+        )
+        registry_file.AddKeyByPath(
+            "\\ControlSet001\\Services\\EventLog\\System", provider_key
+        )
+        registry_file.Open(None)
+
+        software_registry_file = dfwinreg_fake.FakeWinRegistryFile(
+            key_path_prefix="HKEY_LOCAL_MACHINE\\Software"
+        )
+        current_version_key = dfwinreg_fake.FakeWinRegistryKey("CurrentVersion")
+        current_version_key.AddValue(
+            dfwinreg_fake.FakeWinRegistryValue(
+                "ProgramFilesDir",
+                data="C:\\Program Files".encode("utf-16-le"),
+                data_type=dfwinreg_definitions.REG_SZ,
+            )
+        )
+        software_registry_file.AddKeyByPath("\\Microsoft\\Windows", current_version_key)
+        software_registry_file.Open(None)
+
+        winregistry = dfwinreg_registry.WinRegistry()
+        winregistry.MapFile("HKEY_LOCAL_MACHINE\\Software", software_registry_file)
+        winregistry.MapFile("HKEY_LOCAL_MACHINE\\System", registry_file)
+
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestWindowsVolume(scanner, temp_directory)
+
+            mui_directory = os.path.join(temp_directory, "Windows", "System32", "en-US")
+            os.makedirs(mui_directory)
+            shutil.copy(
+                self._GetTestFilePath(["wrc_test.dll"]),
+                os.path.join(mui_directory, "test.dll.mui"),
+            )
+
+            program_directory = os.path.join(temp_directory, "Program Files", "Test")
+            os.makedirs(program_directory)
+            shutil.copy(
+                self._GetTestFilePath(["wrc_test.dll"]),
+                os.path.join(program_directory, "test.dll"),
+            )
+
+            operating_system_volume = scanner._operating_system_volumes[0]
+            operating_system_volume.windows_registry = winregistry
+            scanner._windows_volume = operating_system_volume
+
+            message_files_per_provider = scanner.ResolveEventLogProviders()
+
+        self.assertEqual(
+            sorted(message_files_per_provider.keys()), ["OtherProvider", "TestProvider"]
+        )
+
+        message_files = message_files_per_provider["TestProvider"]
+        self.assertEqual(len(message_files), 2)
+
+        self.assertEqual(
+            message_files[0].windows_path, "%SystemRoot%\\System32\\test.dll"
+        )
+        self.assertIsNotNone(message_files[0].metadata)
+        self.assertTrue(message_files[0].metadata.has_message_table)
+        self.assertEqual(
+            message_files[0].mui_windows_path,
+            "%SystemRoot%\\System32\\en-US\\test.dll.mui",
+        )
+        self.assertIsNotNone(message_files[0].mui_metadata)
+
+        self.assertEqual(message_files[1].windows_path, "%SystemRoot%\\missing.dll")
+        self.assertIsNone(message_files[1].metadata)
+        self.assertIsNone(message_files[1].mui_windows_path)
+
+        test_metadata = message_files[0].metadata
+
+        message_files = message_files_per_provider["OtherProvider"]
+        self.assertEqual(len(message_files), 2)
+
+        # The message file is read once for both Windows paths.
+        self.assertIs(message_files[0].metadata, test_metadata)
+
+        self.assertEqual(
+            message_files[1].windows_path, "%ProgramFiles%\\Test\\test.dll"
+        )
+        self.assertIsNotNone(message_files[1].metadata)
+
+    def testHasPathVariables(self):
+        """Tests the _HasPathVariables function."""
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+
+        event_logs_definition = artifacts_artifact.ArtifactDefinition(
+            "WindowsEventLogs", description="WindowsEventLogs"
+        )
+        event_logs_definition.AppendSource(
+            artifacts_definitions.TYPE_INDICATOR_FILE,
+            {"paths": ["%%environ_systemroot%%\\System32\\winevt\\Logs\\*.evtx"]},
+        )
+        registry.RegisterDefinition(event_logs_definition)
+
+        passwd_definition = artifacts_artifact.ArtifactDefinition(
+            "LinuxPasswdFile", description="LinuxPasswdFile"
+        )
+        passwd_definition.AppendSource(
+            artifacts_definitions.TYPE_INDICATOR_FILE, {"paths": ["/etc/passwd"]}
+        )
+        registry.RegisterDefinition(passwd_definition)
+
+        group_definition = artifacts_artifact.ArtifactDefinition(
+            "Group", description="Group"
+        )
+        group_definition.AppendSource(
+            artifacts_definitions.TYPE_INDICATOR_ARTIFACT_GROUP,
+            {"names": ["LinuxPasswdFile", "WindowsEventLogs"]},
+        )
+        registry.RegisterDefinition(group_definition)
+
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        self.assertTrue(scanner._HasPathVariables(event_logs_definition))
+        self.assertFalse(scanner._HasPathVariables(passwd_definition))
+        self.assertTrue(scanner._HasPathVariables(group_definition))
+
+    def testExtractMessageTables(self):
+        """Tests the ExtractMessageTables function."""
+        for filename in ("nowrc_test.dll", "wrc_test.dll"):
+            test_file_path = self._GetTestFilePath([filename])
+            self._SkipIfPathNotExists(test_file_path)
+
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestWindowsVolume(scanner, temp_directory)
+
+            store = message_store.MessageStore()
+            store.Open(os.path.join(temp_directory, "messages.db"))
+
+            try:
+                number_of_message_files = scanner.ExtractMessageTables(store)
+                self.assertEqual(number_of_message_files, 1)
+                self.assertEqual(store.GetNumberOfMessages(), 3)
+
+                # Test that a message file with the same file version is not
+                # extracted again.
+                number_of_message_files = scanner.ExtractMessageTables(store)
+                self.assertEqual(number_of_message_files, 0)
+                self.assertEqual(store.GetNumberOfMessages(), 3)
+
+            finally:
+                store.Close()
+
+    def testInventoryResourceFiles(self):
+        """Tests the InventoryResourceFiles function."""
+        for filename in ("nowrc_test.dll", "wrc_test.dll"):
+            test_file_path = self._GetTestFilePath([filename])
+            self._SkipIfPathNotExists(test_file_path)
+
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestWindowsVolume(scanner, temp_directory)
+
+            inventory = resource_file_inventory.ResourceFileInventory()
+            inventory.Open(os.path.join(temp_directory, "inventory.db"))
+
+            try:
+                number_of_entries = scanner.InventoryResourceFiles(inventory)
+                self.assertEqual(number_of_entries, 2)
+                self.assertEqual(inventory.GetNumberOfEntries(), 2)
+
+            finally:
+                inventory.Close()
+
+            # Test that cached resource files are not parsed again.
+            cache = resource_metadata_cache.ResourceMetadataCache()
+            cache.Open(os.path.join(temp_directory, "cache.db"))
+            scanner._resource_metadata_cache = cache
+
+            inventory = resource_file_inventory.ResourceFileInventory()
+            inventory.Open(os.path.join(temp_directory, "inventory.db"))
+
+            try:
+                for _ in range(2):
+                    number_of_entries = scanner.InventoryResourceFiles(inventory)
+                    self.assertEqual(number_of_entries, 2)
+
+            finally:
+                inventory.Close()
+                cache.Close()
+
+            # Note that the metadata of bogus.dll is not cached, since it is not
+            # a resource file.
+            self.assertEqual(cache.number_of_cache_hits, 2)
+            self.assertEqual(cache.number_of_cache_misses, 4)
+
+    def testReadResourceFilesOnStorageMediaImage(self):
+        """Tests reading resource files concurrently from a storage media image."""
+        test_file_path = self._GetTestFilePath(["windows_volume.raw"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        volume_scanner_options = dfvfs_volume_scanner.VolumeScannerOptions()
+        volume_scanner_options.partitions = ["all"]
+        volume_scanner_options.snapshots = ["none"]
+        volume_scanner_options.volumes = ["all"]
+
+        result = scanner.ScanForOperatingSystemVolumes(
+            test_file_path, options=volume_scanner_options
+        )
+        self.assertTrue(result)
+
+        with test_lib.TempDirectory() as temp_directory:
+            inventory = resource_file_inventory.ResourceFileInventory()
+            inventory.Open(os.path.join(temp_directory, "inventory.db"))
+
+            try:
+                number_of_entries = scanner.InventoryResourceFiles(inventory)
+                self.assertEqual(number_of_entries, 2)
+
+            finally:
+                inventory.Close()
+
+            store = message_store.MessageStore()
+            store.Open(os.path.join(temp_directory, "messages.db"))
+
+            try:
+                number_of_message_files = scanner.ExtractMessageTables(store)
+                self.assertEqual(number_of_message_files, 1)
+                self.assertEqual(store.GetNumberOfMessages(), 3)
+
+            finally:
+                store.Close()
+
+    def testGetVolumeIdentifier(self):
+        """Tests the _GetVolumeIdentifier function."""
+        registry = artifacts_registry.ArtifactDefinitionsRegistry()
+        scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(registry)
+
+        path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location="/cases/image.raw"
+        )
+        path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_RAW, parent=path_spec
+        )
+        file_system_path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_NTFS, location="\\", parent=path_spec
+        )
+
+        volume_identifier = scanner._GetVolumeIdentifier(file_system_path_spec)
+        self.assertEqual(volume_identifier, "")
+
+        path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_TSK_PARTITION,
+            location="/p2",
+            parent=path_spec,
+        )
+        path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_VSHADOW,
+            location="/vss1",
+            store_index=0,
+            parent=path_spec,
+        )
+        file_system_path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_NTFS, location="\\", parent=path_spec
+        )
+
+        volume_identifier = scanner._GetVolumeIdentifier(file_system_path_spec)
+        self.assertEqual(volume_identifier, "p2/vss1")
+
+        volume_identifier = scanner._GetVolumeIdentifier(
+            file_system_path_spec, include_snapshots=False
+        )
+        self.assertEqual(volume_identifier, "p2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Tests for the Windows path resolver with a cache of resolved path prefixes."""
+
+import os
+import unittest
+
+from unittest import mock
+
+from dfvfs.helpers import windows_path_resolver as dfvfs_windows_path_resolver
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.vfs import os_file_entry
+from dfvfs.path import factory as dfvfs_path_spec_factory
+from dfvfs.resolver import resolver as dfvfs_resolver
+
+from artifactsrc import windows_path_resolver
+
+from tests import test_lib
+
+
+class WindowsPathResolverTest(test_lib.BaseTestCase):
+    """Tests for the Windows path resolver."""
+
+    def testResolvePath(self):
+        """Tests the ResolvePath function."""
+        with test_lib.TempDirectory() as temp_directory:
+            system_directory = os.path.join(temp_directory, "Windows", "System32")
+            os.makedirs(system_directory)
+            for filename in ("kernel32.dll", "ntdll.dll"):
+                with open(
+                    os.path.join(system_directory, filename), "wb"
+                ) as file_object:
+                    file_object.write(b"MZ")
+
+            mount_point = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_OS, location=temp_directory
+            )
+            file_system = dfvfs_resolver.Resolver.OpenFileSystem(mount_point)
+
+            path_resolution_cache = windows_path_resolver.PathResolutionCache()
+            path_resolver = windows_path_resolver.WindowsPathResolver(
+                file_system, mount_point, path_resolution_cache=path_resolution_cache
+            )
+            path_resolver.SetEnvironmentVariable("SystemRoot", "C:\\Windows")
+
+            path_spec = path_resolver.ResolvePath("C:\\WINDOWS\\system32\\KERNEL32.dll")
+            self.assertIsNotNone(path_spec)
+            self.assertEqual(
+                path_spec.location, os.path.join(system_directory, "kernel32.dll")
+            )
+            self.assertEqual(path_resolution_cache.number_of_cache_hits, 0)
+            self.assertEqual(path_resolution_cache.number_of_cache_misses, 3)
+
+            path_spec = path_resolver.ResolvePath("c:\\windows\\System32\\ntdll.dll")
+            self.assertIsNotNone(path_spec)
+            self.assertEqual(
+                path_spec.location, os.path.join(system_directory, "ntdll.dll")
+            )
+            self.assertEqual(path_resolution_cache.number_of_cache_hits, 3)
+            self.assertEqual(path_resolution_cache.number_of_cache_misses, 3)
+            self.assertAlmostEqual(path_resolution_cache.GetHitRate(), 1 / 2)
+
+            path_spec = path_resolver.ResolvePath("%SystemRoot%\\System32\\ntdll.dll")
+            self.assertIsNotNone(path_spec)
+            self.assertEqual(
+                path_spec.location, os.path.join(system_directory, "ntdll.dll")
+            )
+
+            path_spec = path_resolver.ResolvePath("C:\\Windows")
+            self.assertIsNotNone(path_spec)
+            self.assertEqual(
+                path_spec.location, os.path.join(temp_directory, "Windows")
+            )
+
+            path_spec = path_resolver.ResolvePath("C:\\Windows\\System32\\bogus.dll")
+            self.assertIsNone(path_spec)
+
+            path_spec = path_resolver.ResolvePath("Windows\\System32")
+            self.assertIsNone(path_spec)
+
+    def testResolvePathFromCachedPrefix(self):
+        """Tests the ResolvePath function with a path deeper than a cached prefix."""
+        with test_lib.TempDirectory() as temp_directory:
+            system_directory = os.path.join(temp_directory, "Windows", "System32")
+            etc_directory = os.path.join(system_directory, "drivers", "etc")
+            os.makedirs(etc_directory)
+            with open(
+                os.path.join(system_directory, "kernel32.dll"), "wb"
+            ) as file_object:
+                file_object.write(b"MZ")
+            with open(os.path.join(etc_directory, "hosts"), "wb") as file_object:
+                file_object.write(b"127.0.0.1 localhost")
+
+            mount_point = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_OS, location=temp_directory
+            )
+            file_system = dfvfs_resolver.Resolver.OpenFileSystem(mount_point)
+
+            path_resolution_cache = windows_path_resolver.PathResolutionCache()
+            path_resolver = windows_path_resolver.WindowsPathResolver(
+                file_system, mount_point, path_resolution_cache=path_resolution_cache
+            )
+
+            path_spec = path_resolver.ResolvePath("C:\\Windows\\System32\\kernel32.dll")
+            self.assertIsNotNone(path_spec)
+
+            get_sub_file_entry_by_name = os_file_entry.OSFileEntry.GetSubFileEntryByName
+            with mock.patch.object(
+                os_file_entry.OSFileEntry,
+                "GetSubFileEntryByName",
+                autospec=True,
+                side_effect=get_sub_file_entry_by_name,
+            ) as mock_get_sub_file_entry_by_name:
+                with mock.patch.object(
+                    dfvfs_windows_path_resolver.WindowsPathResolver,
+                    "_ResolvePath",
+                ) as mock_resolve_path:
+                    path_spec = path_resolver.ResolvePath(
+                        "C:\\Windows\\System32\\drivers\\etc\\hosts"
+                    )
+
+                    mock_resolve_path.assert_not_called()
+
+                # Only "drivers", "etc" and "hosts" are looked up in the file
+                # system, "C:\\Windows\\System32" is resolved from the cache.
+                lookup_names = [
+                    call_arguments.args[1]
+                    for call_arguments in (
+                        mock_get_sub_file_entry_by_name.call_args_list
+                    )
+                ]
+                self.assertEqual(lookup_names, ["drivers", "etc", "hosts"])
+
+            self.assertIsNotNone(path_spec)
+            self.assertEqual(path_spec.location, os.path.join(etc_directory, "hosts"))
+            self.assertEqual(path_resolution_cache.number_of_cache_hits, 3)
+            self.assertEqual(path_resolution_cache.number_of_cache_misses, 5)
+
+            path_spec = path_resolver.ResolvePath("C:\\Windows\\System32\\drivers")
+            self.assertIsNotNone(path_spec)
+            self.assertEqual(path_resolution_cache.number_of_cache_hits, 6)
+            self.assertEqual(path_resolution_cache.number_of_cache_misses, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
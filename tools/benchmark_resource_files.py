@@ -0,0 +1,914 @@
+#!/usr/bin/env python3
+"""Script to benchmark reading Windows Message Resource files."""
+
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import struct
+import sys
+import time
+
+import pyexe
+import pywrc
+
+import artifactsrc
+
+from artifactsrc import resource_file
+
+
+class CountingFileObject(io.BytesIO):
+    """In-memory file-like object that counts the number of bytes read.
+
+    Attributes:
+      number_of_bytes_read (int): number of bytes read.
+    """
+
+    def __init__(self, data):
+        """Initializes an in-memory file-like object.
+
+        Args:
+          data (bytes): data of the file.
+        """
+        super().__init__(data)
+        self.number_of_bytes_read = 0
+
+    # pylint: disable=arguments-renamed
+
+    def read(self, size=-1):
+        """Reads data.
+
+        Args:
+          size (Optional[int]): number of bytes to read, where -1 represents
+              all remaining data.
+
+        Returns:
+          bytes: data read.
+        """
+        data = super().read(size)
+        self.number_of_bytes_read += len(data)
+        return data
+
+
+class SyntheticPEFileGenerator:
+    """Generator of synthetic PE/COFF executables with resources.
+
+    The executables contain a code section of a random size, to represent
+    executables of different sizes, and a resource section with a version
+    information resource, a message table resource in one or more languages
+    and, for some executables, a MUI resource.
+    """
+
+    _FILE_ALIGNMENT = 0x200
+
+    _LANGUAGES = {
+        0x0407: "de-DE",
+        0x0409: "en-US",
+        0x040C: "fr-FR",
+        0x0411: "ja-JP",
+        0x0413: "nl-NL",
+    }
+
+    _MAXIMUM_CODE_SECTION_SIZE = 2 * 1024 * 1024
+
+    _MAXIMUM_NUMBER_OF_MESSAGES = 256
+
+    _MESSAGE_TABLE_RESOURCE_IDENTIFIER = 0x0B
+
+    _SECTION_ALIGNMENT = 0x1000
+
+    _VERSION_INFORMATION_RESOURCE_IDENTIFIER = 0x10
+
+    def __init__(self, seed=0):
+        """Initializes a generator of synthetic PE/COFF executables.
+
+        Args:
+          seed (Optional[int]): seed of the random number generator, such that
+              the same corpus is generated every run.
+        """
+        super().__init__()
+        self._random = random.Random(seed)
+
+    def _AlignSize(self, size, alignment):
+        """Aligns a size.
+
+        Args:
+          size (int): size.
+          alignment (int): alignment.
+
+        Returns:
+          int: aligned size.
+        """
+        return ((size + alignment - 1) // alignment) * alignment
+
+    def _BuildMessageTableResource(self, messages):
+        """Builds a message table resource.
+
+        Args:
+          messages (list[str]): message strings, where the message identifiers
+              start at 1.
+
+        Returns:
+          bytes: message table resource data.
+        """
+        entries_data = []
+        for message in messages:
+            string_data = self._PadData(f"{message:s}\x00".encode("utf-16-le"))
+            entries_data.append(
+                struct.pack("<HH", len(string_data) + 4, 1) + string_data
+            )
+
+        # A single block contains the contiguous message identifiers.
+        return b"".join([struct.pack("<IIII", 1, 1, len(messages), 16)] + entries_data)
+
+    def _BuildMUIResource(self, language):
+        """Builds a MUI resource.
+
+        Args:
+          language (str): language, such as "en-US".
+
+        Returns:
+          bytes: MUI resource data.
+        """
+        language_data = f"{language:s}\x00".encode("utf-16-le")
+        padded_language_data = language_data + (b"\x00" * (-len(language_data) % 8))
+
+        header_data = bytearray(0x88)
+        struct.pack_into(
+            "<IIIII",
+            header_data,
+            0,
+            0xFECDFECD,
+            len(header_data) + len(padded_language_data),
+            0x00010000,
+            0,
+            0x11,
+        )
+        struct.pack_into("<II", header_data, 0x7C, 0x88, len(language_data))
+
+        return bytes(header_data) + padded_language_data
+
+    def _BuildResourceSection(self, resources, virtual_address):
+        """Builds a resource section.
+
+        Args:
+          resources (list[tuple[int|str, list[tuple[int, list[tuple[int, bytes]]]]]]):
+              resources as a list of resource type identifiers or names with
+              their resource identifiers with their language identifiers and
+              resource data.
+          virtual_address (int): virtual address of the resource section.
+
+        Returns:
+          bytes: resource section data.
+        """
+        # The resource directories are stored in level order, followed by the
+        # resource names, the resource data entries and the resource data.
+        directories = [[]]
+        resource_data = []
+
+        for resource_key, _ in resources:
+            directories.append([])
+            directories[0].append((resource_key, True, len(directories) - 1))
+
+        for directory_index, (_, resource_items) in enumerate(resources, start=1):
+            for item_identifier, languages in resource_items:
+                directories.append([])
+                directories[directory_index].append(
+                    (item_identifier, True, len(directories) - 1)
+                )
+
+                for language_identifier, data in languages:
+                    resource_data.append(data)
+                    directories[-1].append(
+                        (language_identifier, False, len(resource_data) - 1)
+                    )
+
+        directory_offsets = []
+        section_size = 0
+        for directory in directories:
+            directory_offsets.append(section_size)
+            section_size += 16 + (8 * len(directory))
+
+        name_offsets = {}
+        for directory in directories:
+            for name_or_identifier, _, _ in directory:
+                if (
+                    isinstance(name_or_identifier, str)
+                    and name_or_identifier not in name_offsets
+                ):
+                    name_offsets[name_or_identifier] = section_size
+                    section_size += 2 + (2 * len(name_or_identifier))
+
+        data_entries_offset = self._AlignSize(section_size, 4)
+        section_size = data_entries_offset + (16 * len(resource_data))
+
+        data_offsets = []
+        for data in resource_data:
+            section_size = self._AlignSize(section_size, 4)
+            data_offsets.append(section_size)
+            section_size += len(data)
+
+        section_data = bytearray(section_size)
+
+        for directory, directory_offset in zip(directories, directory_offsets):
+            number_of_named_entries = len(
+                [entry for entry in directory if isinstance(entry[0], str)]
+            )
+            struct.pack_into(
+                "<IIHHHH",
+                section_data,
+                directory_offset,
+                0,
+                0,
+                0,
+                0,
+                number_of_named_entries,
+                len(directory) - number_of_named_entries,
+            )
+            for entry_index, (
+                name_or_identifier,
+                is_directory,
+                target_index,
+            ) in enumerate(directory):
+                if isinstance(name_or_identifier, str):
+                    name_or_identifier = 0x80000000 | name_offsets[name_or_identifier]
+
+                if is_directory:
+                    offset = 0x80000000 | directory_offsets[target_index]
+                else:
+                    offset = data_entries_offset + (16 * target_index)
+
+                struct.pack_into(
+                    "<II",
+                    section_data,
+                    directory_offset + 16 + (8 * entry_index),
+                    name_or_identifier,
+                    offset,
+                )
+
+        for name, name_offset in name_offsets.items():
+            name_data = struct.pack("<H", len(name)) + name.encode("utf-16-le")
+            section_data[name_offset : name_offset + len(name_data)] = name_data
+
+        for data_index, (data, data_offset) in enumerate(
+            zip(resource_data, data_offsets)
+        ):
+            struct.pack_into(
+                "<IIII",
+                section_data,
+                data_entries_offset + (16 * data_index),
+                virtual_address + data_offset,
+                len(data),
+                0,
+                0,
+            )
+            section_data[data_offset : data_offset + len(data)] = data
+
+        return bytes(section_data)
+
+    def _BuildVersionInformationBlock(
+        self, key, value_data=b"", value_length=0, value_type=0, children=None
+    ):
+        """Builds a version information block.
+
+        Args:
+          key (str): key of the block, such as "StringFileInfo".
+          value_data (Optional[bytes]): value data of the block.
+          value_length (Optional[int]): length of the value, in bytes for binary
+              values or characters for string values.
+          value_type (Optional[int]): value type, where 0 represents a binary
+              value and 1 a string value.
+          children (Optional[list[bytes]]): data of the child blocks.
+
+        Returns:
+          bytes: version information block data.
+        """
+        block_data = self._PadData(
+            struct.pack("<HH", value_length, value_type)
+            + f"{key:s}\x00".encode("utf-16-le"),
+            alignment_offset=2,
+        )
+        block_data += self._PadData(value_data)
+        block_data += b"".join(children or [])
+
+        return struct.pack("<H", len(block_data) + 2) + block_data
+
+    def _BuildVersionInformationResource(self, file_version):
+        """Builds a version information resource.
+
+        Args:
+          file_version (tuple[int, int, int, int]): major and minor version, build
+              number and revision number.
+
+        Returns:
+          bytes: version information resource data.
+        """
+        major_version, minor_version, build_number, revision_number = file_version
+        version_most_significant = (major_version << 16) | minor_version
+        version_least_significant = (build_number << 16) | revision_number
+
+        fixed_file_information_data = struct.pack(
+            "<13I",
+            0xFEEF04BD,
+            0x00010000,
+            version_most_significant,
+            version_least_significant,
+            version_most_significant,
+            version_least_significant,
+            0x3F,
+            0,
+            0x00040004,
+            2,
+            0,
+            0,
+            0,
+        )
+
+        file_version_string = ".".join([f"{value:d}" for value in file_version])
+        string_value_data = f"{file_version_string:s}\x00".encode("utf-16-le")
+
+        string_file_information_data = self._BuildVersionInformationBlock(
+            "StringFileInfo",
+            value_type=1,
+            children=[
+                self._BuildVersionInformationBlock(
+                    "040904b0",
+                    value_type=1,
+                    children=[
+                        self._BuildVersionInformationBlock(
+                            "FileVersion",
+                            value_data=string_value_data,
+                            value_length=len(string_value_data) // 2,
+                            value_type=1,
+                        )
+                    ],
+                )
+            ],
+        )
+        variable_file_information_data = self._BuildVersionInformationBlock(
+            "VarFileInfo",
+            value_type=1,
+            children=[
+                self._BuildVersionInformationBlock(
+                    "Translation",
+                    value_data=struct.pack("<HH", 0x0409, 1200),
+                    value_length=4,
+                )
+            ],
+        )
+
+        return self._BuildVersionInformationBlock(
+            "VS_VERSION_INFO",
+            value_data=fixed_file_information_data,
+            value_length=len(fixed_file_information_data),
+            children=[string_file_information_data, variable_file_information_data],
+        )
+
+    def _PadData(self, data, alignment_offset=0):
+        """Pads data to a 32-bit boundary.
+
+        Args:
+          data (bytes): data.
+          alignment_offset (Optional[int]): offset of the data relative to the
+              32-bit boundary.
+
+        Returns:
+          bytes: padded data.
+        """
+        return data + (b"\x00" * (-(len(data) + alignment_offset) % 4))
+
+    def GenerateFile(self):
+        """Generates a synthetic PE/COFF executable.
+
+        Returns:
+          bytes: data of the executable.
+        """
+        file_version = (
+            self._random.choice([5, 6, 10]),
+            self._random.randint(0, 3),
+            self._random.randint(1000, 30000),
+            self._random.randint(0, 9999),
+        )
+        number_of_messages = self._random.randint(1, self._MAXIMUM_NUMBER_OF_MESSAGES)
+        language_identifiers = sorted(
+            self._random.sample(
+                list(self._LANGUAGES.keys()),
+                self._random.randint(1, len(self._LANGUAGES)),
+            )
+        )
+
+        messages = [
+            f"Synthetic message: {message_identifier:d} with parameter %1."
+            for message_identifier in range(1, number_of_messages + 1)
+        ]
+        message_table_data = self._BuildMessageTableResource(messages)
+
+        resources = []
+        if self._random.random() < 0.5:
+            language = self._LANGUAGES[language_identifiers[0]]
+            resources.append(
+                (
+                    "MUI",
+                    [
+                        (
+                            1,
+                            [
+                                (
+                                    language_identifiers[0],
+                                    self._BuildMUIResource(language),
+                                )
+                            ],
+                        )
+                    ],
+                )
+            )
+
+        resources.extend(
+            [
+                (
+                    self._MESSAGE_TABLE_RESOURCE_IDENTIFIER,
+                    [
+                        (
+                            1,
+                            [
+                                (language_identifier, message_table_data)
+                                for language_identifier in language_identifiers
+                            ],
+                        )
+                    ],
+                ),
+                (
+                    self._VERSION_INFORMATION_RESOURCE_IDENTIFIER,
+                    [
+                        (
+                            1,
+                            [
+                                (
+                                    0x0409,
+                                    self._BuildVersionInformationResource(file_version),
+                                )
+                            ],
+                        )
+                    ],
+                ),
+            ]
+        )
+
+        code_section_size = self._random.randint(
+            self._FILE_ALIGNMENT, self._MAXIMUM_CODE_SECTION_SIZE
+        )
+        code_section_data_size = self._AlignSize(
+            code_section_size, self._FILE_ALIGNMENT
+        )
+        code_section_data_offset = 0x400
+        code_section_virtual_address = self._SECTION_ALIGNMENT
+
+        resource_section_virtual_address = self._AlignSize(
+            code_section_virtual_address + code_section_size, self._SECTION_ALIGNMENT
+        )
+        resource_section = self._BuildResourceSection(
+            resources, resource_section_virtual_address
+        )
+        resource_section_data_size = self._AlignSize(
+            len(resource_section), self._FILE_ALIGNMENT
+        )
+        resource_section_data_offset = code_section_data_offset + code_section_data_size
+        image_size = self._AlignSize(
+            resource_section_virtual_address + len(resource_section),
+            self._SECTION_ALIGNMENT,
+        )
+
+        mz_header_data = bytearray(64)
+        struct.pack_into("<2s", mz_header_data, 0, b"MZ")
+        # The relocation table offset of 0x40 indicates an extended header.
+        struct.pack_into("<H", mz_header_data, 0x18, 0x40)
+        struct.pack_into("<I", mz_header_data, 60, len(mz_header_data))
+
+        coff_header_data = b"PE\x00\x00" + struct.pack(
+            "<HHIIIHH", 0x014C, 2, 0, 0, 0, 224, 0x2102
+        )
+
+        optional_header_data = bytearray(224)
+        struct.pack_into(
+            "<HBBIIIIII",
+            optional_header_data,
+            0,
+            0x010B,
+            14,
+            0,
+            code_section_data_size,
+            resource_section_data_size,
+            0,
+            0,
+            code_section_virtual_address,
+            code_section_virtual_address,
+        )
+        struct.pack_into(
+            "<IIIHHHHHHIIIIHHIIIIII",
+            optional_header_data,
+            28,
+            0x10000000,
+            self._SECTION_ALIGNMENT,
+            self._FILE_ALIGNMENT,
+            6,
+            0,
+            0,
+            0,
+            6,
+            0,
+            0,
+            image_size,
+            0x400,
+            0,
+            2,
+            0x0140,
+            0x00100000,
+            0x1000,
+            0x00100000,
+            0x1000,
+            0,
+            16,
+        )
+        struct.pack_into(
+            "<II",
+            optional_header_data,
+            112,
+            resource_section_virtual_address,
+            len(resource_section),
+        )
+
+        section_headers_data = b"".join(
+            [
+                struct.pack(
+                    "<8sIIIIIIHHI",
+                    b".text",
+                    code_section_size,
+                    code_section_virtual_address,
+                    code_section_data_size,
+                    code_section_data_offset,
+                    0,
+                    0,
+                    0,
+                    0,
+                    0x60000020,
+                ),
+                struct.pack(
+                    "<8sIIIIIIHHI",
+                    b".rsrc",
+                    len(resource_section),
+                    resource_section_virtual_address,
+                    resource_section_data_size,
+                    resource_section_data_offset,
+                    0,
+                    0,
+                    0,
+                    0,
+                    0x40000040,
+                ),
+            ]
+        )
+
+        headers_data = b"".join(
+            [
+                mz_header_data,
+                coff_header_data,
+                optional_header_data,
+                section_headers_data,
+            ]
+        )
+
+        file_data = bytearray(resource_section_data_offset + resource_section_data_size)
+        file_data[: len(headers_data)] = headers_data
+        file_data[
+            resource_section_data_offset : resource_section_data_offset
+            + len(resource_section)
+        ] = resource_section
+
+        return bytes(file_data)
+
+
+class MessageResourceFileBenchmark:
+    """Benchmark of reading Windows Message Resource files.
+
+    The time of opening a message resource file and of extracting the version
+    information, the MUI language and the messages of the message table is
+    measured per file. The files are read from memory, such that the
+    measurements do not depend on the storage the files are read from, and
+    the number of bytes read is counted.
+    """
+
+    _OPERATIONS = ("open", "version", "mui", "message_table", "close")
+
+    def __init__(self):
+        """Initializes a benchmark of reading Windows Message Resource files."""
+        super().__init__()
+        self._pool = resource_file.MessageResourceFilePool()
+
+    def _GetStatistics(self, durations, bytes_read):
+        """Determines statistics of an operation.
+
+        Args:
+          durations (list[float]): durations in seconds.
+          bytes_read (list[int]): number of bytes read.
+
+        Returns:
+          dict[str, object]: mean number of bytes read, total duration in seconds
+              and mean, median, 95th percentile and maximum duration in
+              microseconds.
+        """
+        if not durations:
+            return {}
+
+        sorted_durations = sorted(durations)
+        percentile_index = min(
+            int(len(sorted_durations) * 0.95), len(sorted_durations) - 1
+        )
+
+        return {
+            "bytes_read_mean": sum(bytes_read) // len(bytes_read),
+            "maximum_us": round(sorted_durations[-1] * 1000000, 3),
+            "mean_us": round(statistics.mean(sorted_durations) * 1000000, 3),
+            "median_us": round(statistics.median(sorted_durations) * 1000000, 3),
+            "p95_us": round(sorted_durations[percentile_index] * 1000000, 3),
+            "total_s": round(sum(sorted_durations), 6),
+        }
+
+    def _MeasureFile(self, windows_path, file_data):
+        """Measures reading a message resource file.
+
+        Args:
+          windows_path (str): Windows path of the message resource file.
+          file_data (bytes): data of the message resource file.
+
+        Returns:
+          tuple[dict[str, tuple[float, int]], int]: duration in seconds and
+              number of bytes read per operation and number of messages.
+
+        Raises:
+          IOError: if the message resource file cannot be read.
+          OSError: if the message resource file cannot be read.
+          RuntimeError: if a resource of the message resource file cannot be
+              parsed.
+          ValueError: if a resource of the message resource file cannot be
+              parsed.
+        """
+        file_object = CountingFileObject(file_data)
+        measurements = {}
+        number_of_messages = 0
+
+        message_file = None
+        try:
+            for operation in self._OPERATIONS:
+                number_of_bytes_read = file_object.number_of_bytes_read
+                start_time = time.perf_counter()
+
+                if operation == "open":
+                    message_file = self._pool.OpenFileObject(windows_path, file_object)
+
+                elif operation == "version":
+                    _ = message_file.file_version
+
+                elif operation == "mui":
+                    message_file.GetMUILanguage()
+
+                elif operation == "message_table":
+                    if message_file.HasMessageTableResource():
+                        number_of_messages = len(list(message_file.GetMessages()))
+
+                elif operation == "close":
+                    message_file.Close()
+                    message_file = None
+
+                measurements[operation] = (
+                    time.perf_counter() - start_time,
+                    file_object.number_of_bytes_read - number_of_bytes_read,
+                )
+
+        finally:
+            # Return the message resource file to the pool if an operation
+            # failed after it was opened.
+            if message_file:
+                message_file.Close()
+
+        return measurements, number_of_messages
+
+    def Run(self, corpus_name, files, iterations=1):
+        """Runs the benchmark on a corpus.
+
+        Args:
+          corpus_name (str): name of the corpus, such as "test_data".
+          files (list[tuple[str, bytes]]): name and data of the files.
+          iterations (Optional[int]): number of times every file is read.
+
+        Returns:
+          dict[str, object]: results of the benchmark.
+        """
+        bytes_read_per_operation = {operation: [] for operation in self._OPERATIONS}
+        durations_per_operation = {operation: [] for operation in self._OPERATIONS}
+        bytes_read_per_file = []
+        durations_per_file = []
+        number_of_failures = 0
+        number_of_messages = 0
+        total_file_size = 0
+
+        for _ in range(iterations):
+            for name, file_data in files:
+                windows_path = f"C:\\Windows\\System32\\{name:s}"
+                try:
+                    measurements, file_number_of_messages = self._MeasureFile(
+                        windows_path, file_data
+                    )
+                except (IOError, RuntimeError, ValueError) as exception:
+                    logging.debug(f"Unable to read: {name:s} with error: {exception!s}")
+                    number_of_failures += 1
+                    continue
+
+                for operation, (duration, bytes_read) in measurements.items():
+                    bytes_read_per_operation[operation].append(bytes_read)
+                    durations_per_operation[operation].append(duration)
+
+                bytes_read_per_file.append(
+                    sum(bytes_read for _, bytes_read in measurements.values())
+                )
+                durations_per_file.append(
+                    sum(duration for duration, _ in measurements.values())
+                )
+                number_of_messages += file_number_of_messages
+                total_file_size += len(file_data)
+
+        number_of_measured_files = len(durations_per_file)
+        total_duration = sum(durations_per_file)
+
+        return {
+            "corpus": corpus_name,
+            "file_size_mean": (
+                total_file_size // number_of_measured_files
+                if number_of_measured_files
+                else 0
+            ),
+            "files_per_second": (
+                round(number_of_measured_files / total_duration, 3)
+                if total_duration
+                else 0.0
+            ),
+            "iterations": iterations,
+            "number_of_failures": number_of_failures,
+            "number_of_files": len(files),
+            "number_of_messages": number_of_messages,
+            "operations": {
+                operation: self._GetStatistics(
+                    durations_per_operation[operation],
+                    bytes_read_per_operation[operation],
+                )
+                for operation in self._OPERATIONS
+            },
+            "total": self._GetStatistics(durations_per_file, bytes_read_per_file),
+        }
+
+
+def Main():
+    """Entry point of console script to benchmark reading resource files.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    argument_parser = argparse.ArgumentParser(
+        description=(
+            "Benchmarks reading Windows Message Resource files from the test "
+            "data and from a corpus of synthetic PE/COFF executables."
+        )
+    )
+
+    argument_parser.add_argument(
+        "--iterations",
+        dest="iterations",
+        type=int,
+        action="store",
+        metavar="NUMBER",
+        default=1,
+        help="number of times every file is read.",
+    )
+
+    argument_parser.add_argument(
+        "--output",
+        dest="output",
+        type=str,
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of the JSON file to write the results to, where the results "
+            "are written to stdout if not specified."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--seed",
+        dest="seed",
+        type=int,
+        action="store",
+        metavar="NUMBER",
+        default=0,
+        help="seed used to generate the synthetic corpus.",
+    )
+
+    argument_parser.add_argument(
+        "--synthetic_files",
+        "--synthetic-files",
+        dest="synthetic_files",
+        type=int,
+        action="store",
+        metavar="NUMBER",
+        default=2000,
+        help="number of synthetic PE/COFF executables to generate.",
+    )
+
+    argument_parser.add_argument(
+        "--test_data",
+        "--test-data",
+        dest="test_data",
+        type=str,
+        action="store",
+        metavar="PATH",
+        default=os.path.join(os.path.dirname(__file__), "..", "test_data"),
+        help="path of the directory with the test data DLL files.",
+    )
+
+    options = argument_parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="[%(levelname)s] %(message)s", stream=sys.stderr
+    )
+
+    corpora = []
+
+    test_data_files = []
+    if os.path.isdir(options.test_data):
+        for filename in sorted(os.listdir(options.test_data)):
+            if filename.lower().endswith(".dll"):
+                path = os.path.join(options.test_data, filename)
+                with open(path, "rb") as file_object:
+                    test_data_files.append((filename, file_object.read()))
+
+    if test_data_files:
+        corpora.append(("test_data", test_data_files))
+    else:
+        logging.warning(f"No test data DLL files found in: {options.test_data:s}")
+
+    if options.synthetic_files > 0:
+        logging.info(
+            f"Generating {options.synthetic_files:d} synthetic PE/COFF executables."
+        )
+        generator = SyntheticPEFileGenerator(seed=options.seed)
+        synthetic_files = [
+            (f"synthetic{file_index:05d}.dll", generator.GenerateFile())
+            for file_index in range(options.synthetic_files)
+        ]
+        corpora.append(("synthetic", synthetic_files))
+
+    results = []
+    for corpus_name, files in corpora:
+        benchmark = MessageResourceFileBenchmark()
+        result = benchmark.Run(corpus_name, files, iterations=options.iterations)
+        logging.info(
+            f"Corpus: {corpus_name:s} files per second: "
+            f"{result['files_per_second']:.1f} bytes read per file: "
+            f"{result['total'].get('bytes_read_mean', 0):d}"
+        )
+        results.append(result)
+
+    # The format version is increased when the structure of the results changes,
+    # such that results of different releases can be compared.
+    output = {
+        "environment": {
+            "artifactsrc": artifactsrc.__version__,
+            "platform": platform.platform(),
+            "pyexe": pyexe.get_version(),
+            "python": platform.python_version(),
+            "pywrc": pywrc.get_version(),
+        },
+        "format_version": 1,
+        "parameters": {
+            "iterations": options.iterations,
+            "seed": options.seed,
+            "synthetic_files": options.synthetic_files,
+        },
+        "results": results,
+    }
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as file_object:
+            json.dump(output, file_object, indent=2, sort_keys=True)
+    else:
+        json.dump(output, sys.stdout, indent=2, sort_keys=True)
+        print("")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
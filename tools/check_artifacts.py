@@ -2,11 +2,11 @@
 """Script to check artifact definitions on a storage media image."""
 
 import argparse
+import concurrent.futures.process
 import logging
 import os
 import sys
 
-from artifacts import definitions as artifacts_definitions
 from artifacts import reader as artifacts_reader
 from artifacts import registry as artifacts_registry
 
@@ -16,6 +16,13 @@ from dfvfs.helpers import command_line as dfvfs_command_line
 from dfvfs.helpers import volume_scanner as dfvfs_volume_scanner
 from dfvfs.lib import errors as dfvfs_errors
 
+from artifactsrc import batch_scanner
+from artifactsrc import definitions_filter
+from artifactsrc import definitions_history
+from artifactsrc import definitions_planner
+from artifactsrc import message_store
+from artifactsrc import resource_file_inventory
+from artifactsrc import resource_metadata_cache
 from artifactsrc import volume_scanner
 
 
@@ -52,6 +59,144 @@ def Main():
         help="preferred dfVFS back-end.",
     )
 
+    argument_parser.add_argument(
+        "--batch",
+        dest="batch",
+        type=str,
+        metavar="PATH",
+        action="store",
+        default=None,
+        help=(
+            "Path of a manifest file with the paths of multiple storage media "
+            "images, one per line, to check in a single run. Requires --output."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--cross_check_version",
+        "--cross-check-version",
+        dest="cross_check_version",
+        action="store_true",
+        default=False,
+        help=(
+            "check the Windows version read from the Windows Registry against "
+            "the version of the kernel executable file and warn if they do not "
+            "match."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--definitions",
+        "--definition",
+        dest="definitions",
+        action="store",
+        type=str,
+        default=None,
+        help=(
+            "Define artifact definitions to be checked. Multiple artifact "
+            'definitions can be defined as: "WindowsEventLogs,Browser*" (a list '
+            "of comma separated name globs). Artifact definitions referenced by "
+            "a selected artifact group are checked as well."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--dry_run",
+        "--dry-run",
+        dest="dry_run",
+        action="store_true",
+        default=False,
+        help=(
+            "print the planned order and estimated traversal cost of the "
+            "artifact definitions without checking them."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--eventlog_providers",
+        "--eventlog-providers",
+        dest="eventlog_providers",
+        action="store_true",
+        default=False,
+        help=(
+            "resolve the event message files of the Windows EventLog providers "
+            "and print them, including their file version and MUI resource file."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--exclude_definitions",
+        "--exclude-definitions",
+        dest="exclude_definitions",
+        action="store",
+        type=str,
+        default=None,
+        help=(
+            "Define artifact definitions not to be checked. Multiple artifact "
+            'definitions can be defined as: "WindowsEventLogs,Browser*" (a list '
+            "of comma separated name globs)."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--history",
+        dest="history",
+        type=str,
+        metavar="PATH",
+        action="store",
+        default=None,
+        help=(
+            "Path of a SQLite database file with the history of check results. "
+            "If provided artifact definitions that matched before, on the same "
+            "operating system version, are checked first and the check results "
+            "are added to the history."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--inventory",
+        dest="inventory",
+        type=str,
+        metavar="PATH",
+        action="store",
+        default=None,
+        help=(
+            "Path of a SQLite database file to write an inventory of the resource "
+            "files, such as DLL, EXE and SYS files, in the System32 and SysWOW64 "
+            "directories to. The inventory contains the file and product version, "
+            "the languages and if the resource file contains a message table."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--message_store",
+        "--message-store",
+        dest="message_store",
+        type=str,
+        metavar="PATH",
+        action="store",
+        default=None,
+        help=(
+            "Path of a SQLite database file to extract the message table strings, "
+            "of every language, of the resource files in the System32 and "
+            "SysWOW64 directories to. Message files with the same name and file "
+            "version are extracted only once."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--output",
+        dest="output",
+        type=str,
+        metavar="PATH",
+        action="store",
+        default=None,
+        help=(
+            "Path of the output directory, in batch mode, to write a results "
+            "file per storage media image and a summary file to."
+        ),
+    )
+
     argument_parser.add_argument(
         "--partitions",
         "--partition",
@@ -68,6 +213,38 @@ def Main():
         ),
     )
 
+    argument_parser.add_argument(
+        "--resource_metadata_cache",
+        "--resource-metadata-cache",
+        dest="resource_metadata_cache",
+        type=str,
+        metavar="PATH",
+        action="store",
+        default=None,
+        help=(
+            "Path of a SQLite database file to cache the metadata of resource "
+            "files, such as the file version, in. Resource files with identical "
+            "contents, for example on multiple storage media images, are only "
+            "parsed once."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--sidecar_cache",
+        "--sidecar-cache",
+        dest="sidecar_cache",
+        type=str,
+        metavar="PATH",
+        action="store",
+        default=None,
+        help=(
+            "Path of a directory to store a sidecar cache file per storage media "
+            "image in. Values that are expensive to determine, such as the "
+            "environment variables stored in the Windows Registry, are reused "
+            "when the same storage media image is checked again."
+        ),
+    )
+
     argument_parser.add_argument(
         "--snapshots",
         "--snapshot",
@@ -80,7 +257,9 @@ def Main():
             'defined as: "3..5". Multiple snapshots can be defined as: "1,3,5" '
             "(a list of comma separated values). Ranges and lists can also be "
             'combined as: "1,3..5". The first snapshot is 1. All snapshots can '
-            'be specified with: "all".'
+            'be specified with: "all". Artifact definitions are checked on the '
+            "current volume and every selected snapshot, where file entries "
+            "that are unchanged between snapshots are only checked once."
         ),
     )
 
@@ -100,6 +279,30 @@ def Main():
         ),
     )
 
+    argument_parser.add_argument(
+        "--triage",
+        dest="triage",
+        action="store_true",
+        default=False,
+        help=(
+            "quick triage mode, where artifact definitions that never matched "
+            "before, on the same operating system version, are skipped. "
+            "Requires --history."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--workers",
+        dest="workers",
+        type=int,
+        action="store",
+        default=None,
+        help=(
+            "number of worker processes in batch mode, by default the number of "
+            "CPUs is used."
+        ),
+    )
+
     argument_parser.add_argument(
         "-w",
         "--windows_version",
@@ -122,7 +325,7 @@ def Main():
 
     options = argument_parser.parse_args()
 
-    if not options.source:
+    if not options.source and not options.batch and not options.dry_run:
         print("Path to source storage media image is missing.")
         print("")
         argument_parser.print_help()
@@ -136,6 +339,30 @@ def Main():
         print("")
         return 1
 
+    if options.batch and not options.output:
+        print("Path to output directory is missing.")
+        print("")
+        argument_parser.print_help()
+        print("")
+        return 1
+
+    if options.batch and (
+        options.eventlog_providers or options.inventory or options.message_store
+    ):
+        print(
+            "EventLog providers, inventory and message store are not supported in "
+            "batch mode."
+        )
+        print("")
+        return 1
+
+    if options.triage and not options.history:
+        print("Path to history database file is missing.")
+        print("")
+        argument_parser.print_help()
+        print("")
+        return 1
+
     dfimagetools_helpers.SetDFVFSBackEnd(options.back_end)
 
     logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
@@ -148,11 +375,46 @@ def Main():
     elif os.path.isfile(options.artifact_definitions):
         registry.ReadFromFile(reader, options.artifact_definitions)
 
-    mediator = dfvfs_command_line.CLIVolumeScannerMediator()
-    scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(
-        registry, mediator=mediator
+    definitions = None
+    if options.definitions:
+        definitions = [name.strip() for name in options.definitions.split(",")]
+
+    exclude_definitions = None
+    if options.exclude_definitions:
+        exclude_definitions = [
+            name.strip() for name in options.exclude_definitions.split(",")
+        ]
+
+    artifact_definitions_filter = definitions_filter.ArtifactDefinitionsFilter(
+        registry, definitions=definitions, exclude_definitions=exclude_definitions
     )
 
+    planner = definitions_planner.ArtifactDefinitionsPlanner()
+    planned_definitions = [
+        planned_definition
+        for planned_definition in planner.PlanDefinitions(
+            artifact_definitions_filter.GetDefinitions()
+        )
+        if not artifact_definitions_filter.IsGroupOnly(
+            planned_definition.artifact_definition
+        )
+    ]
+
+    if options.dry_run:
+        print("Planned artifact definitions:")
+        for planned_definition in planned_definitions:
+            name = planned_definition.artifact_definition.name
+            print(
+                f"* {name:s} [estimated cost: {planned_definition.estimated_cost:d}] "
+                f"[literal segments: {planned_definition.number_of_literal_segments:d}"
+                f"/{planned_definition.number_of_segments:d}]"
+            )
+        print("")
+
+        return 0
+
+    mediator = dfvfs_command_line.CLIVolumeScannerMediator()
+
     volume_scanner_options = dfvfs_volume_scanner.VolumeScannerOptions()
     volume_scanner_options.partitions = mediator.ParseVolumeIdentifiersString(
         options.partitions
@@ -169,6 +431,81 @@ def Main():
         options.volumes
     )
 
+    if options.batch:
+        # Storage media images are processed without user interaction, hence
+        # default to all partitions and volumes and no snapshots.
+        if not volume_scanner_options.partitions:
+            volume_scanner_options.partitions = ["all"]
+        if not volume_scanner_options.snapshots:
+            volume_scanner_options.snapshots = ["none"]
+        if not volume_scanner_options.volumes:
+            volume_scanner_options.volumes = ["all"]
+
+        definition_names = [
+            planned_definition.artifact_definition.name
+            for planned_definition in planned_definitions
+        ]
+        scanner = batch_scanner.BatchScanner(
+            registry,
+            definition_names,
+            volume_scanner_options,
+            resource_metadata_cache_path=options.resource_metadata_cache,
+            sidecar_cache_path=options.sidecar_cache,
+            history_path=options.history,
+            triage=options.triage,
+            cross_check_version=options.cross_check_version,
+        )
+
+        try:
+            source_paths = scanner.ReadManifestFile(options.batch)
+            summary = scanner.ScanImages(
+                source_paths, options.output, number_of_workers=options.workers
+            )
+
+        except IOError as exception:
+            print(f"[ERROR] {exception!s}", file=sys.stderr)
+            print("")
+            return 1
+
+        # The summary, in which the images of which no results were returned
+        # are marked as failed, is written by the batch scanner.
+        except concurrent.futures.process.BrokenProcessPool as exception:
+            print(
+                f"[ERROR] worker process pool is broken: {exception!s}", file=sys.stderr
+            )
+            print("")
+            return 1
+
+        except KeyboardInterrupt:
+            print("Aborted by user.", file=sys.stderr)
+            print("")
+            return 1
+
+        print(
+            f"Checked {summary['number_of_images']:d} storage media images, "
+            f"{summary['number_of_failed_images']:d} failed."
+        )
+        print("")
+
+        return 0
+
+    resource_metadata_cache_object = None
+    if options.resource_metadata_cache:
+        resource_metadata_cache_object = resource_metadata_cache.ResourceMetadataCache()
+        resource_metadata_cache_object.Open(options.resource_metadata_cache)
+
+    scanner = volume_scanner.ArtifactDefinitionsVolumeScanner(
+        registry,
+        mediator=mediator,
+        resource_metadata_cache_object=resource_metadata_cache_object,
+        sidecar_cache_path=options.sidecar_cache,
+    )
+
+    history = None
+    if options.history:
+        history = definitions_history.ArtifactDefinitionsHistory()
+        history.Open(options.history)
+
     try:
         if not scanner.ScanForOperatingSystemVolumes(
             options.source, options=volume_scanner_options
@@ -182,24 +519,97 @@ def Main():
             print("")
             return 1
 
-        definitions_with_check_results = {}
-        for artifact_definition in registry.GetDefinitions():
-            group_only = True
-            for source in artifact_definition.sources:
-                if source.type_indicator != (
-                    artifacts_definitions.TYPE_INDICATOR_ARTIFACT_GROUP
-                ):
-                    group_only = False
-                    break
-
-            if group_only:
-                # Not interested in results of group-only artifact definitions.
-                continue
+        if options.inventory:
+            inventory = resource_file_inventory.ResourceFileInventory()
+            inventory.Open(options.inventory)
+
+            try:
+                number_of_entries = scanner.InventoryResourceFiles(inventory)
+            finally:
+                inventory.Close()
+
+            logging.info(
+                f"Added {number_of_entries:d} resource files to inventory: "
+                f"{options.inventory:s}"
+            )
+
+        if options.message_store:
+            store = message_store.MessageStore()
+            store.Open(options.message_store)
+
+            try:
+                number_of_message_files = scanner.ExtractMessageTables(store)
+            finally:
+                store.Close()
+
+            logging.info(
+                f"Added messages of {number_of_message_files:d} message files to "
+                f"message store: {options.message_store:s}"
+            )
+
+        message_files_per_provider = None
+        if options.eventlog_providers:
+            message_files_per_provider = scanner.ResolveEventLogProviders()
+
+        operating_system_version = scanner.GetWindowsVersion(
+            cross_check=options.cross_check_version
+        )
+        windows_product_name = scanner.GetWindowsProductName()
+
+        if history:
+            if not operating_system_version:
+                logging.info(
+                    "Unable to determine operating system version, history will "
+                    "not be used."
+                )
+            else:
+                planned_definitions = history.PrioritizeDefinitions(
+                    planned_definitions,
+                    operating_system_version,
+                    skip_unmatched=options.triage,
+                )
 
+        definitions_with_check_results = {}
+        number_of_file_entries = {}
+        for planned_definition in planned_definitions:
+            artifact_definition = planned_definition.artifact_definition
             check_result = scanner.CheckArtifactDefinition(artifact_definition)
-            if check_result.number_of_file_entries:
+            number_of_file_entries[artifact_definition.name] = (
+                check_result.number_of_file_entries
+                + check_result.number_of_registry_keys
+            )
+            if (
+                check_result.number_of_file_entries
+                or check_result.number_of_registry_keys
+            ):
                 definitions_with_check_results[artifact_definition.name] = check_result
 
+        if history and operating_system_version:
+            history.AddResults(operating_system_version, number_of_file_entries)
+
+        number_of_cache_hits, number_of_cache_misses, hit_rate = (
+            scanner.GetPathResolutionCacheStatistics()
+        )
+        logging.info(
+            f"Windows path resolution cache hits: {number_of_cache_hits:d}, "
+            f"misses: {number_of_cache_misses:d}, hit rate: {hit_rate:.1%}"
+        )
+
+        number_of_cache_hits, number_of_cache_misses = (
+            scanner.GetRegistryFileCacheStatistics()
+        )
+        logging.info(
+            f"Windows Registry file cache hits: {number_of_cache_hits:d}, "
+            f"misses: {number_of_cache_misses:d}"
+        )
+
+        if resource_metadata_cache_object:
+            logging.info(
+                f"Resource file metadata cache hits: "
+                f"{resource_metadata_cache_object.number_of_cache_hits:d}, misses: "
+                f"{resource_metadata_cache_object.number_of_cache_misses:d}"
+            )
+
     except dfvfs_errors.ScannerError as exception:
         print(f"[ERROR] {exception!s}", file=sys.stderr)
         print("")
@@ -210,6 +620,22 @@ def Main():
         print("")
         return 1
 
+    finally:
+        scanner.Close()
+
+        if history:
+            history.Close()
+
+        if resource_metadata_cache_object:
+            resource_metadata_cache_object.Close()
+
+    if operating_system_version:
+        text = f"Windows version: {operating_system_version:s}"
+        if windows_product_name:
+            text = f"{text:s} ({windows_product_name:s})"
+        print(text)
+        print("")
+
     print("Aritfact definitions found:")
     for name, check_result in sorted(definitions_with_check_results.items()):
         text = f"* {name:s} [results: {check_result.number_of_file_entries:d}]"
@@ -217,9 +643,41 @@ def Main():
             formats_string = ", ".join(sorted(check_result.data_formats))
             text = f"{text:s} [formats: {formats_string:s}]"
 
+        if check_result.number_of_registry_keys:
+            text = f"{text:s} [registry keys: {check_result.number_of_registry_keys:d}]"
+
+        if check_result.number_of_registry_values:
+            text = (
+                f"{text:s} [registry values: "
+                f"{check_result.number_of_registry_values:d}]"
+            )
+
+        if len(check_result.number_of_file_entries_per_volume) > 1:
+            volumes_string = ", ".join(
+                sorted(check_result.number_of_file_entries_per_volume.keys())
+            )
+            text = f"{text:s} [volumes: {volumes_string:s}]"
+
         print(text)
     print("")
 
+    if message_files_per_provider is not None:
+        print("EventLog providers:")
+        for name, message_files in sorted(message_files_per_provider.items()):
+            print(f"* {name:s}")
+            for message_file in message_files:
+                text = f"  * {message_file.windows_path:s}"
+                if not message_file.metadata:
+                    text = f"{text:s} [not found]"
+                elif message_file.metadata.file_version:
+                    text = f"{text:s} [version: {message_file.metadata.file_version:s}]"
+
+                if message_file.mui_windows_path:
+                    text = f"{text:s} [MUI: {message_file.mui_windows_path:s}]"
+
+                print(text)
+        print("")
+
     return 0
 
 